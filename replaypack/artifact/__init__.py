@@ -16,11 +16,16 @@ from replaypack.artifact.exceptions import (
     ArtifactValidationError,
 )
 from replaypack.artifact.io import (
+    append_artifact_steps,
+    artifact_journal_paths,
     build_artifact_envelope,
     compute_artifact_checksum,
     read_artifact,
     read_artifact_envelope,
+    read_artifact_journal,
+    remove_artifact_journal,
     write_artifact,
+    write_artifact_journal_header,
 )
 from replaypack.artifact.migration import (
     ArtifactMigrationResult,
@@ -74,6 +79,11 @@ __all__ = [
     "write_artifact",
     "read_artifact",
     "read_artifact_envelope",
+    "artifact_journal_paths",
+    "write_artifact_journal_header",
+    "append_artifact_steps",
+    "read_artifact_journal",
+    "remove_artifact_journal",
     "LEGACY_SOURCE_VERSION",
     "SUPPORTED_SOURCE_VERSIONS",
     "ArtifactMigrationResult",
@@ -14,7 +14,7 @@ from replaypack.artifact.schema import ArtifactValidationError
 from replaypack.artifact.schema import DEFAULT_ARTIFACT_VERSION, validate_artifact
 from replaypack.artifact.signing import sign_artifact_envelope
 from replaypack.core.canonical import canonical_json, canonicalize
-from replaypack.core.models import Run
+from replaypack.core.models import Run, Step
 
 _SENSITIVE_ENVIRONMENT_KEYS = frozenset(
     {
@@ -121,28 +121,119 @@ def write_artifact(
     serialized = json.dumps(
         canonical_artifact, indent=2, ensure_ascii=True, sort_keys=True
     ) + "\n"
+    _atomic_write_bytes(target, serialized.encode("ascii"))
+    return artifact
 
-    temp_file_path: str | None = None
+
+def artifact_journal_paths(path: str | Path) -> tuple[Path, Path]:
+    """Return `(header_path, steps_path)` sidecars for an append-only journal."""
+    target = Path(path)
+    return (
+        target.with_name(f"{target.name}.header.json"),
+        target.with_name(f"{target.name}.steps.jsonl"),
+    )
+
+
+def write_artifact_journal_header(
+    run: Run,
+    path: str | Path,
+    *,
+    metadata: dict[str, Any] | None = None,
+) -> None:
+    """Start a fresh journal for `run`, truncating any previously journaled steps."""
+    header_path, steps_path = artifact_journal_paths(path)
+    header_path.parent.mkdir(parents=True, exist_ok=True)
+    run_payload = Run(
+        id=run.id,
+        timestamp=run.timestamp,
+        environment_fingerprint=_safe_environment_fingerprint(run.environment_fingerprint),
+        runtime_versions=dict(run.runtime_versions),
+        source=run.source,
+        provider=run.provider,
+        agent=run.agent,
+        capture_mode=run.capture_mode,
+        listener_session_id=run.listener_session_id,
+        listener_process=run.listener_process,
+        listener_bind=run.listener_bind,
+        steps=[],
+    ).to_dict()
+    header = {
+        "metadata": {
+            "run_id": run.id,
+            "created_at": run.timestamp,
+            **(metadata or {}),
+        },
+        "run": run_payload,
+    }
+    serialized = json.dumps(
+        canonicalize(header), indent=2, ensure_ascii=True, sort_keys=True
+    ) + "\n"
+    _atomic_write_bytes(header_path, serialized.encode("ascii"))
+    steps_path.write_text("", encoding="utf-8")
+
+
+def append_artifact_steps(path: str | Path, steps: list[Step], *, sync: bool = True) -> int:
+    """Append hashed steps to the journal as one canonical JSON line each.
+
+    Only the new records are written, so persisting a growing run costs
+    O(new steps) instead of re-encoding the whole envelope. With
+    `sync=False` the lines are flushed to the OS but not fsynced, letting
+    callers batch durability across several appends.
+    """
+    if not steps:
+        return 0
+    _, steps_path = artifact_journal_paths(path)
+    lines = [
+        canonical_json(step.with_hash().to_dict()) + "\n"
+        for step in steps
+    ]
+    with steps_path.open("a", encoding="utf-8") as steps_file:
+        steps_file.writelines(lines)
+        steps_file.flush()
+        if sync:
+            os.fsync(steps_file.fileno())
+    return len(lines)
+
+
+def read_artifact_journal(path: str | Path) -> Run:
+    """Rebuild a run from a journal header and its appended step lines.
+
+    A torn trailing line (e.g. after an abrupt termination) is ignored.
+    """
+    header_path, steps_path = artifact_journal_paths(path)
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=target.parent,
-            prefix=f".{target.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as temp_file:
-            temp_file.write(serialized)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-            temp_file_path = temp_file.name
-        os.replace(temp_file_path, target)
-    finally:
-        if temp_file_path:
-            temp_path = Path(temp_file_path)
-            if temp_path.exists():
-                temp_path.unlink()
-    return artifact
+        header = json.loads(header_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ArtifactValidationError(
+            f"Artifact journal header is unreadable: {header_path} ({error})"
+        ) from error
+    if not isinstance(header, dict) or not isinstance(header.get("run"), dict):
+        raise ArtifactValidationError(
+            f"Artifact journal header is missing run payload: {header_path}"
+        )
+
+    run = Run.from_dict(header["run"])
+    try:
+        raw_lines = steps_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        raw_lines = []
+    for line in raw_lines:
+        if not line.strip():
+            continue
+        try:
+            raw_step = json.loads(line)
+        except json.JSONDecodeError:
+            break
+        run.steps.append(Step.from_dict(raw_step))
+    return run
+
+
+def remove_artifact_journal(path: str | Path) -> None:
+    for journal_path in artifact_journal_paths(path):
+        try:
+            journal_path.unlink()
+        except FileNotFoundError:
+            continue
 
 
 def read_artifact_envelope(path: str | Path) -> dict[str, Any]:
@@ -183,8 +274,31 @@ def read_artifact_envelope(path: str | Path) -> dict[str, Any]:
 
 
 def read_artifact(path: str | Path) -> Run:
+    """Read a run, recovering listener steps still pending in its journal.
+
+    A listener that stops without compacting (killed, crashed) leaves the
+    `.rpk` at its segment start with the recorded steps only in the journal
+    sidecars. Only artifacts whose metadata marks them as listener captures
+    are recovered; any other artifact is returned exactly as checksummed.
+    """
     artifact = read_artifact_envelope(path)
-    return Run.from_dict(artifact["payload"]["run"])
+    run = Run.from_dict(artifact["payload"]["run"])
+    if not _is_listener_capture(artifact["metadata"]):
+        return run
+    _, steps_path = artifact_journal_paths(path)
+    if not steps_path.exists():
+        return run
+    try:
+        journaled = read_artifact_journal(path)
+    except ArtifactValidationError:
+        return run
+    if journaled.id == run.id and len(journaled.steps) > len(run.steps):
+        run.steps = journaled.steps
+    return run
+
+
+def _is_listener_capture(metadata: dict[str, Any]) -> bool:
+    return str(metadata.get("mode", "")).startswith("listener.")
 
 
 def _safe_environment_fingerprint(environment: dict[str, Any]) -> dict[str, Any]:
@@ -195,3 +309,30 @@ def _safe_environment_fingerprint(environment: dict[str, Any]) -> dict[str, Any]
             continue
         safe[str(key)] = value
     return safe
+
+
+def _atomic_write_bytes(target: Path, data: bytes) -> None:
+    """Write `data` to a sibling temp file, fsync it, and rename over `target`."""
+    # ensure_ascii output is pre-encoded by callers, so the binary handle makes
+    # one write without a text-encoding layer in between.
+    temp_file_path: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            dir=target.parent,
+            prefix=f".{target.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_file_path = temp_file.name
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_file_path, target)
+        temp_file_path = None
+    finally:
+        if temp_file_path:
+            try:
+                os.unlink(temp_file_path)
+            except FileNotFoundError:
+                pass
@@ -9,7 +9,7 @@ from datetime import datetime, timezone
 import os
 import platform
 import threading
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 
 from replaypack.capture.policy import InterceptionPolicy
 from replaypack.capture.redaction import DEFAULT_REDACTION_POLICY, RedactionPolicy, redact_payload
@@ -78,25 +78,64 @@ class CaptureContext:
         metadata: dict[str, Any] | None = None,
     ) -> Step:
         with self._lock:
-            self._counter += 1
-            step = Step(
-                id=f"step-{self._counter:06d}",
-                type=step_type,
-                input=redact_payload(input_payload, policy=self.redaction_policy),
-                output=redact_payload(output_payload, policy=self.redaction_policy),
-                metadata=redact_payload(metadata or {}, policy=self.redaction_policy),
-            ).with_hash()
-            self.steps.append(step)
-            self.plugin_manager.on_capture_step(
-                CaptureStepEvent(
-                    run_id=self.run_id,
-                    step_id=step.id,
-                    step_type=step.type,
-                    metadata=dict(step.metadata),
-                )
+            step = self._append_step_locked(
+                step_type,
+                input_payload=input_payload,
+                output_payload=output_payload,
+                metadata=metadata,
             )
+            self.plugin_manager.on_capture_step(self._step_event(step))
             return step
 
+    def record_steps(self, step_specs: Iterable[dict[str, Any]]) -> list[Step]:
+        """Record several steps, then fan their plugin events out as one batch.
+
+        Each spec holds ``step_type``, ``input_payload``, ``output_payload`` and
+        optional ``metadata``, matching the ``record_step`` arguments.
+        """
+        with self._lock:
+            steps = [
+                self._append_step_locked(
+                    spec["step_type"],
+                    input_payload=spec["input_payload"],
+                    output_payload=spec["output_payload"],
+                    metadata=spec.get("metadata"),
+                )
+                for spec in step_specs
+            ]
+            if steps:
+                self.plugin_manager.on_capture_steps(
+                    [self._step_event(step) for step in steps]
+                )
+            return steps
+
+    def _append_step_locked(
+        self,
+        step_type: str,
+        *,
+        input_payload: Any,
+        output_payload: Any,
+        metadata: dict[str, Any] | None,
+    ) -> Step:
+        self._counter += 1
+        step = Step(
+            id=f"step-{self._counter:06d}",
+            type=step_type,
+            input=redact_payload(input_payload, policy=self.redaction_policy),
+            output=redact_payload(output_payload, policy=self.redaction_policy),
+            metadata=redact_payload(metadata or {}, policy=self.redaction_policy),
+        ).with_hash()
+        self.steps.append(step)
+        return step
+
+    def _step_event(self, step: Step) -> CaptureStepEvent:
+        return CaptureStepEvent(
+            run_id=self.run_id,
+            step_id=step.id,
+            step_type=step.type,
+            metadata=dict(step.metadata),
+        )
+
     def to_run(self) -> Run:
         with self._lock:
             return Run(
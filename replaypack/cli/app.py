@@ -4,9 +4,6 @@ import os
 from pathlib import Path
 import runpy
 import shutil
-import signal
-import socket
-import subprocess
 import sys
 import time
 import traceback
@@ -14,8 +11,6 @@ import webbrowser
 from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Any
-from urllib import error as urllib_error
-from urllib import request as urllib_request
 
 import typer
 
@@ -79,6 +74,14 @@ from replaypack.llm_capture import (
     build_google_llm_run,
     build_openai_llm_run,
 )
+from replaypack.listener_control import (
+    DEFAULT_LISTENER_OUT_PATH,
+    coerce_listener_pid,
+    listener_status,
+    load_running_listener_state,
+    start_listener,
+    stop_listener,
+)
 from replaypack.listener_state import (
     default_listener_state_path,
     default_transparent_state_path,
@@ -322,58 +325,6 @@ def _run_record_target(invocation: _RecordTargetInvocation) -> int:
         sys.argv = previous_argv
 
 
-def _coerce_pid(value: Any) -> int:
-    try:
-        pid = int(value)
-    except (TypeError, ValueError):
-        return 0
-    return pid if pid > 0 else 0
-
-
-def _listener_health(host: str, port: int, *, timeout: float = 0.5) -> dict[str, Any] | None:
-    url = f"http://{host}:{port}/health"
-    request = urllib_request.Request(url, method="GET")
-    # Listener probes must bypass proxy configuration so localhost health checks
-    # remain reliable on CI runners with proxy env vars set.
-    opener = urllib_request.build_opener(urllib_request.ProxyHandler({}))
-    try:
-        with opener.open(request, timeout=timeout) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-            if isinstance(payload, dict):
-                return payload
-    except (
-        urllib_error.URLError,
-        urllib_error.HTTPError,
-        TimeoutError,
-        OSError,
-        json.JSONDecodeError,
-    ):
-        return None
-    return None
-
-
-def _load_running_listener_state(state_file: Path) -> tuple[dict[str, Any] | None, bool]:
-    raw_state = load_listener_state(state_file)
-    if raw_state is None:
-        return None, False
-    pid = _coerce_pid(raw_state.get("pid"))
-    if pid and is_pid_running(pid):
-        return raw_state, False
-    remove_listener_state(state_file)
-    return None, True
-
-
-def _check_port_available(host: str, port: int) -> tuple[bool, str | None]:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        sock.bind((host, port))
-    except OSError as error:
-        return False, str(error)
-    finally:
-        sock.close()
-    return True, None
-
-
 @listen_app.command("start")
 def listen_start(
     host: str = typer.Option(
@@ -392,7 +343,7 @@ def listen_start(
         help="Path to listener state file.",
     ),
     out: Path = typer.Option(
-        Path("runs/listener/listener-capture.rpk"),
+        DEFAULT_LISTENER_OUT_PATH,
         "--out",
         help="Artifact path for listener-captured provider/agent traffic.",
     ),
@@ -467,212 +418,26 @@ def listen_start(
     ),
 ) -> None:
     """Start passive listener daemon."""
-    state_path = Path(state_file)
-    running_state, stale_cleanup = _load_running_listener_state(state_path)
-    if running_state is not None:
-        message = "listener start failed: listener is already running."
-        payload = {
-            "status": "error",
-            "exit_code": 2,
-            "message": message,
-            "artifact_path": None,
-            "state_file": str(state_path),
-            "listener_session_id": running_state.get("listener_session_id"),
-            "pid": _coerce_pid(running_state.get("pid")),
-            "host": running_state.get("host"),
-            "port": running_state.get("port"),
-            "artifact_out": running_state.get("artifact_path"),
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(message, err=True)
-        raise typer.Exit(code=2)
-
-    if not (0 <= port <= 65535):
-        message = "listener start failed: --port must be between 0 and 65535."
-        payload = {
-            "status": "error",
-            "exit_code": 2,
-            "message": message,
-            "artifact_path": None,
-            "state_file": str(state_path),
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(message, err=True)
-        raise typer.Exit(code=2)
-
-    if port != 0:
-        available, error_message = _check_port_available(host, port)
-        if not available:
-            message = (
-                "listener start failed: requested port is unavailable: "
-                f"{error_message or 'bind failed'}"
-            )
-            payload = {
-                "status": "error",
-                "exit_code": 2,
-                "message": message,
-                "artifact_path": None,
-                "state_file": str(state_path),
-                "host": host,
-                "port": port,
-            }
-            if json_output:
-                _echo_json(payload)
-            else:
-                _echo(message, err=True)
-            raise typer.Exit(code=2)
-
-    resolved_fallback_policy = "synthetic_allowed" if allow_synthetic else "live_only"
-    if fallback_policy is not None:
-        normalized_policy = fallback_policy.strip().lower()
-        if normalized_policy not in {"synthetic_allowed", "best_effort", "live_only"}:
-            message = (
-                "listener start failed: unsupported --fallback-policy "
-                f"'{fallback_policy}'. Expected synthetic_allowed, best_effort, or live_only."
-            )
-            payload = {
-                "status": "error",
-                "exit_code": 2,
-                "message": message,
-                "artifact_path": None,
-                "state_file": str(state_path),
-            }
-            if json_output:
-                _echo_json(payload)
-            else:
-                _echo(message, err=True)
-            raise typer.Exit(code=2)
-        resolved_fallback_policy = normalized_policy
-
-    session_id = f"listener-{int(time.time() * 1000)}"
-    command = [
-        sys.executable,
-        "-m",
-        "replaypack.listener_daemon",
-        "--state-file",
-        str(state_path),
-        "--host",
-        host,
-        "--port",
-        str(port),
-        "--session-id",
-        session_id,
-        "--out",
-        str(out),
-        "--payload-string-limit",
-        str(0 if full_payload_capture else payload_string_limit),
-        "--fallback-policy",
-        resolved_fallback_policy,
-    ]
-    if upstream_timeout_seconds is not None:
-        command.extend(["--upstream-timeout-seconds", str(upstream_timeout_seconds)])
-    if upstream_retries is not None:
-        command.extend(["--upstream-retries", str(upstream_retries)])
-    if upstream_retry_backoff_seconds is not None:
-        command.extend(
-            ["--upstream-retry-backoff-seconds", str(upstream_retry_backoff_seconds)]
-        )
-    if rotation_max_steps is not None:
-        command.extend(["--rotation-max-steps", str(rotation_max_steps)])
-    if retention_max_artifacts is not None:
-        command.extend(["--retention-max-artifacts", str(retention_max_artifacts)])
-
-    process = subprocess.Popen(
-        command,
-        stdin=subprocess.DEVNULL,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        close_fds=True,
-        start_new_session=True,
+    code, payload = start_listener(
+        state_file,
+        out=out,
+        host=host,
+        port=port,
+        startup_timeout_seconds=startup_timeout_seconds,
+        fallback_policy=fallback_policy,
+        allow_synthetic=allow_synthetic,
+        upstream_timeout_seconds=upstream_timeout_seconds,
+        upstream_retries=upstream_retries,
+        upstream_retry_backoff_seconds=upstream_retry_backoff_seconds,
+        payload_string_limit=payload_string_limit,
+        full_payload_capture=full_payload_capture,
+        rotation_max_steps=rotation_max_steps,
+        retention_max_artifacts=retention_max_artifacts,
     )
-
-    deadline = time.time() + max(0.1, startup_timeout_seconds)
-    started_state: dict[str, Any] | None = None
-    listener_ready = False
-
-    while time.time() < deadline:
-        started_state = load_listener_state(state_path)
-        if isinstance(started_state, dict):
-            started_port = int(started_state.get("port", 0) or 0)
-            started_pid = _coerce_pid(started_state.get("pid"))
-            if (
-                started_state.get("listener_session_id") == session_id
-                and started_port > 0
-                and started_pid > 0
-                and is_pid_running(started_pid)
-            ):
-                listener_ready = True
-                break
-        if process.poll() is not None:
-            break
-        time.sleep(0.05)
-
-    if process.poll() is not None:
-        message = "listener start failed: daemon terminated during startup."
-        payload = {
-            "status": "error",
-            "exit_code": 1,
-            "message": message,
-            "artifact_path": None,
-            "state_file": str(state_path),
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(message, err=True)
-        raise typer.Exit(code=1)
-
-    if not listener_ready:
-        if process.poll() is None:
-            try:
-                process.terminate()
-            except OSError:
-                pass
-        message = "listener start failed: startup timed out."
-        payload = {
-            "status": "error",
-            "exit_code": 1,
-            "message": message,
-            "artifact_path": None,
-            "state_file": str(state_path),
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(message, err=True)
-        raise typer.Exit(code=1)
-
-    payload = {
-        "status": "ok",
-        "exit_code": 0,
-        "message": "listener started",
-        "artifact_path": None,
-        "state_file": str(state_path),
-        "listener_session_id": started_state.get("listener_session_id"),
-        "pid": _coerce_pid(started_state.get("pid")),
-        "host": started_state.get("host"),
-        "port": started_state.get("port"),
-        "artifact_out": started_state.get("artifact_path"),
-        "allow_synthetic": bool(started_state.get("allow_synthetic", True)),
-        "synthetic_policy": str(started_state.get("synthetic_policy", "allow")),
-        "fallback_policy": str(started_state.get("fallback_policy", "synthetic_allowed")),
-        "upstream_timeout_seconds": float(started_state.get("upstream_timeout_seconds", 5.0)),
-        "upstream_retries": int(started_state.get("upstream_retries", 0)),
-        "upstream_retry_backoff_seconds": float(
-            started_state.get("upstream_retry_backoff_seconds", 0.25)
-        ),
-        "payload_string_limit": int(started_state.get("payload_string_limit", 4096)),
-        "full_payload_capture": bool(started_state.get("full_payload_capture", False)),
-        "rotation_max_steps": int(started_state.get("rotation_max_steps", 0)),
-        "retention_max_artifacts": int(started_state.get("retention_max_artifacts", 0)),
-        "stale_cleanup": stale_cleanup,
-    }
     if json_output:
         _echo_json(payload)
+    elif code != 0:
+        _echo(payload["message"], err=True)
     else:
         _echo(
             "listener started: "
@@ -680,6 +445,8 @@ def listen_start(
             f"host={payload['host']} port={payload['port']} "
             f"out={payload['artifact_out']}"
         )
+    if code != 0:
+        raise typer.Exit(code=code)
 
 
 @listen_app.command("stop")
@@ -701,112 +468,16 @@ def listen_stop(
     ),
 ) -> None:
     """Stop passive listener daemon."""
-    state_path = Path(state_file)
-    raw_state = load_listener_state(state_path)
-    if raw_state is None:
-        payload = {
-            "status": "ok",
-            "exit_code": 0,
-            "message": "listener already stopped",
-            "artifact_path": None,
-            "state_file": str(state_path),
-            "stale_cleanup": False,
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(payload["message"])
-        return
-
-    pid = _coerce_pid(raw_state.get("pid"))
-    host = str(raw_state.get("host", "127.0.0.1"))
-    port = int(raw_state.get("port", 0) or 0)
-    session_id = raw_state.get("listener_session_id")
-
-    if pid <= 0 or not is_pid_running(pid):
-        remove_listener_state(state_path)
-        payload = {
-            "status": "ok",
-            "exit_code": 0,
-            "message": "listener already stopped (stale state cleaned)",
-            "artifact_path": None,
-            "state_file": str(state_path),
-            "listener_session_id": session_id,
-            "stale_cleanup": True,
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(payload["message"])
-        return
-
-    request = urllib_request.Request(
-        f"http://{host}:{port}/shutdown",
-        method="POST",
+    code, payload = stop_listener(
+        state_file,
+        shutdown_timeout_seconds=shutdown_timeout_seconds,
     )
-    opener = urllib_request.build_opener(urllib_request.ProxyHandler({}))
-    try:
-        with opener.open(request, timeout=1.0):
-            pass
-    except (urllib_error.URLError, urllib_error.HTTPError, TimeoutError, OSError):
-        if os.name != "nt" and pid != os.getpid():
-            try:
-                os.kill(pid, signal.SIGTERM)
-            except OSError:
-                pass
-
-    deadline = time.time() + max(0.1, shutdown_timeout_seconds)
-    while time.time() < deadline:
-        if not is_pid_running(pid):
-            break
-        time.sleep(0.05)
-
-    if is_pid_running(pid):
-        # If graceful shutdown is stuck, escalate once to avoid flaky lingering
-        # daemon processes during short-lived test sessions.
-        if os.name != "nt" and pid != os.getpid():
-            try:
-                os.kill(pid, signal.SIGKILL)
-            except OSError:
-                pass
-            kill_deadline = time.time() + 1.0
-            while time.time() < kill_deadline:
-                if not is_pid_running(pid):
-                    break
-                time.sleep(0.05)
-
-    if is_pid_running(pid):
-        message = "listener stop failed: timeout waiting for daemon exit."
-        payload = {
-            "status": "error",
-            "exit_code": 1,
-            "message": message,
-            "artifact_path": None,
-            "state_file": str(state_path),
-            "listener_session_id": session_id,
-            "pid": pid,
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(message, err=True)
-        raise typer.Exit(code=1)
-
-    remove_listener_state(state_path)
-    payload = {
-        "status": "ok",
-        "exit_code": 0,
-        "message": "listener stopped",
-        "artifact_path": None,
-        "state_file": str(state_path),
-        "listener_session_id": session_id,
-        "pid": pid,
-        "stale_cleanup": False,
-    }
     if json_output:
         _echo_json(payload)
     else:
-        _echo(payload["message"])
+        _echo(payload["message"], err=code != 0)
+    if code != 0:
+        raise typer.Exit(code=code)
 
 
 @listen_app.command("status")
@@ -823,65 +494,16 @@ def listen_status(
     ),
 ) -> None:
     """Inspect passive listener daemon status."""
-    state_path = Path(state_file)
-    running_state, stale_cleanup = _load_running_listener_state(state_path)
-
-    if running_state is None:
-        payload = {
-            "status": "ok",
-            "exit_code": 0,
-            "message": "listener is stopped",
-            "artifact_path": None,
-            "running": False,
-            "state_file": str(state_path),
-            "stale_cleanup": stale_cleanup,
-        }
-        if json_output:
-            _echo_json(payload)
-        else:
-            _echo(payload["message"])
-        return
-
-    host = str(running_state.get("host", "127.0.0.1"))
-    port = int(running_state.get("port", 0) or 0)
-    pid = _coerce_pid(running_state.get("pid"))
-    health = _listener_health(host, port)
-    healthy = health is not None or (pid > 0 and is_pid_running(pid))
-    payload = {
-        "status": "ok",
-        "exit_code": 0,
-        "message": "listener is running",
-        "artifact_path": None,
-        "running": True,
-        "state_file": str(state_path),
-        "listener_session_id": running_state.get("listener_session_id"),
-        "pid": pid,
-        "host": host,
-        "port": port,
-        "artifact_out": running_state.get("artifact_path"),
-        "allow_synthetic": bool(running_state.get("allow_synthetic", True)),
-        "synthetic_policy": str(running_state.get("synthetic_policy", "allow")),
-        "fallback_policy": str(running_state.get("fallback_policy", "synthetic_allowed")),
-        "upstream_timeout_seconds": float(running_state.get("upstream_timeout_seconds", 5.0)),
-        "upstream_retries": int(running_state.get("upstream_retries", 0)),
-        "upstream_retry_backoff_seconds": float(
-            running_state.get("upstream_retry_backoff_seconds", 0.25)
-        ),
-        "payload_string_limit": int(running_state.get("payload_string_limit", 4096)),
-        "full_payload_capture": bool(running_state.get("full_payload_capture", False)),
-        "rotation_max_steps": int(running_state.get("rotation_max_steps", 0)),
-        "retention_max_artifacts": int(running_state.get("retention_max_artifacts", 0)),
-        "healthy": healthy,
-        "health": health,
-        "stale_cleanup": stale_cleanup,
-    }
+    _code, payload = listener_status(state_file)
     if json_output:
         _echo_json(payload)
+    elif not payload["running"]:
+        _echo(payload["message"])
     else:
         _echo(
             "listener is running: "
             f"session={payload['listener_session_id']} pid={payload['pid']} "
-            f"host={host} port={port}"
+            f"host={payload['host']} port={payload['port']}"
         )
 
 
@@ -919,7 +541,7 @@ def listen_env(
 ) -> None:
     """Print shell exports for routing provider/agent traffic to listener."""
     state_path = Path(state_file)
-    running_state, stale_cleanup = _load_running_listener_state(state_path)
+    running_state, stale_cleanup = load_running_listener_state(state_path)
     if running_state is None:
         message = "listen env failed: listener is not running."
         payload = {
@@ -1125,7 +747,7 @@ def _transparent_listener_port() -> int:
 def _transparent_is_stale_running_state(raw_state: dict[str, Any]) -> bool:
     raw_mode = str(raw_state.get("mode", "")).strip().lower()
     raw_status = str(raw_state.get("status", "")).strip().lower()
-    pid = _coerce_pid(raw_state.get("pid"))
+    pid = coerce_listener_pid(raw_state.get("pid"))
     return raw_mode == "transparent" and raw_status == "running" and pid > 0 and not is_pid_running(pid)
 
 
@@ -0,0 +1,441 @@
+"""In-process lifecycle control for the passive listener daemon.
+
+`replaypack listen start|stop|status` and the local UI server both drive the
+daemon through these functions. Each returns `(exit_code, payload)`, where the
+payload is the same JSON object the CLI prints with `--json`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+
+from replaypack.listener_state import (
+    is_pid_running,
+    load_listener_state,
+    register_child_pid,
+    remove_listener_state,
+)
+
+DEFAULT_LISTENER_OUT_PATH = Path("runs/listener/listener-capture.rpk")
+
+
+def coerce_listener_pid(value: Any) -> int:
+    try:
+        pid = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return pid if pid > 0 else 0
+
+
+def _listener_health(host: str, port: int, *, timeout: float = 0.5) -> dict[str, Any] | None:
+    url = f"http://{host}:{port}/health"
+    request = urllib_request.Request(url, method="GET")
+    # Listener probes must bypass proxy configuration so localhost health checks
+    # remain reliable on CI runners with proxy env vars set.
+    opener = urllib_request.build_opener(urllib_request.ProxyHandler({}))
+    try:
+        with opener.open(request, timeout=timeout) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+            if isinstance(payload, dict):
+                return payload
+    except (
+        urllib_error.URLError,
+        urllib_error.HTTPError,
+        TimeoutError,
+        OSError,
+        json.JSONDecodeError,
+    ):
+        return None
+    return None
+
+
+def load_running_listener_state(state_file: Path) -> tuple[dict[str, Any] | None, bool]:
+    raw_state = load_listener_state(state_file)
+    if raw_state is None:
+        return None, False
+    pid = coerce_listener_pid(raw_state.get("pid"))
+    if pid and is_pid_running(pid):
+        return raw_state, False
+    remove_listener_state(state_file)
+    return None, True
+
+
+def _check_port_available(host: str, port: int) -> tuple[bool, str | None]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.bind((host, port))
+    except OSError as error:
+        return False, str(error)
+    finally:
+        sock.close()
+    return True, None
+
+
+def start_listener(
+    state_file: str | Path,
+    *,
+    out: str | Path = DEFAULT_LISTENER_OUT_PATH,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    startup_timeout_seconds: float = 15.0,
+    fallback_policy: str | None = None,
+    allow_synthetic: bool = True,
+    upstream_timeout_seconds: float | None = None,
+    upstream_retries: int | None = None,
+    upstream_retry_backoff_seconds: float | None = None,
+    payload_string_limit: int = 4096,
+    full_payload_capture: bool = False,
+    rotation_max_steps: int | None = None,
+    retention_max_artifacts: int | None = None,
+    cwd: str | Path | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Spawn the listener daemon and wait until it reports ready.
+
+    `cwd` sets the daemon's working directory (default: the caller's), which
+    relative paths passed to it resolve against.
+    """
+    state_path = Path(state_file)
+    running_state, stale_cleanup = load_running_listener_state(state_path)
+    if running_state is not None:
+        message = "listener start failed: listener is already running."
+        payload = {
+            "status": "error",
+            "exit_code": 2,
+            "message": message,
+            "artifact_path": None,
+            "state_file": str(state_path),
+            "listener_session_id": running_state.get("listener_session_id"),
+            "pid": coerce_listener_pid(running_state.get("pid")),
+            "host": running_state.get("host"),
+            "port": running_state.get("port"),
+            "artifact_out": running_state.get("artifact_path"),
+        }
+        return 2, payload
+
+    if not (0 <= port <= 65535):
+        message = "listener start failed: --port must be between 0 and 65535."
+        payload = {
+            "status": "error",
+            "exit_code": 2,
+            "message": message,
+            "artifact_path": None,
+            "state_file": str(state_path),
+        }
+        return 2, payload
+
+    if port != 0:
+        available, error_message = _check_port_available(host, port)
+        if not available:
+            message = (
+                "listener start failed: requested port is unavailable: "
+                f"{error_message or 'bind failed'}"
+            )
+            payload = {
+                "status": "error",
+                "exit_code": 2,
+                "message": message,
+                "artifact_path": None,
+                "state_file": str(state_path),
+                "host": host,
+                "port": port,
+            }
+            return 2, payload
+
+    resolved_fallback_policy = "synthetic_allowed" if allow_synthetic else "live_only"
+    if fallback_policy is not None:
+        normalized_policy = fallback_policy.strip().lower()
+        if normalized_policy not in {"synthetic_allowed", "best_effort", "live_only"}:
+            message = (
+                "listener start failed: unsupported --fallback-policy "
+                f"'{fallback_policy}'. Expected synthetic_allowed, best_effort, or live_only."
+            )
+            payload = {
+                "status": "error",
+                "exit_code": 2,
+                "message": message,
+                "artifact_path": None,
+                "state_file": str(state_path),
+            }
+            return 2, payload
+        resolved_fallback_policy = normalized_policy
+
+    session_id = f"listener-{int(time.time() * 1000)}"
+    command = [
+        sys.executable,
+        "-m",
+        "replaypack.listener_daemon",
+        "--state-file",
+        str(state_path),
+        "--host",
+        host,
+        "--port",
+        str(port),
+        "--session-id",
+        session_id,
+        "--out",
+        str(out),
+        "--payload-string-limit",
+        str(0 if full_payload_capture else payload_string_limit),
+        "--fallback-policy",
+        resolved_fallback_policy,
+    ]
+    if upstream_timeout_seconds is not None:
+        command.extend(["--upstream-timeout-seconds", str(upstream_timeout_seconds)])
+    if upstream_retries is not None:
+        command.extend(["--upstream-retries", str(upstream_retries)])
+    if upstream_retry_backoff_seconds is not None:
+        command.extend(
+            ["--upstream-retry-backoff-seconds", str(upstream_retry_backoff_seconds)]
+        )
+    if rotation_max_steps is not None:
+        command.extend(["--rotation-max-steps", str(rotation_max_steps)])
+    if retention_max_artifacts is not None:
+        command.extend(["--retention-max-artifacts", str(retention_max_artifacts)])
+
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True,
+        cwd=None if cwd is None else str(cwd),
+    )
+    register_child_pid(process.pid)
+
+    deadline = time.time() + max(0.1, startup_timeout_seconds)
+    started_state: dict[str, Any] | None = None
+    listener_ready = False
+
+    while time.time() < deadline:
+        started_state = load_listener_state(state_path)
+        if isinstance(started_state, dict):
+            started_port = int(started_state.get("port", 0) or 0)
+            started_pid = coerce_listener_pid(started_state.get("pid"))
+            if (
+                started_state.get("listener_session_id") == session_id
+                and started_port > 0
+                and started_pid > 0
+                and is_pid_running(started_pid)
+            ):
+                listener_ready = True
+                break
+        if process.poll() is not None:
+            break
+        time.sleep(0.05)
+
+    if process.poll() is not None:
+        message = "listener start failed: daemon terminated during startup."
+        payload = {
+            "status": "error",
+            "exit_code": 1,
+            "message": message,
+            "artifact_path": None,
+            "state_file": str(state_path),
+        }
+        return 1, payload
+
+    if not listener_ready:
+        if process.poll() is None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+        message = "listener start failed: startup timed out."
+        payload = {
+            "status": "error",
+            "exit_code": 1,
+            "message": message,
+            "artifact_path": None,
+            "state_file": str(state_path),
+        }
+        return 1, payload
+
+    payload = {
+        "status": "ok",
+        "exit_code": 0,
+        "message": "listener started",
+        "artifact_path": None,
+        "state_file": str(state_path),
+        "listener_session_id": started_state.get("listener_session_id"),
+        "pid": coerce_listener_pid(started_state.get("pid")),
+        "host": started_state.get("host"),
+        "port": started_state.get("port"),
+        "artifact_out": started_state.get("artifact_path"),
+        "allow_synthetic": bool(started_state.get("allow_synthetic", True)),
+        "synthetic_policy": str(started_state.get("synthetic_policy", "allow")),
+        "fallback_policy": str(started_state.get("fallback_policy", "synthetic_allowed")),
+        "upstream_timeout_seconds": float(started_state.get("upstream_timeout_seconds", 5.0)),
+        "upstream_retries": int(started_state.get("upstream_retries", 0)),
+        "upstream_retry_backoff_seconds": float(
+            started_state.get("upstream_retry_backoff_seconds", 0.25)
+        ),
+        "payload_string_limit": int(started_state.get("payload_string_limit", 4096)),
+        "full_payload_capture": bool(started_state.get("full_payload_capture", False)),
+        "rotation_max_steps": int(started_state.get("rotation_max_steps", 0)),
+        "retention_max_artifacts": int(started_state.get("retention_max_artifacts", 0)),
+        "stale_cleanup": stale_cleanup,
+    }
+    return 0, payload
+
+
+def stop_listener(
+    state_file: str | Path,
+    *,
+    shutdown_timeout_seconds: float = 5.0,
+) -> tuple[int, dict[str, Any]]:
+    """Ask the listener daemon to shut down, escalating to signals if needed."""
+    state_path = Path(state_file)
+    raw_state = load_listener_state(state_path)
+    if raw_state is None:
+        payload = {
+            "status": "ok",
+            "exit_code": 0,
+            "message": "listener already stopped",
+            "artifact_path": None,
+            "state_file": str(state_path),
+            "stale_cleanup": False,
+        }
+        return 0, payload
+
+    pid = coerce_listener_pid(raw_state.get("pid"))
+    host = str(raw_state.get("host", "127.0.0.1"))
+    port = int(raw_state.get("port", 0) or 0)
+    session_id = raw_state.get("listener_session_id")
+
+    if pid <= 0 or not is_pid_running(pid):
+        remove_listener_state(state_path)
+        payload = {
+            "status": "ok",
+            "exit_code": 0,
+            "message": "listener already stopped (stale state cleaned)",
+            "artifact_path": None,
+            "state_file": str(state_path),
+            "listener_session_id": session_id,
+            "stale_cleanup": True,
+        }
+        return 0, payload
+
+    request = urllib_request.Request(
+        f"http://{host}:{port}/shutdown",
+        method="POST",
+    )
+    opener = urllib_request.build_opener(urllib_request.ProxyHandler({}))
+    try:
+        with opener.open(request, timeout=1.0):
+            pass
+    except (urllib_error.URLError, urllib_error.HTTPError, TimeoutError, OSError):
+        if os.name != "nt" and pid != os.getpid():
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+    deadline = time.time() + max(0.1, shutdown_timeout_seconds)
+    while time.time() < deadline:
+        if not is_pid_running(pid):
+            break
+        time.sleep(0.05)
+
+    if is_pid_running(pid):
+        # If graceful shutdown is stuck, escalate once to avoid flaky lingering
+        # daemon processes during short-lived test sessions.
+        if os.name != "nt" and pid != os.getpid():
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+            kill_deadline = time.time() + 1.0
+            while time.time() < kill_deadline:
+                if not is_pid_running(pid):
+                    break
+                time.sleep(0.05)
+
+    if is_pid_running(pid):
+        message = "listener stop failed: timeout waiting for daemon exit."
+        payload = {
+            "status": "error",
+            "exit_code": 1,
+            "message": message,
+            "artifact_path": None,
+            "state_file": str(state_path),
+            "listener_session_id": session_id,
+            "pid": pid,
+        }
+        return 1, payload
+
+    remove_listener_state(state_path)
+    payload = {
+        "status": "ok",
+        "exit_code": 0,
+        "message": "listener stopped",
+        "artifact_path": None,
+        "state_file": str(state_path),
+        "listener_session_id": session_id,
+        "pid": pid,
+        "stale_cleanup": False,
+    }
+    return 0, payload
+
+
+def listener_status(state_file: str | Path) -> tuple[int, dict[str, Any]]:
+    """Report whether the listener daemon is running and healthy."""
+    state_path = Path(state_file)
+    running_state, stale_cleanup = load_running_listener_state(state_path)
+
+    if running_state is None:
+        payload = {
+            "status": "ok",
+            "exit_code": 0,
+            "message": "listener is stopped",
+            "artifact_path": None,
+            "running": False,
+            "state_file": str(state_path),
+            "stale_cleanup": stale_cleanup,
+        }
+        return 0, payload
+
+    host = str(running_state.get("host", "127.0.0.1"))
+    port = int(running_state.get("port", 0) or 0)
+    pid = coerce_listener_pid(running_state.get("pid"))
+    health = _listener_health(host, port)
+    healthy = health is not None or (pid > 0 and is_pid_running(pid))
+    payload = {
+        "status": "ok",
+        "exit_code": 0,
+        "message": "listener is running",
+        "artifact_path": None,
+        "running": True,
+        "state_file": str(state_path),
+        "listener_session_id": running_state.get("listener_session_id"),
+        "pid": pid,
+        "host": host,
+        "port": port,
+        "artifact_out": running_state.get("artifact_path"),
+        "allow_synthetic": bool(running_state.get("allow_synthetic", True)),
+        "synthetic_policy": str(running_state.get("synthetic_policy", "allow")),
+        "fallback_policy": str(running_state.get("fallback_policy", "synthetic_allowed")),
+        "upstream_timeout_seconds": float(running_state.get("upstream_timeout_seconds", 5.0)),
+        "upstream_retries": int(running_state.get("upstream_retries", 0)),
+        "upstream_retry_backoff_seconds": float(
+            running_state.get("upstream_retry_backoff_seconds", 0.25)
+        ),
+        "payload_string_limit": int(running_state.get("payload_string_limit", 4096)),
+        "full_payload_capture": bool(running_state.get("full_payload_capture", False)),
+        "rotation_max_steps": int(running_state.get("rotation_max_steps", 0)),
+        "retention_max_artifacts": int(running_state.get("retention_max_artifacts", 0)),
+        "healthy": healthy,
+        "health": health,
+        "stale_cleanup": stale_cleanup,
+    }
+    return 0, payload
@@ -10,6 +10,7 @@ import json
 import os
 from pathlib import Path
 import signal
+import socket
 import socketserver
 import sys
 import threading
@@ -26,7 +27,12 @@ try:
 except ImportError:  # pragma: no cover - dependency is required in production/test envs
     zstd = None
 
-from replaypack.artifact import write_artifact
+from replaypack.artifact import (
+    append_artifact_steps,
+    remove_artifact_journal,
+    write_artifact,
+    write_artifact_journal_header,
+)
 from replaypack.core.models import Run, Step
 from replaypack.listener_gateway import (
     ProviderResponse,
@@ -37,6 +43,7 @@ from replaypack.listener_gateway import (
     normalize_provider_request,
     normalize_provider_response,
     provider_request_fingerprint,
+    sorted_json_object,
 )
 from replaypack.listener_agent_gateway import detect_agent, normalize_agent_events
 from replaypack.listener_redaction import redact_listener_headers, redact_listener_value
@@ -45,6 +52,18 @@ from replaypack.listener_state import remove_listener_state, write_listener_stat
 _PERSIST_DELAY_ENV = "REPLAYKIT_LISTENER_PERSIST_DELAY_SECONDS"
 _ROTATION_MAX_STEPS_ENV = "REPLAYKIT_LISTENER_ROTATION_MAX_STEPS"
 _RETENTION_MAX_ARTIFACTS_ENV = "REPLAYKIT_LISTENER_RETENTION_MAX_ARTIFACTS"
+# Journal appends are fsynced once this many steps have accumulated; segment
+# starts and close() rewrite the artifact atomically with their own fsync.
+_JOURNAL_SYNC_BATCH_STEPS = 32
+
+
+def _process_payload() -> dict[str, Any]:
+    return {
+        "pid": os.getpid(),
+        "executable": sys.executable,
+        "command": list(sys.argv),
+        "cwd": str(Path.cwd()),
+    }
 
 
 def _utc_now() -> str:
@@ -65,6 +84,7 @@ _UPSTREAM_DEFAULT_RETRIES = 0
 _UPSTREAM_DEFAULT_RETRY_BACKOFF_SECONDS = 0.25
 _PAYLOAD_STRING_LIMIT_ENV = "REPLAYKIT_LISTENER_PAYLOAD_STRING_LIMIT"
 _PAYLOAD_STRING_DEFAULT_LIMIT = 4096
+_SOCKET_SEND_BUFFER_BYTES = 262144
 _FALLBACK_POLICY_SYNTHETIC_ALLOWED = "synthetic_allowed"
 _FALLBACK_POLICY_BEST_EFFORT = "best_effort"
 _FALLBACK_POLICY_LIVE_ONLY = "live_only"
@@ -388,7 +408,7 @@ def _forward_provider_request(
             parsed_body: dict[str, Any] = {}
         else:
             try:
-                parsed_payload = json.loads(raw_body)
+                parsed_payload = json.loads(raw_body, object_pairs_hook=sorted_json_object)
             except json.JSONDecodeError:
                 return 0, {}, "upstream returned non-JSON response body", attempt
             if not isinstance(parsed_payload, dict):
@@ -440,13 +460,23 @@ class _ListenerRunRecorder:
         self._step_sequence = 0
         self._request_sequence = 0
         self._agent_event_sequence = 0
+        self._persisted_step_count = 0
+        self._unsynced_step_count = 0
+        # Process identity is invariant for the recorder's lifetime, so it is
+        # captured once here rather than for every run segment.
+        self._process = _process_payload()
+        self._python_version = ".".join(str(part) for part in sys.version_info[:3])
         self._run = self._new_run_locked()
-        self._persist_locked()
+        self._start_segment_locked()
 
     @property
     def out_path(self) -> Path:
         return self._out_path
 
+    @property
+    def pid(self) -> int:
+        return self._process["pid"]
+
     @property
     def fallback_policy(self) -> str:
         return self._fallback_policy
@@ -479,18 +509,11 @@ class _ListenerRunRecorder:
             source="listener",
             capture_mode="passive",
             listener_session_id=self._session_id,
-            listener_process={
-                "pid": os.getpid(),
-                "executable": sys.executable,
-                "command": list(sys.argv),
-                "cwd": str(Path.cwd()),
-            },
+            listener_process={**self._process, "command": list(self._process["command"])},
             listener_bind={"host": self._host, "port": self._port},
             environment_fingerprint={"listener_mode": "passive", "os": os.name},
             runtime_versions={
-                "python": ".".join(
-                    str(part) for part in sys.version_info[:3]
-                ),
+                "python": self._python_version,
                 "replaykit_listener": "1",
             },
             steps=[],
@@ -542,6 +565,7 @@ class _ListenerRunRecorder:
         self._enforce_retention_locked()
         self._run_segment += 1
         self._run = self._new_run_locked()
+        self._start_segment_locked()
 
     def record_provider_transaction(
         self,
@@ -552,12 +576,14 @@ class _ListenerRunRecorder:
         payload: dict[str, Any],
         headers: dict[str, str],
         fail_reason: str | None,
+        payload_canonical: bool = False,
     ) -> tuple[int, dict[str, Any]]:
         with self._lock:
             self._request_sequence += 1
+            raw_request_id = headers.get("x-request-id")
             request_id = (
-                str(headers.get("x-request-id")).strip()
-                if headers.get("x-request-id")
+                raw_request_id.strip()
+                if raw_request_id
                 else f"{provider}-request-{self._request_sequence:06d}"
             )
             request = normalize_provider_request(
@@ -566,6 +592,7 @@ class _ListenerRunRecorder:
                 payload=payload,
                 headers=headers,
                 request_id=request_id,
+                already_canonical=payload_canonical,
             )
             minimized_payload, truncated_fields = _truncate_payload_strings(
                 request.payload,
@@ -683,6 +710,7 @@ class _ListenerRunRecorder:
                             status_code=status_code,
                             payload=response_payload,
                             path=path,
+                            already_canonical=True,
                         )
                 else:
                     if supports_upstream_forward and self._fallback_policy == _FALLBACK_POLICY_LIVE_ONLY:
@@ -1127,6 +1155,24 @@ class _ListenerRunRecorder:
         self._step_sequence += 1
         return f"step-{self._step_sequence:06d}"
 
+    def _artifact_metadata_locked(self) -> dict[str, Any]:
+        return {
+            "mode": "listener.passive",
+            "listener_session_id": self._run.listener_session_id,
+            "segment": self._run_segment,
+            "rotation_max_steps": self._rotation_max_steps,
+            "retention_max_artifacts": self._retention_max_artifacts,
+        }
+
+    def _start_segment_locked(self) -> None:
+        # The full artifact is only rewritten at segment boundaries; steps in
+        # between are appended to the journal sidecars.
+        metadata = self._artifact_metadata_locked()
+        write_artifact(self._run, self._out_path, metadata=metadata)
+        write_artifact_journal_header(self._run, self._out_path, metadata=metadata)
+        self._persisted_step_count = len(self._run.steps)
+        self._unsynced_step_count = 0
+
     def _persist_locked(self) -> None:
         delay_raw = os.environ.get(_PERSIST_DELAY_ENV)
         if delay_raw:
@@ -1136,23 +1182,39 @@ class _ListenerRunRecorder:
                 delay_seconds = 0.0
             if delay_seconds > 0:
                 time.sleep(min(delay_seconds, 5.0))
-        write_artifact(
-            self._run,
-            self._out_path,
-            metadata={
-                "mode": "listener.passive",
-                "listener_session_id": self._run.listener_session_id,
-                "segment": self._run_segment,
-                "rotation_max_steps": self._rotation_max_steps,
-                "retention_max_artifacts": self._retention_max_artifacts,
-            },
-        )
+        pending = self._run.steps[self._persisted_step_count :]
+        sync = self._unsynced_step_count + len(pending) >= _JOURNAL_SYNC_BATCH_STEPS
+        appended = append_artifact_steps(self._out_path, pending, sync=sync)
+        self._persisted_step_count += appended
+        self._unsynced_step_count = 0 if sync else self._unsynced_step_count + appended
         self._rotate_if_needed_locked()
 
+    def close(self) -> None:
+        """Compact the journaled steps into the final artifact."""
+        with self._lock:
+            write_artifact(
+                self._run,
+                self._out_path,
+                metadata=self._artifact_metadata_locked(),
+            )
+            remove_artifact_journal(self._out_path)
+
 
 class _ReplayListenerServer(ThreadingHTTPServer):
     allow_reuse_address = True
     daemon_threads = True
+    request_queue_size = 128
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        request, client_address = super().get_request()
+        # Small JSON responses otherwise stall behind Nagle/delayed-ACK on
+        # keep-alive connections.
+        try:
+            request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_SEND_BUFFER_BYTES)
+        except OSError:
+            pass
+        return request, client_address
 
     def server_bind(self) -> None:
         # Avoid reverse-DNS lookup latency in HTTPServer.server_bind/getfqdn.
@@ -1229,6 +1291,7 @@ class _ListenerHandler(BaseHTTPRequestHandler):
                     payload={},
                     headers={str(key): str(value) for key, value in self.headers.items()},
                     fail_reason=None,
+                    payload_canonical=True,
                 )
             except Exception as error:
                 capture_error_count = self.server.register_capture_error()
@@ -1276,7 +1339,7 @@ class _ListenerHandler(BaseHTTPRequestHandler):
                 {
                     "status": "ok",
                     "session_id": self.server.session_id,
-                    "pid": os.getpid(),
+                    "pid": recorder.pid,
                     "artifact_path": str(recorder.out_path),
                     "metrics": self.server.metrics_payload(),
                 },
@@ -1377,6 +1440,7 @@ class _ListenerHandler(BaseHTTPRequestHandler):
                 payload=payload,
                 headers={str(key): str(value) for key, value in self.headers.items()},
                 fail_reason=fail_reason,
+                payload_canonical=True,
             )
         except Exception as error:
             capture_error_count = self.server.register_capture_error()
@@ -1445,7 +1509,7 @@ class _ListenerHandler(BaseHTTPRequestHandler):
 
         decoded = decoded_body.decode("utf-8", errors="replace")
         try:
-            parsed = json.loads(decoded)
+            parsed = json.loads(decoded, object_pairs_hook=sorted_json_object)
         except json.JSONDecodeError:
             return {"raw_body": decoded}, "invalid_json_body"
         if isinstance(parsed, (dict, list)):
@@ -1486,7 +1550,9 @@ class _ListenerHandler(BaseHTTPRequestHandler):
         return {"raw_body": decoded}, "non_object_json_body", 1
 
     def _write_json(self, status_code: int, payload: dict[str, Any]) -> None:
-        body = json.dumps(payload, ensure_ascii=True, sort_keys=True).encode("utf-8")
+        # Live responses only need to be valid JSON; canonical key order is
+        # reserved for persisted artifacts.
+        body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
         self.send_response(status_code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(body)))
@@ -1768,10 +1834,11 @@ def _runtime_payload(
 ) -> dict[str, Any]:
     normalized_policy = str(fallback_policy).strip().lower()
     allow_synthetic = normalized_policy == _FALLBACK_POLICY_SYNTHETIC_ALLOWED
+    process = _process_payload()
     return {
         "status": "running",
         "listener_session_id": session_id,
-        "pid": os.getpid(),
+        "pid": process["pid"],
         "host": host,
         "port": port,
         "artifact_path": str(out_path),
@@ -1786,12 +1853,7 @@ def _runtime_payload(
         "rotation_max_steps": max(0, int(rotation_max_steps)),
         "retention_max_artifacts": max(0, int(retention_max_artifacts)),
         "started_at": _utc_now(),
-        "process": {
-            "pid": os.getpid(),
-            "executable": sys.executable,
-            "command": list(sys.argv),
-            "cwd": str(Path.cwd()),
-        },
+        "process": process,
     }
 
 
@@ -1863,8 +1925,11 @@ def main(argv: list[str] | None = None) -> int:
     try:
         server.serve_forever(poll_interval=0.2)
     finally:
-        remove_listener_state(args.state_file)
-        server.server_close()
+        try:
+            server.recorder.close()
+        finally:
+            remove_listener_state(args.state_file)
+            server.server_close()
 
     return 0
 
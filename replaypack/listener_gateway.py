@@ -3,12 +3,52 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
+from operator import itemgetter
+import re
+import sys
 from typing import Any
 
 
 _SUPPORTED_PROVIDERS = ("openai", "anthropic", "google")
 _OPENAI_MODELS_CREATED_UNIX = 1735689600
+_CONTAINER_TYPES = (dict, list, tuple)
+_PROVIDER_BY_EXACT_PATH = {
+    "/models": "openai",
+    "/v1/models": "openai",
+    "/responses": "openai",
+    "/v1/responses": "openai",
+    "/v1/chat/completions": "openai",
+    "/chat/completions": "openai",
+    "/v1/messages": "anthropic",
+    "/messages": "anthropic",
+}
+# Provider payloads reuse a small set of key schemas; cache their sorted order.
+_SORTED_KEY_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
+_SORTED_KEY_CACHE_LIMIT = 4096
+# Well-known provider payload schemas, pre-seeded so even the first payload of
+# each shape skips sorted().
+_KNOWN_PAYLOAD_SCHEMAS: tuple[tuple[str, ...], ...] = (
+    ("id", "object", "choices"),
+    ("role", "content"),
+    ("message",),
+    ("id", "object", "status", "model", "output", "output_text"),
+    ("id", "type", "status", "role", "content"),
+    ("type", "text", "annotations"),
+    ("id", "type", "content"),
+    ("type", "text"),
+    ("candidates",),
+    ("content",),
+    ("role", "parts"),
+    ("text",),
+    ("model", "messages"),
+    ("model", "messages", "stream"),
+    ("model", "input"),
+)
+_STREAM_CHUNK_PATTERNS: dict[int, re.Pattern[str]] = {3: re.compile(r".{1,3}", re.DOTALL)}
+_SKIPPED_REQUEST_HEADERS = frozenset({"content-length", "connection", "host"})
+_GOOGLE_GENERATE_CONTENT_PATH = re.compile(r"/v1beta/models/.*:generateContent", re.DOTALL)
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,21 +73,29 @@ class ProviderResponse:
     error: dict[str, Any] | None = None
 
 
+_LISTENER_RESPONSE_TEXT = "ReplayKit listener response"
+
+
+def _seed_sorted_key_cache(schemas: tuple[tuple[str, ...], ...]) -> None:
+    for schema in schemas:
+        sorted_keys = tuple(sys.intern(key) for key in sorted(schema))
+        _SORTED_KEY_CACHE[schema] = sorted_keys
+        _SORTED_KEY_CACHE[sorted_keys] = sorted_keys
+
+
+_seed_sorted_key_cache(_KNOWN_PAYLOAD_SCHEMAS)
+
+
 def detect_provider(path: str) -> str | None:
     normalized = str(path or "").strip()
     if not normalized:
         return None
     if normalized != "/":
         normalized = normalized.rstrip("/")
-    if normalized in {"/models", "/v1/models"}:
-        return "openai"
-    if normalized in {"/responses", "/v1/responses"}:
-        return "openai"
-    if normalized in {"/v1/chat/completions", "/chat/completions"}:
-        return "openai"
-    if normalized in {"/v1/messages", "/messages"}:
-        return "anthropic"
-    if normalized.startswith("/v1beta/models/") and normalized.endswith(":generateContent"):
+    provider = _PROVIDER_BY_EXACT_PATH.get(normalized)
+    if provider is not None:
+        return provider
+    if _GOOGLE_GENERATE_CONTENT_PATH.fullmatch(normalized):
         return "google"
     return None
 
@@ -59,22 +107,25 @@ def normalize_provider_request(
     payload: dict[str, Any],
     headers: dict[str, str],
     request_id: str,
+    already_canonical: bool = False,
 ) -> ProviderRequest:
     if provider not in _SUPPORTED_PROVIDERS:
         raise ValueError(f"unsupported provider: {provider}")
     model = _extract_model(provider, payload, path=path)
     stream = bool(payload.get("stream", False))
-    normalized_headers = {
-        key.lower(): str(value)
-        for key, value in sorted(headers.items(), key=lambda item: str(item[0]).lower())
-        if key and key.lower() not in {"content-length", "connection", "host"}
-    }
+    lowered_headers = [(key.lower(), str(value)) for key, value in headers.items() if key]
+    normalized_headers = dict(
+        sorted(
+            (item for item in lowered_headers if item[0] not in _SKIPPED_REQUEST_HEADERS),
+            key=itemgetter(0),
+        )
+    )
     return ProviderRequest(
         provider=provider,
         path=path,
         model=model,
         stream=stream,
-        payload=_stable_object_copy(payload),
+        payload=payload if already_canonical else _stable_object_copy(payload),
         headers=normalized_headers,
         request_id=request_id,
     )
@@ -106,7 +157,6 @@ def build_provider_response(
         )
         return status, body, normalized
 
-    text = "ReplayKit listener response"
     if request.provider == "openai":
         if request.path in {"/models", "/v1/models"}:
             response = build_openai_models_payload()
@@ -125,25 +175,27 @@ def build_provider_response(
                         "content": [
                             {
                                 "type": "output_text",
-                                "text": text,
+                                "text": _LISTENER_RESPONSE_TEXT,
                                 "annotations": [],
                             }
                         ],
                     }
                 ],
-                "output_text": text,
+                "output_text": _LISTENER_RESPONSE_TEXT,
             }
         else:
             response = {
                 "id": f"chatcmpl-listener-{sequence:06d}",
                 "object": "chat.completion",
-                "choices": [{"message": {"role": "assistant", "content": text}}],
+                "choices": [
+                    {"message": {"role": "assistant", "content": _LISTENER_RESPONSE_TEXT}}
+                ],
             }
     elif request.provider == "anthropic":
         response = {
             "id": f"msg-listener-{sequence:06d}",
             "type": "message",
-            "content": [{"type": "text", "text": text}],
+            "content": [{"type": "text", "text": _LISTENER_RESPONSE_TEXT}],
         }
     else:
         response = {
@@ -151,7 +203,7 @@ def build_provider_response(
                 {
                     "content": {
                         "role": "model",
-                        "parts": [{"text": text}],
+                        "parts": [{"text": _LISTENER_RESPONSE_TEXT}],
                     }
                 }
             ]
@@ -223,8 +275,10 @@ def normalize_provider_response(
     payload: dict[str, Any],
     stream: bool = False,
     path: str | None = None,
+    already_canonical: bool = False,
 ) -> ProviderResponse:
     assembled_text = _extract_text(provider, payload)
+    canonical_payload = payload if already_canonical else _stable_object_copy(payload)
     error_payload = None
     if status_code >= 400:
         error_payload = {"status_code": status_code, "payload": dict(payload)}
@@ -232,14 +286,14 @@ def normalize_provider_response(
     if stream and status_code < 400 and assembled_text:
         stream_events = _synthesize_stream_events(
             provider=provider,
-            payload=payload,
+            payload=canonical_payload,
             path=path,
             assembled_text=assembled_text,
         )
     return ProviderResponse(
         provider=provider,
         status_code=status_code,
-        response=_stable_object_copy(payload),
+        response=canonical_payload,
         assembled_text=assembled_text,
         stream=stream,
         stream_events=stream_events,
@@ -247,27 +301,87 @@ def normalize_provider_response(
     )
 
 
+def sorted_json_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """`json.loads` object hook that yields payloads already in canonical key order.
+
+    Parsed values can then be passed to the normalizers with
+    `already_canonical=True` to skip the canonicalizing copy.
+    """
+    return dict(sorted(pairs, key=itemgetter(0)))
+
+
 def provider_request_fingerprint(request: ProviderRequest) -> str:
+    return _fingerprint(
+        request.provider,
+        request.path,
+        request.model,
+        request.stream,
+        request.request_id,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint(
+    provider: str,
+    path: str,
+    model: str | None,
+    stream: bool,
+    request_id: str,
+) -> str:
+    # The correlation id is hashed into step metadata, so its algorithm is
+    # fixed: changing it (or using an optional faster hash such as xxhash)
+    # would change every recorded listener step hash.
     digest = hashlib.sha256(
-        (
-            f"{request.provider}|{request.path}|{request.model}|"
-            f"{request.stream}|{request.request_id}"
-        ).encode("utf-8")
+        f"{provider}|{path}|{model}|{stream}|{request_id}".encode("utf-8")
     ).hexdigest()
     return f"req-{digest[:16]}"
 
 
 def _stable_object_copy(value: Any) -> Any:
+    """Return a copy of `value` with sorted string dict keys and tuples as lists.
+
+    Every container is rebuilt, so the result never aliases the caller's
+    objects; nesting is walked with an explicit stack instead of recursion.
+    """
+    if not isinstance(value, _CONTAINER_TYPES):
+        return value
+    stack = [_open_copy_frame(value)]
+    while True:
+        keys, children, built_children = stack[-1]
+        index = len(built_children)
+        if index < len(children):
+            child = children[index]
+            if isinstance(child, _CONTAINER_TYPES):
+                stack.append(_open_copy_frame(child))
+            else:
+                built_children.append(child)
+            continue
+
+        stack.pop()
+        built: Any = built_children if keys is None else dict(zip(keys, built_children))
+        if not stack:
+            return built
+        stack[-1][2].append(built)
+
+
+def _open_copy_frame(value: Any) -> list[Any]:
+    # Frame layout: [sorted keys or None, source children, built children].
     if isinstance(value, dict):
-        return {
-            str(key): _stable_object_copy(val)
-            for key, val in sorted(value.items(), key=lambda item: str(item[0]))
-        }
-    if isinstance(value, list):
-        return [_stable_object_copy(item) for item in value]
-    if isinstance(value, tuple):
-        return [_stable_object_copy(item) for item in value]
-    return value
+        source_keys = tuple(value)
+        sorted_keys = _SORTED_KEY_CACHE.get(source_keys)
+        if sorted_keys is None:
+            sorted_keys = tuple(sorted(source_keys, key=str))
+            keys = [sys.intern(key) if type(key) is str else str(key) for key in sorted_keys]
+            # Only all-str key sets are cached, so a cache hit implies str keys.
+            if all(type(key) is str for key in source_keys):
+                if len(_SORTED_KEY_CACHE) >= _SORTED_KEY_CACHE_LIMIT:
+                    _SORTED_KEY_CACHE.clear()
+                    _seed_sorted_key_cache(_KNOWN_PAYLOAD_SCHEMAS)
+                _SORTED_KEY_CACHE[source_keys] = tuple(keys)
+        else:
+            keys = list(sorted_keys)
+        return [keys, [value[key] for key in sorted_keys], []]
+    return [None, value, []]
 
 
 def _extract_model(provider: str, payload: dict[str, Any], *, path: str) -> str | None:
@@ -287,69 +401,69 @@ def _extract_model(provider: str, payload: dict[str, Any], *, path: str) -> str
 
 
 def _extract_text(provider: str, payload: dict[str, Any]) -> str:
+    # Well-formed responses take the direct lookup path; malformed shapes fall
+    # out through the exception handlers instead of layered isinstance checks.
     if provider == "openai":
         output_text = payload.get("output_text")
-        if isinstance(output_text, str):
+        if type(output_text) is str:
             return output_text
 
         output = payload.get("output")
-        if isinstance(output, list):
-            chunks: list[str] = []
-            for item in output:
-                if not isinstance(item, dict):
-                    continue
-                content = item.get("content")
-                if isinstance(content, list):
-                    for part in content:
-                        if isinstance(part, dict):
-                            if part.get("type") == "output_text":
-                                text = part.get("text")
-                                if isinstance(text, str):
-                                    chunks.append(text)
-                text_value = item.get("text")
-                if isinstance(text_value, str):
-                    chunks.append(text_value)
-            if chunks:
-                return "".join(chunks)
-
-        choices = payload.get("choices")
-        if isinstance(choices, list) and choices:
-            first = choices[0]
-            if isinstance(first, dict):
-                message = first.get("message")
-                if isinstance(message, dict):
-                    content = message.get("content")
-                    if isinstance(content, str):
-                        return content
+        if type(output) is list:
+            output_text = _join_openai_output_text(output)
+            if output_text:
+                return output_text
+
+        try:
+            content = payload["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            return ""
+        return content if type(content) is str else ""
     if provider == "anthropic":
-        content = payload.get("content")
-        if isinstance(content, list):
-            chunks: list[str] = []
-            for part in content:
-                if isinstance(part, dict):
-                    text = part.get("text")
-                    if isinstance(text, str):
-                        chunks.append(text)
-            return "".join(chunks)
+        try:
+            return _join_text_parts(payload["content"])
+        except (KeyError, TypeError):
+            return ""
     if provider == "google":
-        candidates = payload.get("candidates")
-        if isinstance(candidates, list) and candidates:
-            first = candidates[0]
-            if isinstance(first, dict):
-                content = first.get("content")
-                if isinstance(content, dict):
-                    parts = content.get("parts")
-                    if isinstance(parts, list):
-                        chunks = []
-                        for part in parts:
-                            if isinstance(part, dict):
-                                text = part.get("text")
-                                if isinstance(text, str):
-                                    chunks.append(text)
-                        return "".join(chunks)
+        try:
+            return _join_text_parts(payload["candidates"][0]["content"]["parts"])
+        except (KeyError, IndexError, TypeError):
+            return ""
     return ""
 
 
+def _join_openai_output_text(output: list[Any]) -> str:
+    chunks: list[str] = []
+    for item in output:
+        if type(item) is not dict:
+            continue
+        content = item.get("content")
+        if type(content) is list:
+            chunks.extend(
+                part["text"]
+                for part in content
+                if type(part) is dict
+                and part.get("type") == "output_text"
+                and type(part.get("text")) is str
+            )
+        text_value = item.get("text")
+        if type(text_value) is str:
+            chunks.append(text_value)
+    return "".join(chunks)
+
+
+def _join_text_parts(parts: Any) -> str:
+    chunks: list[str] = []
+    for part in parts:
+        try:
+            text = part["text"]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if type(text) is str:
+            chunks.append(text)
+    return "".join(chunks)
+
+
 def _synthesize_stream_events(
     *,
     provider: str,
@@ -388,7 +502,11 @@ def _synthesize_stream_events(
 def _split_stream_chunks(text: str, chunk_size: int = 3) -> list[str]:
     if not text:
         return []
-    return [text[idx : idx + chunk_size] for idx in range(0, len(text), chunk_size)]
+    pattern = _STREAM_CHUNK_PATTERNS.get(chunk_size)
+    if pattern is None:
+        pattern = re.compile(f".{{1,{chunk_size}}}", re.DOTALL)
+        _STREAM_CHUNK_PATTERNS[chunk_size] = pattern
+    return pattern.findall(text)
 
 
 def _stream_event_types(
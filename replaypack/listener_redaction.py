@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from replaypack.capture import DEFAULT_REDACTION_POLICY, RedactionPolicy, redact_payload
 
 _SENSITIVE_HEADER_TOKENS = ("auth", "token", "secret", "key")
-_ALLOWED_HEADER_KEYS = {
-    "accept",
-    "content-type",
-    "user-agent",
-    "x-request-id",
-}
+# One alternation scan replaces a substring search per token.
+_SENSITIVE_HEADER_PATTERN = re.compile("|".join(_SENSITIVE_HEADER_TOKENS))
+_ALLOWED_HEADER_KEYS = frozenset(
+    {
+        "accept",
+        "content-type",
+        "user-agent",
+        "x-request-id",
+    }
+)
 
 
 def redact_listener_headers(
@@ -45,4 +50,4 @@ def _header_is_sensitive(key: str, *, policy: RedactionPolicy) -> bool:
         return True
     if key in _ALLOWED_HEADER_KEYS:
         return False
-    return any(token in key for token in _SENSITIVE_HEADER_TOKENS)
+    return _SENSITIVE_HEADER_PATTERN.search(key) is not None
@@ -11,6 +11,9 @@ if os.name == "nt":
     import ctypes
     from ctypes import wintypes
 
+_CREATED_STATE_DIRS: set[str] = set()
+_CHILD_PIDS: set[int] = set()
+
 
 def default_listener_state_path() -> Path:
     return Path("runs/listener/state.json")
@@ -21,12 +24,12 @@ def default_transparent_state_path() -> Path:
 
 
 def load_listener_state(path: str | Path) -> dict[str, Any] | None:
-    target = Path(path)
-    if not target.exists():
-        return None
     try:
-        raw = json.loads(target.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        with open(path, "rb") as handle:
+            raw = json.loads(handle.read())
+    except (OSError, ValueError):
+        # Covers a missing file without a separate exists() stat, plus
+        # undecodable or invalid JSON.
         return None
     if not isinstance(raw, dict):
         return None
@@ -35,11 +38,19 @@ def load_listener_state(path: str | Path) -> dict[str, Any] | None:
 
 def write_listener_state(path: str | Path, payload: dict[str, Any]) -> None:
     target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=True, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    serialized = (
+        json.dumps(payload, indent=2, ensure_ascii=True, sort_keys=True) + "\n"
+    ).encode("ascii")
+    parent = str(target.parent)
+    if parent not in _CREATED_STATE_DIRS:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _CREATED_STATE_DIRS.add(parent)
+    try:
+        target.write_bytes(serialized)
+    except FileNotFoundError:
+        # The cached directory was removed since it was created; recreate it.
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(serialized)
 
 
 def remove_listener_state(path: str | Path) -> None:
@@ -72,18 +83,26 @@ def _is_pid_running_windows(pid: int) -> bool:
         kernel32.CloseHandle(handle)
 
 
+def register_child_pid(pid: int) -> None:
+    """Record a PID spawned by this process so liveness checks can reap it."""
+    if pid > 0:
+        _CHILD_PIDS.add(pid)
+
+
 def is_pid_running(pid: int) -> bool:
     if pid <= 0:
         return False
     if os.name == "nt":
         return _is_pid_running_windows(pid)
-    wnohang = getattr(os, "WNOHANG", None)
-    if hasattr(os, "waitpid") and wnohang is not None:
+    if pid in _CHILD_PIDS:
+        # An exited child stays signalable as a zombie until reaped, so only
+        # children need the extra waitpid call.
         try:
-            waited_pid, _status = os.waitpid(pid, wnohang)
+            waited_pid, _status = os.waitpid(pid, os.WNOHANG)
         except (ChildProcessError, OSError):
             waited_pid = 0
         if waited_pid == pid:
+            _CHILD_PIDS.discard(pid)
             return False
     try:
         os.kill(pid, 0)
@@ -8,23 +8,36 @@ from replaypack.capture import capture_run, intercept_openai_like
 from replaypack.core.models import Run
 
 
+# Shared response template; each call returns a fresh top-level dict, and
+# capture redaction copies nested values before they reach a step.
+_NON_STREAM_RESPONSE = {
+    "id": "fake-live-demo-001",
+    "model": "fake-chat",
+    "content": "Hello",
+}
+
+_STREAM_CHUNKS = (
+    {"choices": [{"delta": {"content": "Hel"}}]},
+    {"choices": [{"delta": {"content": "lo"}}]},
+)
+
+
 @dataclass(slots=True)
 class _FakeProviderClient:
     """Deterministic fake provider used for local live-demo capture."""
 
     def create(self, **kwargs: object) -> object:
         if kwargs.get("stream"):
-            def iterator():
-                yield {"choices": [{"delta": {"content": "Hel"}}]}
-                yield {"choices": [{"delta": {"content": "lo"}}]}
+            return iter(_STREAM_CHUNKS)
+
+        model = kwargs.get("model", "fake-chat")
+        if model == _NON_STREAM_RESPONSE["model"]:
+            return dict(_NON_STREAM_RESPONSE)
+        return {**_NON_STREAM_RESPONSE, "model": model}
 
-            return iterator()
 
-        return {
-            "id": "fake-live-demo-001",
-            "model": kwargs.get("model", "fake-chat"),
-            "content": "Hello",
-        }
+# Stateless; interception patches the class, so one shared instance suffices.
+_FAKE_CLIENT = _FakeProviderClient()
 
 
 def build_live_demo_run(
@@ -43,7 +56,7 @@ def build_live_demo_run(
             f"Unsupported live-demo provider: {provider}. Expected fake."
         )
 
-    client = _FakeProviderClient()
+    client = _FAKE_CLIENT
     with capture_run(run_id=run_id, timestamp=timestamp) as context:
         with intercept_openai_like(
             _FakeProviderClient,
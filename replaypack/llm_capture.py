@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import json
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 
 from replaypack.capture import capture_run, intercept_openai_like
 from replaypack.capture.redaction import (
@@ -22,23 +22,48 @@ from replaypack.providers import (
 )
 
 
+# Stdlib decoder bound once: orjson/msgspec are not dependencies, and their
+# handling of NaN and out-of-range integers differs from json, which would make
+# the captured chunk list depend on what happens to be installed.
+_JSON_DECODE = json.JSONDecoder().decode
+_SSE_DATA_PREFIX = b"data:"
+_SSE_DONE = b"[DONE]"
+_SSE_STREAM_END = object()
+# Matches requests' iter_lines() default read size.
+_SSE_READ_BYTES = 512
+
+# Shared response template; each call returns a fresh top-level dict, and
+# capture redaction copies nested values before they reach a step.
+_NON_STREAM_RESPONSE = {
+    "id": "fake-llm-001",
+    "model": "fake-chat",
+    "choices": [{"message": {"role": "assistant", "content": "Hello"}}],
+}
+
+_STREAM_CHUNKS = (
+    {"choices": [{"delta": {"content": "Hel"}}]},
+    {"choices": [{"delta": {"content": "lo"}}]},
+)
+
+
 @dataclass(slots=True)
 class _FakeProviderClient:
     """Deterministic fake provider used for adapter-wired llm capture."""
 
     def create(self, **kwargs: object) -> object:
         if kwargs.get("stream"):
-            def iterator():
-                yield {"choices": [{"delta": {"content": "Hel"}}]}
-                yield {"choices": [{"delta": {"content": "lo"}}]}
+            return iter(_STREAM_CHUNKS)
 
-            return iterator()
+        model = kwargs.get("model", "fake-chat")
+        if model == _NON_STREAM_RESPONSE["model"]:
+            return dict(_NON_STREAM_RESPONSE)
+        return {**_NON_STREAM_RESPONSE, "model": model}
 
-        return {
-            "id": "fake-llm-001",
-            "model": kwargs.get("model", "fake-chat"),
-            "choices": [{"message": {"role": "assistant", "content": "Hello"}}],
-        }
+
+# Both are stateless; interception patches the client class, so shared
+# instances behave identically to per-call ones.
+_FAKE_CLIENT = _FakeProviderClient()
+_FAKE_ADAPTER = FakeProviderAdapter()
 
 
 def build_fake_llm_run(
@@ -51,14 +76,13 @@ def build_fake_llm_run(
     redaction_policy: RedactionPolicy | None = None,
 ) -> Run:
     """Build fake-provider run using openai-like interception + provider adapter."""
-    adapter = FakeProviderAdapter()
-    client = _FakeProviderClient()
+    adapter = _FAKE_ADAPTER
+    client = _FAKE_CLIENT
     payload = {"messages": [{"role": "user", "content": prompt}]}
     request_view = adapter.capture_request(model=model, payload=payload, stream=stream)
     effective_policy = redaction_policy or DEFAULT_REDACTION_POLICY
 
     response: object
-    chunks: list[Any] = []
 
     with capture_run(
         run_id=run_id,
@@ -72,14 +96,17 @@ def build_fake_llm_run(
             context=context,
         ):
             if stream:
-                chunks = list(
-                    client.create(
+                # Feed the captured stream straight into the assembler rather
+                # than materializing an intermediate chunk list first.
+                response = assemble_stream_capture(
+                    adapter,
+                    chunks=client.create(
                         model=model,
                         messages=payload["messages"],
                         stream=True,
-                    )
+                    ),
+                    collect_chunks=True,
                 )
-                response = assemble_stream_capture(adapter, chunks=chunks)
             else:
                 non_stream = client.create(
                     model=model,
@@ -110,6 +137,28 @@ def build_fake_llm_run(
     return run
 
 
+def _resolve_post(
+    request_post: Callable[..., Any] | None,
+    session: Any | None,
+) -> Callable[..., Any]:
+    """Pick the transport: explicit callable, caller-owned session, or requests.post."""
+    if request_post is not None:
+        return request_post
+    if session is not None:
+        return session.post
+    import requests
+
+    return requests.post
+
+
+def _close_response(response: Any) -> None:
+    # Streams stop reading at [DONE]; closing releases the connection back to
+    # its pool instead of leaving it held by an unconsumed body.
+    close = getattr(response, "close", None)
+    if callable(close):
+        close()
+
+
 def build_openai_llm_run(
     *,
     model: str,
@@ -122,10 +171,9 @@ def build_openai_llm_run(
     timestamp: str = "2026-02-22T00:00:00Z",
     redaction_policy: RedactionPolicy | None = None,
     request_post: Callable[..., Any] | None = None,
+    session: Any | None = None,
 ) -> Run:
     """Build OpenAI provider run with adapter-normalized request/response steps."""
-    import requests
-
     adapter = OpenAIProviderAdapter()
     endpoint = f"{base_url.rstrip('/')}/v1/chat/completions"
     headers = {
@@ -137,7 +185,7 @@ def build_openai_llm_run(
         "messages": [{"role": "user", "content": prompt}],
         "stream": stream,
     }
-    post_fn = request_post or requests.post
+    post_fn = _resolve_post(request_post, session)
     effective_policy = redaction_policy or DEFAULT_REDACTION_POLICY
 
     with capture_run(
@@ -172,13 +220,19 @@ def build_openai_llm_run(
             timeout=timeout_seconds,
             stream=stream,
         )
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
 
-        if stream:
-            raw_chunks = list(_iter_sse_json_chunks(response))
-            normalized_response = assemble_stream_capture(adapter, chunks=raw_chunks)
-        else:
-            normalized_response = adapter.normalize_response(response=response.json())
+            if stream:
+                normalized_response = assemble_stream_capture(
+                    adapter,
+                    chunks=_iter_sse_json_chunks(response),
+                    collect_chunks=True,
+                )
+            else:
+                normalized_response = adapter.normalize_response(response=response.json())
+        finally:
+            _close_response(response)
 
         context.record_step(
             "model.response",
@@ -200,25 +254,62 @@ def build_openai_llm_run(
     return run
 
 
-def _iter_sse_json_chunks(response: Any) -> list[dict[str, Any]]:
-    chunks: list[dict[str, Any]] = []
-    for raw_line in response.iter_lines():
+def _iter_sse_json_chunks(response: Any) -> Iterator[dict[str, Any]]:
+    iter_content = getattr(response, "iter_content", None)
+    if iter_content is None:
+        # Injected responses may only implement iter_lines().
+        lines: Iterable[Any] = response.iter_lines()
+    else:
+        lines = _iter_sse_byte_lines(iter_content)
+    for raw_line in lines:
         if raw_line is None:
             continue
-        line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else str(raw_line)
-        stripped = line.strip()
-        if not stripped or not stripped.startswith("data:"):
+        if isinstance(raw_line, str):
+            raw_line = raw_line.encode("utf-8")
+        event = _parse_sse_json_line(raw_line)
+        if event is _SSE_STREAM_END:
+            return
+        if event is not None:
+            yield event
+
+
+def _iter_sse_byte_lines(iter_content: Callable[..., Iterable[Any]]) -> Iterator[bytes]:
+    # Scan raw bytes for line ends instead of iter_lines(), which re-splits its
+    # pending buffer on every read. Each read is split into its complete lines
+    # by one C-level splitlines() (\n, \r\n and bare \r); only the
+    # unterminated tail is carried into the next read. Reads stay small so an
+    # event is yielded while later bytes are still arriving.
+    pending: list[bytes] = []
+    for raw_chunk in iter_content(chunk_size=_SSE_READ_BYTES, decode_unicode=False):
+        if not raw_chunk:
             continue
-        payload = stripped[5:].strip()
-        if payload == "[DONE]":
-            break
-        try:
-            chunk = json.loads(payload)
-        except json.JSONDecodeError:
+        if isinstance(raw_chunk, str):
+            raw_chunk = raw_chunk.encode("utf-8")
+        pending.append(raw_chunk)
+        if b"\n" not in raw_chunk and b"\r" not in raw_chunk:
             continue
-        if isinstance(chunk, dict):
-            chunks.append(chunk)
-    return chunks
+        buffered = b"".join(pending)
+        lines = buffered.splitlines()
+        pending = [] if buffered.endswith((b"\n", b"\r")) else [lines.pop()]
+        yield from lines
+    tail = b"".join(pending)
+    if tail:
+        yield tail
+
+
+def _parse_sse_json_line(line: bytes) -> Any:
+    """Return the line's JSON object, None to skip it, or the end sentinel."""
+    stripped = line.strip()
+    if not stripped.startswith(_SSE_DATA_PREFIX):
+        return None
+    payload = stripped[len(_SSE_DATA_PREFIX) :].strip()
+    if payload == _SSE_DONE:
+        return _SSE_STREAM_END
+    try:
+        chunk = _JSON_DECODE(payload.decode("utf-8"))
+    except ValueError:
+        return None
+    return chunk if isinstance(chunk, dict) else None
 
 
 def build_anthropic_llm_run(
@@ -233,10 +324,9 @@ def build_anthropic_llm_run(
     timestamp: str = "2026-02-22T00:00:00Z",
     redaction_policy: RedactionPolicy | None = None,
     request_post: Callable[..., Any] | None = None,
+    session: Any | None = None,
 ) -> Run:
     """Build Anthropic provider run with adapter-normalized steps."""
-    import requests
-
     adapter = AnthropicProviderAdapter()
     endpoint = f"{base_url.rstrip('/')}/v1/messages"
     headers = {
@@ -250,7 +340,7 @@ def build_anthropic_llm_run(
         "stream": stream,
         "max_tokens": 256,
     }
-    post_fn = request_post or requests.post
+    post_fn = _resolve_post(request_post, session)
     effective_policy = redaction_policy or DEFAULT_REDACTION_POLICY
 
     with capture_run(
@@ -285,13 +375,19 @@ def build_anthropic_llm_run(
             timeout=timeout_seconds,
             stream=stream,
         )
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
 
-        if stream:
-            raw_chunks = list(_iter_sse_json_chunks(response))
-            normalized_response = assemble_stream_capture(adapter, chunks=raw_chunks)
-        else:
-            normalized_response = adapter.normalize_response(response=response.json())
+            if stream:
+                normalized_response = assemble_stream_capture(
+                    adapter,
+                    chunks=_iter_sse_json_chunks(response),
+                    collect_chunks=True,
+                )
+            else:
+                normalized_response = adapter.normalize_response(response=response.json())
+        finally:
+            _close_response(response)
 
         context.record_step(
             "model.response",
@@ -325,10 +421,9 @@ def build_google_llm_run(
     timestamp: str = "2026-02-22T00:00:00Z",
     redaction_policy: RedactionPolicy | None = None,
     request_post: Callable[..., Any] | None = None,
+    session: Any | None = None,
 ) -> Run:
     """Build Google provider run with adapter-normalized steps."""
-    import requests
-
     adapter = GoogleProviderAdapter()
     endpoint = f"{base_url.rstrip('/')}/v1beta/models/{model}:generateContent"
     headers = {
@@ -339,7 +434,7 @@ def build_google_llm_run(
         "contents": [{"role": "user", "parts": [{"text": prompt}]}],
         "stream": stream,
     }
-    post_fn = request_post or requests.post
+    post_fn = _resolve_post(request_post, session)
     effective_policy = redaction_policy or DEFAULT_REDACTION_POLICY
 
     with capture_run(
@@ -374,13 +469,19 @@ def build_google_llm_run(
             timeout=timeout_seconds,
             stream=stream,
         )
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
 
-        if stream:
-            raw_chunks = list(_iter_sse_json_chunks(response))
-            normalized_response = assemble_stream_capture(adapter, chunks=raw_chunks)
-        else:
-            normalized_response = adapter.normalize_response(response=response.json())
+            if stream:
+                normalized_response = assemble_stream_capture(
+                    adapter,
+                    chunks=_iter_sse_json_chunks(response),
+                    collect_chunks=True,
+                )
+            else:
+                normalized_response = adapter.normalize_response(response=response.json())
+        finally:
+            _close_response(response)
 
         context.record_step(
             "model.response",
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import math
 import tempfile
 import time
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 from replaypack.artifact import read_artifact, write_artifact
 from replaypack.capture import build_demo_run
@@ -21,6 +23,11 @@ DURATION_METADATA_KEYS: tuple[str, ...] = (
     "wall_time_ms",
     "elapsed_ms",
 )
+_DURATION_KEYS: frozenset[str] = frozenset(DURATION_METADATA_KEYS)
+_NS_PER_MS = 1_000_000
+
+_WORKLOAD_NAMES: tuple[str, ...] = ("record", "replay", "diff")
+_DIFF_CANDIDATE_PATH = Path("examples/runs/m4_diverged_from_m2.rpk")
 
 SlowdownGateStatus = Literal[
     "not_requested",
@@ -142,22 +149,24 @@ class BenchmarkGateResult:
 
 def summarize_run_timing(run: Run) -> TimingSummary:
     """Summarize step-level duration metadata from a run."""
-    total_duration_ms = 0.0
+    # Durations are summed as integer nanoseconds (exact, no per-step decimal
+    # rounding) and converted to milliseconds once.
+    total_duration_ns = 0
     measured_steps = 0
-    missing_steps = 0
+    extract = _step_duration_ns
 
-    for step in run.steps:
-        duration = extract_step_duration_ms(step)
-        if duration is None:
-            missing_steps += 1
+    steps = run.steps
+    for step in steps:
+        duration_ns = extract(step)
+        if duration_ns is None:
             continue
-        total_duration_ms += duration
+        total_duration_ns += duration_ns
         measured_steps += 1
 
     return TimingSummary(
-        total_duration_ms=round(total_duration_ms, 6),
+        total_duration_ms=total_duration_ns / _NS_PER_MS,
         measured_steps=measured_steps,
-        missing_steps=missing_steps,
+        missing_steps=len(steps) - measured_steps,
     )
 
 
@@ -226,48 +235,44 @@ def run_benchmark_suite(
     *,
     source_artifact: str | Path,
     iterations: int = 5,
+    sequential: bool = True,
 ) -> BenchmarkSuiteResult:
-    """Run representative record/replay/diff benchmark workloads."""
+    """Run representative record/replay/diff benchmark workloads.
+
+    ``sequential=False`` runs the three workloads in separate processes so they
+    overlap; timings are then parallel wall-clock and only comparable with a
+    baseline measured the same way. Slowdown gates should keep the default.
+    """
     if iterations < 1:
         raise ValueError("iterations must be >= 1")
 
+    # Both runs are decoded exactly once, before any timed loop, and shared
+    # by every iteration (and pickled once per worker in parallel mode).
     source_path = Path(source_artifact)
     source_run = read_artifact(source_path)
-
-    diverged_path = Path("examples/runs/m4_diverged_from_m2.rpk")
-    diff_candidate = read_artifact(diverged_path) if diverged_path.exists() else source_run
+    diff_candidate = _read_diff_candidate(source_path, source_run)
 
     with tempfile.TemporaryDirectory(prefix="replaykit-benchmark-") as temp_dir:
         temp = Path(temp_dir)
-        workloads = {
-            "record": _measure_workload(
-                "record",
-                iterations,
-                lambda i: write_artifact(
-                    build_demo_run(),
-                    temp / f"record-{i:03d}.rpk",
-                ),
-            ),
-            "replay": _measure_workload(
-                "replay",
-                iterations,
-                lambda i: write_replay_stub_artifact(
-                    source_run,
-                    temp / f"replay-{i:03d}.rpk",
-                    config=ReplayConfig(seed=21, fixed_clock="2026-02-21T18:00:00Z"),
-                ),
-            ),
-            "diff": _measure_workload(
-                "diff",
-                iterations,
-                lambda _i: diff_runs(
-                    source_run,
-                    diff_candidate,
-                    stop_at_first_divergence=False,
-                    max_changes_per_step=8,
-                ),
-            ),
-        }
+        if sequential:
+            workloads = {
+                name: _run_workload(name, iterations, temp, source_run, diff_candidate)
+                for name in _WORKLOAD_NAMES
+            }
+        else:
+            with ProcessPoolExecutor(max_workers=len(_WORKLOAD_NAMES)) as executor:
+                futures = {
+                    name: executor.submit(
+                        _run_workload,
+                        name,
+                        iterations,
+                        temp / name,
+                        source_run,
+                        diff_candidate,
+                    )
+                    for name in _WORKLOAD_NAMES
+                }
+                workloads = {name: future.result() for name, future in futures.items()}
 
     total_mean_ms = round(sum(workload.mean_ms for workload in workloads.values()), 6)
     return BenchmarkSuiteResult(
@@ -283,8 +288,13 @@ def evaluate_benchmark_slowdown_gate(
     baseline_payload: dict[str, Any] | None,
     *,
     threshold_percent: float | None,
+    short_circuit: bool = False,
 ) -> BenchmarkGateResult:
-    """Evaluate benchmark slowdown against a baseline benchmark payload."""
+    """Evaluate benchmark slowdown against a baseline benchmark payload.
+
+    With ``short_circuit=True`` evaluation stops at the first failing workload,
+    so the result lists only that workload; the default reports every one.
+    """
     if threshold_percent is None:
         return BenchmarkGateResult(
             status="not_requested",
@@ -324,12 +334,16 @@ def evaluate_benchmark_slowdown_gate(
         baseline_mean = _to_float(baseline_entry.get("mean_ms")) if baseline_entry else None
         if baseline_mean is None or baseline_mean <= 0:
             failures.append(name)
+            if short_circuit:
+                break
             continue
         slowdown_percent = ((current_stats.mean_ms - baseline_mean) / baseline_mean) * 100.0
         slowdown_percent = round(slowdown_percent, 6)
         slowdowns[name] = slowdown_percent
         if slowdown_percent > threshold_percent:
             failures.append(name)
+            if short_circuit:
+                break
 
     if failures:
         return BenchmarkGateResult(
@@ -353,33 +367,101 @@ def evaluate_benchmark_slowdown_gate(
 
 def extract_step_duration_ms(step: Step) -> float | None:
     """Extract best-effort step duration in milliseconds from metadata."""
+    duration_ns = _step_duration_ns(step)
+    if duration_ns is None:
+        return None
+    return duration_ns / _NS_PER_MS
+
+
+def _step_duration_ns(step: Step) -> int | None:
+    metadata = step.metadata
+    # Most steps carry no duration key; one C-level set intersection rejects
+    # them without probing each candidate key.
+    present = _DURATION_KEYS & metadata.keys()
+    if not present:
+        return None
+    to_float = _to_float
     for key in DURATION_METADATA_KEYS:
-        if key not in step.metadata:
+        if key not in present:
             continue
-        value = _to_float(step.metadata.get(key))
-        if value is None:
+        raw = metadata[key]
+        if raw is None:
             continue
-        if value < 0:
+        value = to_float(raw)
+        if value is None or value < 0:
             continue
-        return round(value, 6)
+        duration_ns = value * _NS_PER_MS
+        # Finite milliseconds can still overflow once scaled; round() of inf
+        # would raise, so such values are skipped like unparseable ones.
+        if not math.isfinite(duration_ns):
+            continue
+        return round(duration_ns)
     return None
 
 
+def _read_diff_candidate(source_path: Path, source_run: Run) -> Run:
+    diverged_path = _DIFF_CANDIDATE_PATH
+    try:
+        if diverged_path.resolve() == source_path.resolve():
+            return source_run
+        return read_artifact(diverged_path)
+    except FileNotFoundError:
+        return source_run
+
+
+def _run_workload(
+    name: str,
+    iterations: int,
+    temp: Path,
+    source_run: Run,
+    diff_candidate: Run,
+) -> BenchmarkWorkloadStats:
+    # Module-level so it can be pickled into a worker process.
+    temp.mkdir(parents=True, exist_ok=True)
+    if name == "record":
+        # Built once outside the timed loop; write_artifact does not mutate the
+        # run, so every iteration measures only serialization and file I/O.
+        demo_run = build_demo_run()
+        fn = lambda i: write_artifact(
+            demo_run,
+            temp / f"record-{i:03d}.rpk",
+        )
+    elif name == "replay":
+        fn = lambda i: write_replay_stub_artifact(
+            source_run,
+            temp / f"replay-{i:03d}.rpk",
+            config=ReplayConfig(seed=21, fixed_clock="2026-02-21T18:00:00Z"),
+        )
+    elif name == "diff":
+        fn = lambda _i: diff_runs(
+            source_run,
+            diff_candidate,
+            stop_at_first_divergence=False,
+            max_changes_per_step=8,
+        )
+    else:
+        raise ValueError(f"unknown benchmark workload: {name}")
+    return _measure_workload(name, iterations, fn)
+
+
 def _measure_workload(
     name: str,
     iterations: int,
     fn: Any,
 ) -> BenchmarkWorkloadStats:
-    samples: list[float] = []
+    # Integer nanosecond samples; conversion to milliseconds happens once, and
+    # dividing whole nanoseconds already yields at most six decimals.
+    samples = array.array("q")
+    append = samples.append
+    clock = time.perf_counter_ns
     for index in range(iterations):
-        start = time.perf_counter()
+        start = clock()
         fn(index)
-        end = time.perf_counter()
-        samples.append((end - start) * 1000.0)
+        append(clock() - start)
 
-    min_ms = round(min(samples), 6)
-    max_ms = round(max(samples), 6)
-    mean_ms = round(sum(samples) / len(samples), 6)
+    min_ms = min(samples) / _NS_PER_MS
+    max_ms = max(samples) / _NS_PER_MS
+    mean_ms = round(sum(samples) / len(samples)) / _NS_PER_MS
     return BenchmarkWorkloadStats(
         name=name,
         iterations=iterations,
@@ -401,21 +483,38 @@ def _extract_baseline_workloads(payload: dict[str, Any]) -> dict[str, Any]:
 
 
 def _to_float(value: Any) -> float | None:
+    # One dict lookup on the exact type replaces the isinstance cascade for
+    # the usual shapes. bool is deliberately absent (type(True) is bool), and
+    # subclasses such as IntEnum fall through to the generic checks.
+    coerce = _FLOAT_COERCERS.get(type(value))
+    if coerce is not None:
+        return coerce(value)
     if isinstance(value, bool) or value is None:
         return None
     if isinstance(value, (int, float)):
-        if not math.isfinite(float(value)):
-            return None
-        return float(value)
+        return _finite_float(float(value))
     if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return None
-        try:
-            parsed = float(text)
-        except ValueError:
-            return None
-        if not math.isfinite(parsed):
-            return None
-        return parsed
+        return _parse_float_text(value)
     return None
+
+
+def _finite_float(value: float) -> float | None:
+    return value if math.isfinite(value) else None
+
+
+def _parse_float_text(value: str) -> float | None:
+    text = value.strip()
+    if not text:
+        return None
+    try:
+        parsed = float(text)
+    except ValueError:
+        return None
+    return _finite_float(parsed)
+
+
+_FLOAT_COERCERS: dict[type, Callable[[Any], float | None]] = {
+    float: _finite_float,
+    int: float,
+    str: _parse_float_text,
+}
@@ -15,7 +15,11 @@ from replaypack.plugins.base import (
 )
 from replaypack.plugins.exceptions import PluginConfigError, PluginError, PluginLoadError
 from replaypack.plugins.fake_provider_adapter import FakeProviderAdapter
-from replaypack.plugins.loader import load_plugin_manager_from_file
+from replaypack.plugins.loader import (
+    clear_entrypoint_cache,
+    clear_plugin_config_cache,
+    load_plugin_manager_from_file,
+)
 from replaypack.plugins.manager import PluginDiagnostic, PluginManager
 from replaypack.plugins.provider_api import ProviderAdapter
 from replaypack.plugins.reference import LifecycleTracePlugin
@@ -47,6 +51,8 @@ __all__ = [
     "PluginManager",
     "LifecycleTracePlugin",
     "load_plugin_manager_from_file",
+    "clear_plugin_config_cache",
+    "clear_entrypoint_cache",
     "get_active_plugin_manager",
     "use_plugin_manager",
     "use_plugins_from_config",
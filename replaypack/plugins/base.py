@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any, Literal
 
 PLUGIN_API_VERSION = "1.0"
@@ -18,7 +18,7 @@ class CaptureStartEvent:
     timestamp: str
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {"run_id": self.run_id, "timestamp": self.timestamp}
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,7 +29,14 @@ class CaptureStepEvent:
     metadata: dict[str, Any]
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Shallow copy: the capture context already hands each event its own
+        # metadata dict, so a recursive dataclass walk per step buys nothing.
+        return {
+            "run_id": self.run_id,
+            "step_id": self.step_id,
+            "step_type": self.step_type,
+            "metadata": dict(self.metadata),
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,7 +48,13 @@ class CaptureEndEvent:
     error_message: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "run_id": self.run_id,
+            "step_count": self.step_count,
+            "status": self.status,
+            "error_type": self.error_type,
+            "error_message": self.error_message,
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,7 +67,14 @@ class ReplayStartEvent:
     source_step_count: int
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "mode": self.mode,
+            "source_run_id": self.source_run_id,
+            "rerun_from_run_id": self.rerun_from_run_id,
+            "seed": self.seed,
+            "fixed_clock": self.fixed_clock,
+            "source_step_count": self.source_step_count,
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,7 +89,16 @@ class ReplayEndEvent:
     error_message: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "mode": self.mode,
+            "source_run_id": self.source_run_id,
+            "rerun_from_run_id": self.rerun_from_run_id,
+            "status": self.status,
+            "replay_run_id": self.replay_run_id,
+            "step_count": self.step_count,
+            "error_type": self.error_type,
+            "error_message": self.error_message,
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -82,7 +111,14 @@ class DiffStartEvent:
     total_right_steps: int
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "left_run_id": self.left_run_id,
+            "right_run_id": self.right_run_id,
+            "stop_at_first_divergence": self.stop_at_first_divergence,
+            "max_changes_per_step": self.max_changes_per_step,
+            "total_left_steps": self.total_left_steps,
+            "total_right_steps": self.total_right_steps,
+        }
 
 
 @dataclass(frozen=True, slots=True)
@@ -97,7 +133,16 @@ class DiffEndEvent:
     error_message: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "left_run_id": self.left_run_id,
+            "right_run_id": self.right_run_id,
+            "status": self.status,
+            "identical": self.identical,
+            "first_divergence_index": self.first_divergence_index,
+            "summary": None if self.summary is None else dict(self.summary),
+            "error_type": self.error_type,
+            "error_message": self.error_message,
+        }
 
 
 class LifecyclePlugin:
@@ -30,18 +30,18 @@ class FakeProviderAdapter(ProviderAdapter):
     def capture_stream(self, *, chunks: Iterable[Any]) -> dict[str, Any]:
         captured_chunks: list[Any] = []
         assembled: list[str] = []
+        captured_append = captured_chunks.append
+        assembled_append = assembled.append
         for chunk in chunks:
-            captured_chunks.append(chunk)
-            if isinstance(chunk, dict):
-                choices = chunk.get("choices")
-                if isinstance(choices, list) and choices:
-                    first = choices[0]
-                    if isinstance(first, dict):
-                        delta = first.get("delta")
-                        if isinstance(delta, dict):
-                            content = delta.get("content")
-                            if isinstance(content, str):
-                                assembled.append(content)
+            captured_append(chunk)
+            # Well-formed chunks take the direct lookup; anything missing or
+            # mis-shaped along the path is skipped via the exception.
+            try:
+                content = chunk["choices"][0]["delta"]["content"]
+            except (KeyError, TypeError, IndexError):
+                continue
+            if type(content) is str:
+                assembled_append(content)
         return {
             "provider": self.name,
             "stream": True,
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 import importlib
-import inspect
 import json
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 from replaypack.plugins.base import PLUGIN_API_VERSION, PLUGIN_CONFIG_VERSION
@@ -13,13 +15,79 @@ from replaypack.plugins.exceptions import PluginConfigError, PluginLoadError
 from replaypack.plugins.manager import PluginManager
 
 
+# Validated (entrypoint, options, index) specs per config path and exact file
+# contents. Plugin instances are never cached: every load builds a fresh
+# manager, so diagnostics and plugin state do not leak between scopes.
+_PluginSpec = tuple[str, dict[str, Any], int]
+_CONFIG_CACHE: dict[tuple[str, bytes], tuple[_PluginSpec, ...]] = {}
+_CONFIG_CACHE_MAX = 32
+_SUPPORTED_PLUGIN_KEYS: frozenset[str] = frozenset({"entrypoint", "options", "enabled"})
+_EXPECTED_API_MAJOR = PLUGIN_API_VERSION.split(".", 1)[0]
+_EXPECTED_API_MAJOR_PREFIX = f"{_EXPECTED_API_MAJOR}."
+
+
 def load_plugin_manager_from_file(path: str | Path) -> PluginManager:
-    """Load a plugin manager from JSON config."""
+    """Load a plugin manager from JSON config.
+
+    Parsing and validation are memoized by path and file contents; each call
+    still returns a new manager with freshly instantiated plugins.
+    """
     config_path = Path(path)
+    raw_bytes = config_path.read_bytes()
+    # Errors report the path as given; only the cache key is resolved.
+    cache_key = (str(config_path.resolve()), raw_bytes)
+    specs = _CONFIG_CACHE.get(cache_key)
+    if specs is None:
+        specs = _parse_plugin_config(config_path, raw_bytes)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+        _CONFIG_CACHE[cache_key] = specs
+
+    plugins: list[object] = []
+    for entrypoint, options, index in specs:
+        target = _import_entrypoint(entrypoint, index=index)
+        plugin = _instantiate_plugin(
+            target,
+            entrypoint=entrypoint,
+            options=copy.deepcopy(options),
+            index=index,
+        )
+        _validate_api_version(plugin, entrypoint=entrypoint, index=index)
+        plugins.append(plugin)
+    return PluginManager(plugins=tuple(plugins))
+
+
+def clear_plugin_config_cache() -> None:
+    """Drop memoized plugin configs so the next load re-parses them."""
+    _CONFIG_CACHE.clear()
+
+
+def resolve_entrypoint(entrypoint: str) -> object:
+    """Import `module:attribute` and return the attribute.
+
+    Only the module import is memoized; the attribute is looked up on every
+    call so reassigned or patched attributes are picked up. Failures are not
+    cached; callers wrap them with their own context.
+    """
+    module_name, _, attribute = entrypoint.partition(":")
+    return getattr(_import_module(module_name), attribute)
+
+
+@lru_cache(maxsize=256)
+def _import_module(module_name: str) -> ModuleType:
+    return importlib.import_module(module_name)
+
+
+def clear_entrypoint_cache() -> None:
+    """Forget imported entrypoint modules (for tests that rewrite plugin modules)."""
+    _import_module.cache_clear()
+
+
+def _parse_plugin_config(config_path: Path, raw_bytes: bytes) -> tuple[_PluginSpec, ...]:
     try:
-        raw = json.loads(config_path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        raise
+        # json.loads accepts bytes and decodes them in C; no separate text
+        # decode of the whole file first.
+        raw = json.loads(raw_bytes)
     except json.JSONDecodeError as error:
         raise PluginConfigError(f"Invalid plugin config JSON ({config_path}): {error}") from error
 
@@ -37,22 +105,21 @@ def load_plugin_manager_from_file(path: str | Path) -> PluginManager:
     if not isinstance(plugins_payload, list):
         raise PluginConfigError("Plugin config key 'plugins' must be a JSON array.")
 
-    plugins: list[object] = []
+    specs: list[_PluginSpec] = []
     for index, payload in enumerate(plugins_payload, start=1):
-        plugin = _load_plugin_payload(payload, index=index)
-        if plugin is not None:
-            plugins.append(plugin)
+        spec = _parse_plugin_payload(payload, index=index)
+        if spec is not None:
+            specs.append(spec)
+    return tuple(specs)
 
-    return PluginManager(plugins=tuple(plugins))
 
-
-def _load_plugin_payload(payload: Any, *, index: int) -> object | None:
+def _parse_plugin_payload(payload: Any, *, index: int) -> _PluginSpec | None:
     if not isinstance(payload, dict):
         raise PluginConfigError(f"Plugin entry #{index} must be a JSON object.")
 
-    supported_keys = {"entrypoint", "options", "enabled"}
-    unknown = sorted(set(payload.keys()) - supported_keys)
+    unknown = [key for key in payload if key not in _SUPPORTED_PLUGIN_KEYS]
     if unknown:
+        unknown.sort()
         raise PluginConfigError(
             f"Plugin entry #{index} contains unsupported keys: {', '.join(unknown)}"
         )
@@ -72,17 +139,13 @@ def _load_plugin_payload(payload: Any, *, index: int) -> object | None:
     options = payload.get("options", {})
     if not isinstance(options, dict):
         raise PluginConfigError(f"Plugin entry #{index} key 'options' must be a JSON object.")
-
-    target = _import_entrypoint(entrypoint, index=index)
-    plugin = _instantiate_plugin(target, entrypoint=entrypoint, options=options, index=index)
-    _validate_api_version(plugin, entrypoint=entrypoint, index=index)
-    return plugin
+    return entrypoint, options, index
 
 
 def _import_entrypoint(entrypoint: str, *, index: int) -> object:
     module_name, _, attribute = entrypoint.partition(":")
     try:
-        module = importlib.import_module(module_name)
+        module = _import_module(module_name)
     except Exception as error:
         raise PluginLoadError(
             f"Plugin entry #{index} failed to import module '{module_name}': {error}"
@@ -103,7 +166,8 @@ def _instantiate_plugin(
     options: dict[str, Any],
     index: int,
 ) -> object:
-    if inspect.isclass(target) or callable(target):
+    # Classes are callable, so one check covers both factories and classes.
+    if callable(target):
         try:
             return target(**options)
         except Exception as error:
@@ -124,10 +188,9 @@ def _validate_api_version(plugin: object, *, entrypoint: str, index: int) -> Non
     if not _is_supported_api_version(version):
         raise PluginLoadError(
             f"Plugin entry #{index} '{entrypoint}' declares unsupported api_version "
-            f"{version!r}; supported major version is {PLUGIN_API_VERSION.split('.', 1)[0]}."
+            f"{version!r}; supported major version is {_EXPECTED_API_MAJOR}."
         )
 
 
 def _is_supported_api_version(version: str) -> bool:
-    expected_major = PLUGIN_API_VERSION.split(".", 1)[0]
-    return version.split(".", 1)[0] == expected_major
+    return version == _EXPECTED_API_MAJOR or version.startswith(_EXPECTED_API_MAJOR_PREFIX)
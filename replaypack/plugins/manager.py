@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import Any, Callable
+import sys
 import warnings
 
 from replaypack.plugins.base import (
@@ -32,61 +35,194 @@ class PluginDiagnostic:
         }
 
 
+_HOOK_ON_CAPTURE_START = sys.intern("on_capture_start")
+_HOOK_ON_CAPTURE_STEP = sys.intern("on_capture_step")
+_HOOK_ON_CAPTURE_END = sys.intern("on_capture_end")
+_HOOK_ON_REPLAY_START = sys.intern("on_replay_start")
+_HOOK_ON_REPLAY_END = sys.intern("on_replay_end")
+_HOOK_ON_DIFF_START = sys.intern("on_diff_start")
+_HOOK_ON_DIFF_END = sys.intern("on_diff_end")
+
+_HOOK_NAMES: tuple[str, ...] = (
+    _HOOK_ON_CAPTURE_START,
+    _HOOK_ON_CAPTURE_STEP,
+    _HOOK_ON_CAPTURE_END,
+    _HOOK_ON_REPLAY_START,
+    _HOOK_ON_REPLAY_END,
+    _HOOK_ON_DIFF_START,
+    _HOOK_ON_DIFF_END,
+)
+
+_HookCallback = Callable[[Any], Any]
+
+
 @dataclass(slots=True)
 class PluginManager:
     """Executes lifecycle plugin hooks and captures plugin failures."""
 
     plugins: tuple[object, ...] = ()
     diagnostics: list[PluginDiagnostic] = field(default_factory=list)
+    # A failure identical to a retained diagnostic (same plugin, hook, error
+    # type and message) is counted on it instead of appended and warned about
+    # again. The list is capped, dropping the oldest entry and its count.
+    max_diagnostics: int = 1000
+    _diagnostic_counts: dict[PluginDiagnostic, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # Per implemented hook, a tuple of the plugins' bound callbacks, resolved
+    # whenever `plugins` is assigned so dispatch does no getattr per event.
+    # `_hook_plugin_names` holds the matching plugin names at the same
+    # indexes, for diagnostics only.
+    _hooks: dict[str, tuple[_HookCallback, ...]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _hook_plugin_names: dict[str, tuple[str, ...]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    # True when no plugins are loaded (the default), so every `on_*` hook
+    # returns before entering `_dispatch`.
+    _empty: bool = field(init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # `plugins` is stored as a tuple and the hook table is rebuilt on every
+        # assignment, so replacing the loaded plugins is never silently ignored.
+        if name == "plugins":
+            value = tuple(value)
+            object.__setattr__(self, name, value)
+            self._hooks, self._hook_plugin_names = _build_hook_arrays(value)
+            self._empty = not value
+            return
+        object.__setattr__(self, name, value)
 
     def clear_diagnostics(self) -> None:
         self.diagnostics.clear()
+        self._diagnostic_counts.clear()
+
+    def diagnostic_summary(self) -> dict[tuple[str, str, str], int]:
+        """Failure counts of retained diagnostics by `(plugin_name, hook, error_type)`."""
+        summary: dict[tuple[str, str, str], int] = {}
+        for diagnostic, count in self._diagnostic_counts.items():
+            key = (diagnostic.plugin_name, diagnostic.hook, diagnostic.error_type)
+            summary[key] = summary.get(key, 0) + count
+        return summary
 
     def on_capture_start(self, event: CaptureStartEvent) -> None:
-        self._dispatch("on_capture_start", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_CAPTURE_START, event)
 
     def on_capture_step(self, event: CaptureStepEvent) -> None:
-        self._dispatch("on_capture_step", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_CAPTURE_STEP, event)
+
+    def on_capture_steps(self, events: Sequence[CaptureStepEvent]) -> None:
+        """Dispatch a batch of step events in the order per-step calls would.
+
+        Every plugin sees an event before any plugin sees the next one.
+        """
+        if self._empty:
+            return
+        hook = _HOOK_ON_CAPTURE_STEP
+        callbacks = self._hooks.get(hook)
+        if callbacks is None:
+            return
+        plugin_names = self._hook_plugin_names[hook]
+        for event in events:
+            for index, callback in enumerate(callbacks):
+                try:
+                    callback(event)
+                except Exception as error:  # pragma: no cover - defensive isolation
+                    self._record_failure(plugin_names[index], hook, error)
 
     def on_capture_end(self, event: CaptureEndEvent) -> None:
-        self._dispatch("on_capture_end", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_CAPTURE_END, event)
 
     def on_replay_start(self, event: ReplayStartEvent) -> None:
-        self._dispatch("on_replay_start", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_REPLAY_START, event)
 
     def on_replay_end(self, event: ReplayEndEvent) -> None:
-        self._dispatch("on_replay_end", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_REPLAY_END, event)
 
     def on_diff_start(self, event: DiffStartEvent) -> None:
-        self._dispatch("on_diff_start", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_DIFF_START, event)
 
     def on_diff_end(self, event: DiffEndEvent) -> None:
-        self._dispatch("on_diff_end", event)
+        if self._empty:
+            return
+        self._dispatch(_HOOK_ON_DIFF_END, event)
 
     def _dispatch(self, hook: str, event: object) -> None:
-        for plugin in self.plugins:
-            callback = getattr(plugin, hook, None)
-            if callback is None:
-                continue
+        callbacks = self._hooks.get(hook)
+        if callbacks is None:
+            return
+        for index, callback in enumerate(callbacks):
             try:
                 callback(event)
             except Exception as error:  # pragma: no cover - defensive isolation
-                diagnostic = PluginDiagnostic(
-                    plugin_name=_plugin_name(plugin),
-                    hook=hook,
-                    error_type=error.__class__.__name__,
-                    message=str(error),
-                )
-                self.diagnostics.append(diagnostic)
-                warnings.warn(
-                    (
-                        f"ReplayPack plugin failure: plugin={diagnostic.plugin_name} "
-                        f"hook={diagnostic.hook} "
-                        f"error={diagnostic.error_type}: {diagnostic.message}"
-                    ),
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
+                self._record_failure(self._hook_plugin_names[hook][index], hook, error)
+
+    def _record_failure(self, plugin_name: str, hook: str, error: Exception) -> None:
+        diagnostic = PluginDiagnostic(
+            plugin_name=plugin_name,
+            hook=hook,
+            error_type=error.__class__.__name__,
+            message=str(error),
+        )
+        seen = self._diagnostic_counts.get(diagnostic)
+        if seen is not None:
+            self._diagnostic_counts[diagnostic] = seen + 1
+            return
+        self._diagnostic_counts[diagnostic] = 1
+        self.diagnostics.append(diagnostic)
+        if len(self.diagnostics) > self.max_diagnostics:
+            evicted = self.diagnostics.pop(0)
+            self._diagnostic_counts.pop(evicted, None)
+        warnings.warn(
+            (
+                f"ReplayPack plugin failure: plugin={diagnostic.plugin_name} "
+                f"hook={diagnostic.hook} "
+                f"error={diagnostic.error_type}: {diagnostic.message}"
+            ),
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+def _build_hook_arrays(
+    plugins: tuple[object, ...],
+) -> tuple[dict[str, tuple[_HookCallback, ...]], dict[str, tuple[str, ...]]]:
+    callbacks: dict[str, list[_HookCallback]] = {hook: [] for hook in _HOOK_NAMES}
+    names: dict[str, list[str]] = {hook: [] for hook in _HOOK_NAMES}
+    for plugin in plugins:
+        plugin_name = _plugin_name(plugin)
+        for hook in _HOOK_NAMES:
+            callback = getattr(plugin, hook, None)
+            # Non-callable hook attributes stay in the table: calling them
+            # raises TypeError, which dispatch records as a diagnostic.
+            if callback is not None:
+                callbacks[hook].append(callback)
+                names[hook].append(plugin_name)
+    # Hooks no plugin implements are left out, so dispatch sees None.
+    return (
+        {hook: tuple(entries) for hook, entries in callbacks.items() if entries},
+        {hook: tuple(entries) for hook, entries in names.items() if entries},
+    )
 
 
 def _plugin_name(plugin: object) -> str:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+import threading
+from typing import Any, TextIO
 
 from replaypack.plugins.base import (
     CaptureEndEvent,
@@ -18,12 +20,54 @@ from replaypack.plugins.base import (
 )
 
 
+# json.dumps() builds a new JSONEncoder whenever options are passed; one shared
+# instance keeps the per-event cost to the C-accelerated encode itself.
+_TRACE_ENCODER = json.JSONEncoder(
+    ensure_ascii=True,
+    sort_keys=True,
+    separators=(",", ":"),
+)
+_FIELDS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
 @dataclass(slots=True)
 class LifecycleTracePlugin(LifecyclePlugin):
     """Reference plugin that writes lifecycle hooks to NDJSON."""
 
     output_path: str = "runs/plugins/lifecycle-trace.ndjson"
     name: str = "lifecycle-trace"
+    # Records per write. The default writes and flushes every event, so a
+    # crash loses nothing; larger batches are also written at each *_end hook.
+    batch_size: int = 1
+    # Opened on demand and closed at each *_end hook, so the file is not held
+    # open between captures/replays/diffs (and can be rotated or removed).
+    _handle: TextIO | None = field(default=None, init=False, repr=False, compare=False)
+    _buffer: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def flush(self) -> None:
+        """Write any buffered records to the trace file."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush and close the trace file; a later event reopens it."""
+        with self._lock:
+            self._flush_locked()
+            handle = self._handle
+            self._handle = None
+            if handle is not None:
+                handle.close()
+
+    def __del__(self) -> None:
+        # getattr: __init__ may have failed before the slots were assigned.
+        if getattr(self, "_buffer", None) or getattr(self, "_handle", None) is not None:
+            self.close()
 
     def on_capture_start(self, event: CaptureStartEvent) -> None:
         self._append("on_capture_start", event)
@@ -33,34 +77,68 @@ class LifecycleTracePlugin(LifecyclePlugin):
 
     def on_capture_end(self, event: CaptureEndEvent) -> None:
         self._append("on_capture_end", event)
+        self.close()
 
     def on_replay_start(self, event: ReplayStartEvent) -> None:
         self._append("on_replay_start", event)
 
     def on_replay_end(self, event: ReplayEndEvent) -> None:
         self._append("on_replay_end", event)
+        self.close()
 
     def on_diff_start(self, event: DiffStartEvent) -> None:
         self._append("on_diff_start", event)
 
     def on_diff_end(self, event: DiffEndEvent) -> None:
         self._append("on_diff_end", event)
+        self.close()
 
-    def _append(self, hook: str, event: object) -> None:
-        path = Path(self.output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def _append(
+        self,
+        hook: str,
+        event: CaptureStartEvent
+        | CaptureStepEvent
+        | CaptureEndEvent
+        | ReplayStartEvent
+        | ReplayEndEvent
+        | DiffStartEvent
+        | DiffEndEvent,
+    ) -> None:
         payload = {
             "hook": hook,
             "plugin": self.name,
-            "event": asdict(event),
+            "event": _event_to_dict(event),
         }
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(
-                json.dumps(
-                    payload,
-                    ensure_ascii=True,
-                    sort_keys=True,
-                    separators=(",", ":"),
-                )
-                + "\n"
-            )
+        record = _TRACE_ENCODER.encode(payload) + "\n"
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        buffer = self._buffer
+        if not buffer:
+            return
+        handle = self._handle
+        if handle is None:
+            handle = self._open()
+        handle.write("".join(buffer))
+        handle.flush()
+        buffer.clear()
+
+    def _open(self) -> TextIO:
+        path = Path(self.output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = path.open("a", encoding="utf-8")
+        return self._handle
+
+
+def _event_to_dict(event: object) -> dict[str, Any]:
+    # The record is serialized immediately, so a shallow field view suffices:
+    # no copies of nested metadata, and field names are resolved once per class.
+    event_type = type(event)
+    names = _FIELDS_CACHE.get(event_type)
+    if names is None:
+        names = tuple(event_field.name for event_field in fields(event_type))
+        _FIELDS_CACHE[event_type] = names
+    return {name: getattr(event, name) for name in names}
@@ -9,7 +9,11 @@ from pathlib import Path
 from typing import Iterator
 
 from replaypack.plugins.base import PLUGIN_CONFIG_ENV_VAR
-from replaypack.plugins.loader import load_plugin_manager_from_file
+from replaypack.plugins.loader import (
+    clear_entrypoint_cache,
+    clear_plugin_config_cache,
+    load_plugin_manager_from_file,
+)
 from replaypack.plugins.manager import PluginManager
 
 _ACTIVE_PLUGIN_MANAGER: ContextVar[PluginManager | None] = ContextVar(
@@ -58,6 +62,8 @@ def use_plugins_from_config(path: str | Path) -> Iterator[PluginManager]:
 
 
 def reset_plugin_runtime_cache() -> None:
-    """Clear cached env plugin manager (for tests)."""
+    """Clear the cached env plugin manager, parsed configs and entrypoints (for tests)."""
     global _ENV_CACHE
     _ENV_CACHE = None
+    clear_plugin_config_cache()
+    clear_entrypoint_cache()
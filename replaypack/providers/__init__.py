@@ -1,11 +1,9 @@
 """Provider adapter contracts and reference implementations."""
 
 from replaypack.providers.base import ProviderAdapter, assemble_stream_capture
-from replaypack.providers.anthropic import AnthropicProviderAdapter
-from replaypack.providers.fake import FakeProviderAdapter
-from replaypack.providers.google import GoogleProviderAdapter
-from replaypack.providers.openai import OpenAIProviderAdapter
 from replaypack.providers.registry import (
+    _DEFAULT_PROVIDER_ENTRYPOINTS,
+    _load_adapter_class,
     ProviderRegistryError,
     get_provider_adapter,
     initialize_default_provider_adapters,
@@ -19,6 +17,11 @@ from replaypack.providers.registry import (
 
 initialize_default_provider_adapters()
 
+_LAZY_ADAPTER_ENTRYPOINTS = {
+    entrypoint.partition(":")[2]: entrypoint
+    for entrypoint in _DEFAULT_PROVIDER_ENTRYPOINTS.values()
+}
+
 __all__ = [
     "ProviderAdapter",
     "AnthropicProviderAdapter",
@@ -36,3 +39,12 @@ __all__ = [
     "reset_provider_adapter_registry",
     "assemble_stream_capture",
 ]
+
+
+def __getattr__(name: str) -> object:
+    entrypoint = _LAZY_ADAPTER_ENTRYPOINTS.get(name)
+    if entrypoint is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_cls = _load_adapter_class(entrypoint)
+    globals()[name] = adapter_cls
+    return adapter_cls
@@ -43,24 +43,28 @@ def assemble_stream_capture(
     adapter: ProviderAdapter,
     *,
     chunks: Iterable[Any],
+    collect_chunks: bool = True,
 ) -> dict[str, Any]:
-    """Capture stream chunks and deterministically assemble response text."""
-    captured_chunks: list[dict[str, Any]] = []
-    assembled_parts: list[str] = []
-
-    for chunk in chunks:
-        normalized_chunk = adapter.normalize_stream_chunk(chunk=chunk)
-        captured_chunks.append(normalized_chunk)
-
-        delta_text = normalized_chunk.get("delta_text")
-        if isinstance(delta_text, str):
-            assembled_parts.append(delta_text)
+    """Capture stream chunks and deterministically assemble response text.
+
+    With `collect_chunks=False` only the assembled text is kept and `chunks`
+    is returned empty, so long streams are not retained in memory.
+    """
+    normalize = adapter.normalize_stream_chunk
+    if collect_chunks:
+        captured_chunks = [normalize(chunk=chunk) for chunk in chunks]
+        deltas = [chunk.get("delta_text") for chunk in captured_chunks]
+    else:
+        captured_chunks = []
+        deltas = [normalize(chunk=chunk).get("delta_text") for chunk in chunks]
+    # Third-party adapters may return str subclasses, so keep isinstance here.
+    assembled_text = "".join([delta for delta in deltas if isinstance(delta, str)])
 
     return {
         "provider": adapter.name,
         "stream": True,
         "chunks": captured_chunks,
-        "assembled_text": "".join(assembled_parts),
+        "assembled_text": assembled_text,
     }
 
 
@@ -33,18 +33,13 @@ class GoogleProviderAdapter(ProviderAdapter):
 
     def normalize_stream_chunk(self, *, chunk: Any) -> dict[str, Any]:
         delta_text = ""
-        if isinstance(chunk, dict):
-            candidates = chunk.get("candidates")
-            if isinstance(candidates, list) and candidates:
-                first = candidates[0]
-                if isinstance(first, dict):
-                    content = first.get("content")
-                    if isinstance(content, dict):
-                        parts = content.get("parts")
-                        if isinstance(parts, list) and parts:
-                            text = parts[0].get("text") if isinstance(parts[0], dict) else None
-                            if isinstance(text, str):
-                                delta_text = text
+        try:
+            text = chunk["candidates"][0]["content"]["parts"][0]["text"]
+        except (TypeError, KeyError, IndexError):
+            pass
+        else:
+            if type(text) is str:
+                delta_text = text
         return {"provider": self.name, "chunk": chunk, "delta_text": delta_text}
 
     def normalize_response(self, *, response: Any) -> dict[str, Any]:
@@ -33,16 +33,13 @@ class OpenAIProviderAdapter(ProviderAdapter):
 
     def normalize_stream_chunk(self, *, chunk: Any) -> dict[str, Any]:
         delta_text = ""
-        if isinstance(chunk, dict):
-            choices = chunk.get("choices")
-            if isinstance(choices, list) and choices:
-                first = choices[0]
-                if isinstance(first, dict):
-                    delta = first.get("delta")
-                    if isinstance(delta, dict):
-                        content = delta.get("content")
-                        if isinstance(content, str):
-                            delta_text = content
+        try:
+            content = chunk["choices"][0]["delta"]["content"]
+        except (TypeError, KeyError, IndexError):
+            pass
+        else:
+            if type(content) is str:
+                delta_text = content
         return {"provider": self.name, "chunk": chunk, "delta_text": delta_text}
 
     def normalize_response(self, *, response: Any) -> dict[str, Any]:
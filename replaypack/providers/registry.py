@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-import importlib
 from typing import Any, Callable
 
+from replaypack.plugins.loader import clear_entrypoint_cache, resolve_entrypoint
 from replaypack.providers.base import ProviderAdapter
 
 ProviderFactory = Callable[[], ProviderAdapter]
 _PROVIDER_REGISTRY: dict[str, ProviderFactory] = {}
+# Built-in adapters are registered by entrypoint and imported on first use,
+# so touching `replaypack.providers` does not load every provider module.
+_DEFAULT_PROVIDER_ENTRYPOINTS: dict[str, str] = {
+    "anthropic": "replaypack.providers.anthropic:AnthropicProviderAdapter",
+    "fake": "replaypack.providers.fake:FakeProviderAdapter",
+    "google": "replaypack.providers.google:GoogleProviderAdapter",
+    "openai": "replaypack.providers.openai:OpenAIProviderAdapter",
+}
 
 
 class ProviderRegistryError(ValueError):
@@ -44,13 +52,11 @@ def register_provider_adapter_entrypoint(
     *,
     overwrite: bool = False,
 ) -> None:
-    module_name, separator, attr = entrypoint.partition(":")
-    if not separator:
+    if ":" not in entrypoint:
         raise ProviderRegistryError(
             f"Invalid provider adapter entrypoint '{entrypoint}'. Expected module:attribute."
         )
-    module = importlib.import_module(module_name)
-    target = getattr(module, attr)
+    target = resolve_entrypoint(entrypoint)
     if isinstance(target, type):
         adapter_cls = target
     elif callable(target):
@@ -77,24 +83,14 @@ def list_provider_adapter_keys() -> tuple[str, ...]:
 
 def reset_provider_adapter_registry() -> None:
     _PROVIDER_REGISTRY.clear()
+    clear_entrypoint_cache()
 
 
 def initialize_default_provider_adapters(*, overwrite: bool = False) -> None:
-    from replaypack.providers.anthropic import AnthropicProviderAdapter
-    from replaypack.providers.fake import FakeProviderAdapter
-    from replaypack.providers.google import GoogleProviderAdapter
-    from replaypack.providers.openai import OpenAIProviderAdapter
-
-    defaults: dict[str, type[ProviderAdapter]] = {
-        "anthropic": AnthropicProviderAdapter,
-        "fake": FakeProviderAdapter,
-        "google": GoogleProviderAdapter,
-        "openai": OpenAIProviderAdapter,
-    }
-    for key, adapter_cls in defaults.items():
+    for key, entrypoint in _DEFAULT_PROVIDER_ENTRYPOINTS.items():
         if key in _PROVIDER_REGISTRY and not overwrite:
             continue
-        register_provider_adapter_class(key, adapter_cls, overwrite=True)
+        register_provider_adapter(key, _lazy_adapter_factory(entrypoint), overwrite=True)
 
 
 def load_provider_adapters_from_plugins(
@@ -108,3 +104,14 @@ def load_provider_adapters_from_plugins(
     for key, entrypoint in plugins.items():
         register_provider_adapter_entrypoint(key, entrypoint, overwrite=overwrite)
 
+
+
+def _load_adapter_class(entrypoint: str) -> type[ProviderAdapter]:
+    return resolve_entrypoint(entrypoint)  # type: ignore[return-value]
+
+
+def _lazy_adapter_factory(entrypoint: str) -> ProviderFactory:
+    def factory() -> ProviderAdapter:
+        return _load_adapter_class(entrypoint)()
+
+    return factory
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import sha256
+import os
 import random
 import socket
-from typing import Iterator, Literal
+import sys
+import threading
+from typing import Any, Callable, ContextManager, Iterator, Literal
 
 from replaypack.artifact import write_artifact
 from replaypack.core.canonical import canonical_json
+from replaypack.core.hashing import compute_step_hash
 from replaypack.core.models import Run, Step
 from replaypack.core.types import STEP_TYPES
 from replaypack.plugins import ReplayEndEvent, ReplayStartEvent, get_active_plugin_manager
@@ -18,6 +25,12 @@ from replaypack.replay.exceptions import ReplayConfigError
 
 ReplayMode = Literal["stub", "hybrid"]
 
+_PARALLEL_HASH_MIN_STEPS = 256
+_OFFLINE_STATE = threading.local()
+_GUARD_LOCK = threading.Lock()
+_guard_depth = 0
+_original_create_connection: Callable[..., socket.socket] = socket.create_connection
+
 
 @dataclass(slots=True)
 class ReplayConfig:
@@ -25,6 +38,9 @@ class ReplayConfig:
 
     seed: int = 0
     fixed_clock: str = "2026-01-01T00:00:00Z"
+    # The engine itself never touches the network; callers replaying in tight
+    # loops may drop the socket guard, but it stays on by default.
+    enforce_offline: bool = True
 
     def __post_init__(self) -> None:
         if not isinstance(self.seed, int):
@@ -39,10 +55,15 @@ class HybridReplayPolicy:
     rerun_step_types: tuple[str, ...] = field(default_factory=tuple)
     rerun_step_ids: tuple[str, ...] = field(default_factory=tuple)
     strict_alignment: bool = True
+    # Hashed views of the selectors for per-step membership checks.
+    _rerun_types_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    _rerun_ids_set: frozenset[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.rerun_step_types = _normalize_selector_tuple(self.rerun_step_types)
         self.rerun_step_ids = _normalize_selector_tuple(self.rerun_step_ids)
+        self._rerun_types_set = frozenset(self.rerun_step_types)
+        self._rerun_ids_set = frozenset(self.rerun_step_ids)
 
         unsupported = [step_type for step_type in self.rerun_step_types if step_type not in STEP_TYPES]
         if unsupported:
@@ -60,7 +81,7 @@ class HybridReplayPolicy:
         return bool(self.rerun_step_types) or bool(self.rerun_step_ids)
 
     def should_rerun(self, step: Step) -> bool:
-        return step.type in self.rerun_step_types or step.id in self.rerun_step_ids
+        return step.type in self._rerun_types_set or step.id in self._rerun_ids_set
 
     def to_dict(self) -> dict[str, object]:
         return {
@@ -70,7 +91,12 @@ class HybridReplayPolicy:
         }
 
 
+@lru_cache(maxsize=64)
 def normalize_fixed_clock(value: str) -> str:
+    """Return `value` as a UTC ISO-8601 string with microseconds and `Z`.
+
+    Pure, so results are memoized; a handful of distinct clocks is typical.
+    """
     parse_target = value[:-1] + "+00:00" if value.endswith("Z") else value
     try:
         parsed = datetime.fromisoformat(parse_target)
@@ -103,7 +129,7 @@ def replay_stub_run(source_run: Run, *, config: ReplayConfig | None = None) -> R
     )
 
     try:
-        with deterministic_runtime(seed=cfg.seed), offline_network_guard():
+        with deterministic_runtime(seed=cfg.seed), _replay_network_guard(cfg):
             replay_steps = _replay_steps_stub(source_run)
 
         replay_id = _deterministic_stub_replay_id(source_run, cfg)
@@ -178,7 +204,7 @@ def replay_hybrid_run(
     )
 
     try:
-        with deterministic_runtime(seed=cfg.seed), offline_network_guard():
+        with deterministic_runtime(seed=cfg.seed), _replay_network_guard(cfg):
             replay_steps = _replay_steps_hybrid(
                 source_run=source_run,
                 rerun_run=rerun_run,
@@ -309,35 +335,69 @@ def deterministic_runtime(*, seed: int) -> Iterator[None]:
 
 @contextmanager
 def offline_network_guard() -> Iterator[None]:
-    """Block outbound network connection attempts during replay."""
-    original_create_connection = socket.create_connection
-
-    def blocked(*_args, **_kwargs):
-        raise RuntimeError("offline replay forbids outbound network calls")
-
-    socket.create_connection = blocked
+    """Block outbound network connection attempts during replay.
+
+    `socket.create_connection` is wrapped while any guard is active; only
+    threads inside a guard are blocked, and guards may nest.
+    """
+    _acquire_network_guard()
+    previous = getattr(_OFFLINE_STATE, "active", False)
+    _OFFLINE_STATE.active = True
     try:
         yield
     finally:
-        socket.create_connection = original_create_connection
+        _OFFLINE_STATE.active = previous
+        _release_network_guard()
+
+
+def _replay_network_guard(config: ReplayConfig) -> ContextManager[None]:
+    return offline_network_guard() if config.enforce_offline else nullcontext()
+
+
+def _acquire_network_guard() -> None:
+    global _guard_depth, _original_create_connection
+    with _GUARD_LOCK:
+        if _guard_depth == 0:
+            _original_create_connection = socket.create_connection
+            socket.create_connection = _guarded_create_connection
+        _guard_depth += 1
+
+
+def _release_network_guard() -> None:
+    global _guard_depth
+    with _GUARD_LOCK:
+        _guard_depth -= 1
+        if _guard_depth == 0 and socket.create_connection is _guarded_create_connection:
+            socket.create_connection = _original_create_connection
+
+
+def _guarded_create_connection(*args: Any, **kwargs: Any) -> socket.socket:
+    if getattr(_OFFLINE_STATE, "active", False):
+        raise RuntimeError("offline replay forbids outbound network calls")
+    return _original_create_connection(*args, **kwargs)
 
 
 def _replay_steps_stub(source_run: Run) -> list[Step]:
+    # The replay metadata is a fresh dict already, so hash the steps in place
+    # rather than going through with_hash(), which copies step and metadata.
     replay_steps: list[Step] = []
-    for index, source_step in enumerate(source_run.steps, start=1):
-        replay_steps.append(
+    append = replay_steps.append
+    for step_id, source_step in zip(_replay_step_ids(len(source_run.steps)), source_run.steps):
+        metadata = {
+            **source_step.metadata,
+            "source_step_id": source_step.id,
+            "replay_strategy": "stub",
+        }
+        append(
             Step(
-                id=f"step-{index:06d}",
+                id=step_id,
                 type=source_step.type,
                 input=source_step.input,
                 output=source_step.output,
-                metadata={
-                    **source_step.metadata,
-                    "source_step_id": source_step.id,
-                    "replay_strategy": "stub",
-                },
-            ).with_hash()
+                metadata=metadata,
+            )
         )
+    _assign_step_hashes(replay_steps)
     return replay_steps
 
 
@@ -348,22 +408,42 @@ def _replay_steps_hybrid(*, source_run: Run, rerun_run: Run, policy: HybridRepla
             "when strict_alignment=True."
         )
 
-    replay_steps: list[Step] = []
-    rerun_count = 0
+    # Selector phase first, so a policy that matches nothing fails before any
+    # replay steps are built; the build loop then just reads the mask.
+    source_steps = source_run.steps
+    rerun_steps = rerun_run.steps
+    should_rerun = policy.should_rerun
+    rerun_mask = [should_rerun(step) for step in source_steps]
+    if not any(rerun_mask):
+        raise ReplayConfigError(
+            "Hybrid replay selectors matched zero source steps; "
+            "adjust rerun_step_types/rerun_step_ids."
+        )
 
-    for index, source_step in enumerate(source_run.steps, start=1):
-        rerun_selected = policy.should_rerun(source_step)
-        metadata = dict(source_step.metadata)
-        replay_input = source_step.input
-        replay_output = source_step.output
+    # Only a non-strict policy can select a step past the end of the rerun
+    # run. Find the first such step up front and build only the steps before
+    # it, so the loop needs no bounds check and earlier errors still win.
+    unaligned_index: int | None = None
+    if len(rerun_steps) < len(source_steps):
+        unaligned_index = next(
+            (
+                index
+                for index in range(len(rerun_steps) + 1, len(source_steps) + 1)
+                if rerun_mask[index - 1]
+            ),
+            None,
+        )
+    build_count = len(source_steps) if unaligned_index is None else unaligned_index - 1
 
+    replay_steps: list[Step] = []
+    append = replay_steps.append
+    step_ids = _replay_step_ids(len(source_steps))
+    for index, (source_step, rerun_selected) in enumerate(
+        zip(source_steps[:build_count], rerun_mask),
+        start=1,
+    ):
         if rerun_selected:
-            if index > len(rerun_run.steps):
-                raise ReplayConfigError(
-                    "Hybrid replay could not align rerun step at index "
-                    f"{index} (rerun run has {len(rerun_run.steps)} steps)."
-                )
-            rerun_step = rerun_run.steps[index - 1]
+            rerun_step = rerun_steps[index - 1]
             if rerun_step.type != source_step.type:
                 raise ReplayConfigError(
                     "Hybrid replay step type mismatch at index "
@@ -371,45 +451,90 @@ def _replay_steps_hybrid(*, source_run: Run, rerun_run: Run, policy: HybridRepla
                 )
             replay_input = rerun_step.input
             replay_output = rerun_step.output
-            metadata = dict(rerun_step.metadata)
-            metadata["rerun_step_id"] = rerun_step.id
-            metadata["rerun_from_run_id"] = rerun_run.id
-            rerun_count += 1
-
-        metadata["replay_strategy"] = "rerun" if rerun_selected else "stub"
-        metadata["source_step_id"] = source_step.id
-
-        replay_steps.append(
+            metadata = {
+                **rerun_step.metadata,
+                "rerun_step_id": rerun_step.id,
+                "rerun_from_run_id": rerun_run.id,
+                "replay_strategy": "rerun",
+                "source_step_id": source_step.id,
+            }
+        else:
+            replay_input = source_step.input
+            replay_output = source_step.output
+            metadata = {
+                **source_step.metadata,
+                "replay_strategy": "stub",
+                "source_step_id": source_step.id,
+            }
+
+        append(
             Step(
-                id=f"step-{index:06d}",
+                id=step_ids[index - 1],
                 type=source_step.type,
                 input=replay_input,
                 output=replay_output,
                 metadata=metadata,
-            ).with_hash()
+            )
         )
 
-    if rerun_count == 0:
+    if unaligned_index is not None:
         raise ReplayConfigError(
-            "Hybrid replay selectors matched zero source steps; "
-            "adjust rerun_step_types/rerun_step_ids."
+            "Hybrid replay could not align rerun step at index "
+            f"{unaligned_index} (rerun run has {len(rerun_steps)} steps)."
         )
 
+    _assign_step_hashes(replay_steps)
     return replay_steps
 
 
+def _assign_step_hashes(steps: list[Step]) -> None:
+    """Fill in `step.hash` for freshly built replay steps.
+
+    Hashing is pure-Python canonicalization, so threads only help when the
+    interpreter runs without a GIL; results are assigned in step order.
+    """
+    if len(steps) >= _PARALLEL_HASH_MIN_STEPS and not _gil_enabled():
+        workers = min(8, os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashes = list(executor.map(_compute_replay_step_hash, steps))
+            for step, step_hash in zip(steps, hashes):
+                step.hash = step_hash
+            return
+    for step in steps:
+        step.hash = _compute_replay_step_hash(step)
+
+
+def _compute_replay_step_hash(step: Step) -> str:
+    return compute_step_hash(step.type, step.input, step.output, step.metadata)
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+@lru_cache(maxsize=16)
+def _replay_step_ids(count: int) -> tuple[str, ...]:
+    # Replaying the same source repeatedly asks for the same count.
+    return tuple(["step-%06d" % index for index in range(1, count + 1)])
+
+
 def _normalize_selector_tuple(values: tuple[str, ...]) -> tuple[str, ...]:
     normalized = sorted({str(value).strip() for value in values if str(value).strip()})
     return tuple(normalized)
 
 
-def _source_fingerprint(run: Run) -> str:
-    return canonical_json(
-        {
-            "source_id": run.id,
-            "steps": [_stable_step_hash(step) for step in run.steps],
-        }
-    )
+def _source_fingerprint(run: Run, memo: dict[int, str] | None = None) -> str:
+    step_hashes = _stable_step_hashes(run.steps, {} if memo is None else memo)
+    return _run_fingerprint("source_id", run.id, step_hashes)
+
+
+@lru_cache(maxsize=128)
+def _run_fingerprint(id_key: str, run_id: str, step_hashes: tuple[str, ...]) -> str:
+    # Keyed on the step hashes themselves, so replaying many variants against
+    # one source encodes its fingerprint once.
+    return canonical_json({id_key: run_id, "steps": list(step_hashes)})
 
 
 def _deterministic_stub_replay_id(source_run: Run, config: ReplayConfig) -> str:
@@ -432,12 +557,14 @@ def _deterministic_hybrid_replay_id(
     replay_steps: list[Step],
     policy: HybridReplayPolicy,
 ) -> str:
-    source_fingerprint = _source_fingerprint(source_run)
-    rerun_fingerprint = canonical_json(
-        {
-            "rerun_run_id": rerun_run.id,
-            "steps": [_stable_step_hash(step) for step in rerun_run.steps],
-        }
+    # Source and rerun runs often share Step objects (or are the same run), so
+    # unhashed steps are hashed once across both fingerprints.
+    memo: dict[int, str] = {}
+    source_fingerprint = _source_fingerprint(source_run, memo)
+    rerun_fingerprint = _run_fingerprint(
+        "rerun_run_id",
+        rerun_run.id,
+        _stable_step_hashes(rerun_run.steps, memo),
     )
     payload = {
         "mode": "hybrid",
@@ -453,10 +580,25 @@ def _deterministic_hybrid_replay_id(
 
 
 def _deterministic_digest(payload: dict[str, object]) -> str:
-    import hashlib
-
-    return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()[:12]
-
-
-def _stable_step_hash(step: Step) -> str:
-    return step.hash or step.with_hash().hash or ""
+    # A 48-bit fingerprint for replay ids, not an auth tag. It stays SHA-256
+    # because replay ids are pinned in ci/expected_hash_parity.json.
+    return sha256(canonical_json(payload).encode("utf-8")).hexdigest()[:12]
+
+
+def _stable_step_hashes(steps: list[Step], memo: dict[int, str]) -> tuple[str, ...]:
+    """Stored step hashes, computing missing ones once per `memo`.
+
+    `memo` is keyed by `id(step)` and must not outlive the steps it covers;
+    callers scope it to a single replay id computation.
+    """
+    hashes: list[str] = []
+    for step in steps:
+        if step.hash:
+            hashes.append(step.hash)
+            continue
+        step_hash = memo.get(id(step))
+        if step_hash is None:
+            step_hash = _compute_replay_step_hash(step)
+            memo[id(step)] = step_hash
+        hashes.append(step_hash)
+    return tuple(hashes)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
 from replaypack.artifact import read_artifact, write_artifact
+from replaypack.core.models import Run
 from replaypack.diff import AssertionResult, assert_runs
 
 SnapshotAction = Literal["update", "assert"]
@@ -109,6 +112,63 @@ def assert_snapshot_artifact(
     max_changes_per_step: int = 32,
 ) -> SnapshotWorkflowResult:
     """Assert candidate artifact against snapshot baseline artifact."""
+    return _assert_snapshot(
+        snapshot_name=snapshot_name,
+        candidate_path=candidate_path,
+        snapshots_dir=snapshots_dir,
+        strict=strict,
+        max_changes_per_step=max_changes_per_step,
+        read_pair=_read_artifact_pair,
+    )
+
+
+def assert_snapshot_artifacts_batch(
+    jobs: Sequence[Mapping[str, Any]],
+) -> list[SnapshotWorkflowResult]:
+    """Assert several snapshots in order, prefetching the next job's artifacts.
+
+    Each job holds `assert_snapshot_artifact` keyword arguments. While one job
+    is compared, the baseline and candidate of the next job are read in the
+    background; at most one job is read ahead.
+    """
+    results: list[SnapshotWorkflowResult] = []
+    if not jobs:
+        return results
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pending = _prefetch_snapshot_job(executor, jobs[0])
+        for position, job in enumerate(jobs):
+            prefetched = pending
+            pending = (
+                _prefetch_snapshot_job(executor, jobs[position + 1])
+                if position + 1 < len(jobs)
+                else None
+            )
+            read_pair = (
+                _read_artifact_pair if prefetched is None else _prefetched_reader(*prefetched)
+            )
+            results.append(
+                _assert_snapshot(
+                    snapshot_name=job["snapshot_name"],
+                    candidate_path=job["candidate_path"],
+                    snapshots_dir=job.get("snapshots_dir", "snapshots"),
+                    strict=job.get("strict", False),
+                    max_changes_per_step=job.get("max_changes_per_step", 32),
+                    read_pair=read_pair,
+                )
+            )
+    return results
+
+
+def _assert_snapshot(
+    *,
+    snapshot_name: str,
+    candidate_path: str | Path,
+    snapshots_dir: str | Path,
+    strict: bool,
+    max_changes_per_step: int,
+    read_pair: Callable[[Path, str | Path], tuple[Run, Run]],
+) -> SnapshotWorkflowResult:
     baseline_path = resolve_snapshot_baseline_path(snapshot_name, snapshots_dir)
     if not baseline_path.exists():
         return SnapshotWorkflowResult(
@@ -122,8 +182,7 @@ def assert_snapshot_artifact(
             message="snapshot baseline missing; run with --update to create it",
         )
 
-    baseline_run = read_artifact(baseline_path)
-    candidate_run = read_artifact(candidate_path)
+    baseline_run, candidate_run = read_pair(baseline_path, candidate_path)
     result = assert_runs(
         baseline_run,
         candidate_run,
@@ -143,3 +202,38 @@ def assert_snapshot_artifact(
         assertion=result,
         message="snapshot assertion passed" if result.passed else "snapshot assertion failed",
     )
+
+
+def _prefetch_snapshot_job(
+    executor: ThreadPoolExecutor,
+    job: Mapping[str, Any],
+) -> tuple[Future[Run], Future[Run]] | None:
+    # Invalid names and missing baselines are reported when the job's turn
+    # comes, in order, so they are simply not prefetched.
+    try:
+        baseline_path = resolve_snapshot_baseline_path(
+            job["snapshot_name"],
+            job.get("snapshots_dir", "snapshots"),
+        )
+    except SnapshotConfigError:
+        return None
+    if not baseline_path.exists():
+        return None
+    return (
+        executor.submit(read_artifact, baseline_path),
+        executor.submit(read_artifact, job["candidate_path"]),
+    )
+
+
+def _prefetched_reader(
+    baseline_future: Future[Run],
+    candidate_future: Future[Run],
+) -> Callable[[Path, str | Path], tuple[Run, Run]]:
+    def read_pair(_baseline_path: Path, _candidate_path: str | Path) -> tuple[Run, Run]:
+        return baseline_future.result(), candidate_future.result()
+
+    return read_pair
+
+
+def _read_artifact_pair(baseline_path: str | Path, candidate_path: str | Path) -> tuple[Run, Run]:
+    return read_artifact(baseline_path), read_artifact(candidate_path)
@@ -18,6 +18,32 @@ class _PlanStep:
     required: bool = True
 
 
+@dataclass(slots=True)
+class _OpRecord:
+    step_id: str
+    description: str
+    required: bool
+    apply: list[str]
+    rollback: list[str]
+    executed: bool
+    returncode: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "step_id": self.step_id,
+            "description": self.description,
+            "required": self.required,
+            "apply": self.apply,
+            "rollback": self.rollback,
+            "executed": self.executed,
+            "returncode": self.returncode,
+            "stdout": self.stdout,
+            "stderr": self.stderr,
+        }
+
+
 class TransparentControllerError(RuntimeError):
     """Raised when required transparent intercept operations fail."""
 
@@ -99,27 +125,24 @@ class TransparentMacOSController:
             listener_host=listener_host,
             listener_port=listener_port,
         )
-        operations: list[dict[str, Any]] = []
+        operations: list[_OpRecord] = []
         rollback_handles: list[dict[str, Any]] = []
         failures: list[dict[str, Any]] = []
 
         for step in plan:
-            operation: dict[str, Any] = {
-                "step_id": step.step_id,
-                "description": step.description,
-                "required": step.required,
-                "apply": list(step.apply),
-                "rollback": list(step.rollback),
-                "executed": self.execute,
-                "returncode": 0,
-                "stdout": "",
-                "stderr": "",
-            }
+            operation = _OpRecord(
+                step_id=step.step_id,
+                description=step.description,
+                required=step.required,
+                apply=list(step.apply),
+                rollback=list(step.rollback),
+                executed=self.execute,
+            )
             if self.execute:
                 completed = self.runner(list(step.apply))
-                operation["returncode"] = int(completed.returncode)
-                operation["stdout"] = completed.stdout or ""
-                operation["stderr"] = completed.stderr or ""
+                operation.returncode = int(completed.returncode)
+                operation.stdout = completed.stdout or ""
+                operation.stderr = completed.stderr or ""
             operations.append(operation)
             rollback_handles.append(
                 {
@@ -127,13 +150,13 @@ class TransparentMacOSController:
                     "command": list(step.rollback),
                 }
             )
-            if operation["returncode"] != 0 and step.required:
+            if operation.returncode != 0 and step.required:
                 failures.append(
                     {
                         "step_id": step.step_id,
                         "apply": list(step.apply),
-                        "returncode": operation["returncode"],
-                        "stderr": operation["stderr"],
+                        "returncode": operation.returncode,
+                        "stderr": operation.stderr,
                     }
                 )
 
@@ -148,7 +171,7 @@ class TransparentMacOSController:
             "listener_host": listener_host,
             "listener_port": listener_port,
             "operation_count": len(operations),
-            "operations": operations,
+            "operations": [operation.to_dict() for operation in operations],
             "rollback_handles": rollback_handles,
         }
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import gzip
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import os
 from pathlib import Path
 import subprocess
 import sys
@@ -14,10 +17,34 @@ import threading
 from typing import Any, Iterator
 from urllib.parse import parse_qs, quote, unquote, urlparse
 
-from replaypack.artifact import ArtifactError, read_artifact
-from replaypack.diff import diff_runs
+from replaypack.artifact import ArtifactError, artifact_journal_paths, read_artifact
+from replaypack.core.models import Run
+from replaypack.diff import RunDiffResult, diff_runs
+from replaypack.listener_control import (
+    DEFAULT_LISTENER_OUT_PATH,
+    listener_status,
+    start_listener,
+    stop_listener,
+)
 
 _SUPPORTED_SUFFIXES = {".rpk", ".bundle"}
+_SUPPORTED_SUFFIX_TUPLE = tuple(sorted(_SUPPORTED_SUFFIXES))
+# Bound once so each response skips json.dumps' per-call encoder construction.
+_JSON_RESPONSE_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True)
+# Diffs with more steps than this are streamed instead of buffered whole.
+_STREAM_DIFF_MIN_STEPS = 100
+_STREAM_WRITE_BYTES = 64 * 1024
+
+# Parsed artifacts and their diffs, keyed by (path, mtime_ns, size) of the file
+# and its steps journal so an edited or appended artifact is re-read. Stepping
+# through a diff in the UI then costs two stats per artifact instead of a full
+# parse. The server is threaded, hence the lock.
+_ArtifactKey = tuple[str, int, int, int, int]
+_RUN_CACHE: OrderedDict[_ArtifactKey, Run] = OrderedDict()
+_RUN_CACHE_MAX = 8
+_DIFF_CACHE: OrderedDict[tuple[_ArtifactKey, _ArtifactKey], RunDiffResult] = OrderedDict()
+_DIFF_CACHE_MAX = 8
+_CACHE_LOCK = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -28,6 +55,9 @@ class UIServerConfig:
     listener_recordings_dir: Path = Path("runs/passive/ui")
     listener_state_file: Path = Path("runs/passive/ui-listener-state.json")
     listener_out_file: Path = Path("runs/passive/ui-listener-capture.rpk")
+    # Drive the listener through `python -m replaypack listen` in a child
+    # process instead of calling replaypack.listener_control in-process.
+    use_subprocess_listener: bool = False
 
 
 def build_ui_url(
@@ -52,11 +82,15 @@ def list_local_artifacts(base_dir: Path) -> list[str]:
     candidates: list[Path] = []
     for relative_dir in ("runs", "examples/runs"):
         directory = (base_dir / relative_dir).resolve()
-        if not directory.exists() or not directory.is_dir():
+        # scandir answers is_file() from the directory listing itself, so only
+        # matching entries become Path objects and no per-child stat is made.
+        try:
+            with os.scandir(directory) as scanner:
+                for entry in scanner:
+                    if entry.name.endswith(_SUPPORTED_SUFFIX_TUPLE) and entry.is_file():
+                        candidates.append(Path(entry.path))
+        except OSError:
             continue
-        for child in directory.iterdir():
-            if child.is_file() and child.suffix in _SUPPORTED_SUFFIXES:
-                candidates.append(child)
 
     unique = sorted(set(candidates))
     output: list[str] = []
@@ -126,17 +160,18 @@ def _resolve_rename_paths(base_dir: Path, raw_path: str, new_name: str) -> tuple
 
 def _list_browser_entries(base_dir: Path, directory: Path) -> list[dict[str, Any]]:
     entries: list[dict[str, Any]] = []
-    children = sorted(
-        directory.iterdir(),
-        key=lambda item: (not item.is_dir(), item.name.lower()),
-    )
+    with os.scandir(directory) as scanner:
+        children = sorted(
+            scanner,
+            key=lambda item: (not item.is_dir(), item.name.lower()),
+        )
     for child in children:
-        display = _display_path(base_dir, child)
+        child_path = Path(child.path)
         entries.append(
             {
                 "name": child.name,
-                "path": display,
-                "absolute_path": str(child),
+                "path": _display_path(base_dir, child_path),
+                "absolute_path": child.path,
                 "is_dir": child.is_dir(),
                 "size_bytes": child.stat().st_size if child.is_file() else None,
             }
@@ -181,11 +216,49 @@ def _run_listener_cli(base_dir: Path, args: list[str]) -> tuple[int, dict[str, A
     return completed.returncode, payload
 
 
+def _run_listener_in_process(
+    base_dir: Path,
+    command: str,
+    state_path: Path,
+    out_path: Path | None = None,
+) -> tuple[int, dict[str, Any]]:
+    try:
+        if command == "start":
+            # Like the CLI subprocess, the daemon runs in base_dir.
+            return start_listener(
+                state_path,
+                out=out_path or DEFAULT_LISTENER_OUT_PATH,
+                cwd=base_dir,
+            )
+        if command == "stop":
+            return stop_listener(state_path)
+        return listener_status(state_path)
+    except Exception as error:  # pragma: no cover - mirrors a crashed CLI child
+        return 1, {
+            "status": "error",
+            "exit_code": 1,
+            "message": f"listener {command} failed: {error}",
+        }
+
+
 def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
     base_dir = config.base_dir.resolve()
     default_listener_state_path = _resolve_runtime_path(base_dir, config.listener_state_file)
     default_listener_out_path = _resolve_runtime_path(base_dir, config.listener_out_file)
     default_recordings_dir = _resolve_runtime_path(base_dir, config.listener_recordings_dir)
+    use_subprocess_listener = config.use_subprocess_listener
+
+    def run_listener(
+        command: str,
+        state_path: Path,
+        out_path: Path | None = None,
+    ) -> tuple[int, dict[str, Any]]:
+        if not use_subprocess_listener:
+            return _run_listener_in_process(base_dir, command, state_path, out_path)
+        args = [command, "--state-file", str(state_path)]
+        if out_path is not None:
+            args.extend(["--out", str(out_path)])
+        return _run_listener_cli(base_dir, args)
 
     class Handler(BaseHTTPRequestHandler):
         def do_GET(self) -> None:  # noqa: N802
@@ -194,7 +267,7 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             query = parse_qs(parsed.query)
 
             if route == "/":
-                self._write_html(_render_index_html())
+                self._write_index_html()
                 return
 
             if route == "/api/files":
@@ -256,9 +329,9 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             try:
                 left_path = _resolve_artifact_path(base_dir, left_raw)
                 right_path = _resolve_artifact_path(base_dir, right_raw)
-                left_run = read_artifact(left_path)
-                right_run = read_artifact(right_path)
-                diff = diff_runs(left_run, right_run)
+                left_key, left_run = _cached_read_artifact(left_path)
+                right_key, right_run = _cached_read_artifact(right_path)
+                diff = _cached_diff_runs(left_key, left_run, right_key, right_run)
             except (FileNotFoundError, ArtifactError, ValueError) as error:
                 self._write_json(400, {"error": str(error)})
                 return
@@ -266,6 +339,9 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             payload = diff.to_dict()
             payload["left_path"] = _display_path(base_dir, left_path)
             payload["right_path"] = _display_path(base_dir, right_path)
+            if len(diff.step_diffs) > _STREAM_DIFF_MIN_STEPS:
+                self._write_json_stream(200, payload)
+                return
             self._write_json(200, payload)
 
         def _handle_step(self, query: dict[str, list[str]]) -> None:
@@ -291,8 +367,8 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
                 index = _parse_step_index(index_raw)
                 left_path = _resolve_artifact_path(base_dir, left_raw)
                 right_path = _resolve_artifact_path(base_dir, right_raw)
-                left_run = read_artifact(left_path)
-                right_run = read_artifact(right_path)
+                _, left_run = _cached_read_artifact(left_path)
+                _, right_run = _cached_read_artifact(right_path)
                 payload = {
                     "index": index,
                     "left_path": _display_path(base_dir, left_path),
@@ -330,14 +406,7 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             )
             listener_out_path = default_listener_out_path
             listener_recordings_dir = default_recordings_dir
-            code, payload = _run_listener_cli(
-                base_dir,
-                [
-                    "status",
-                    "--state-file",
-                    str(listener_state_path),
-                ],
-            )
+            code, payload = run_listener("status", listener_state_path)
             payload["ui_listener_state_file"] = _display_path(base_dir, listener_state_path)
             payload["ui_listener_out_file"] = _display_path(base_dir, listener_out_path)
             payload["ui_listener_recordings_dir"] = _display_path(base_dir, listener_recordings_dir)
@@ -367,16 +436,7 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             listener_state_path.parent.mkdir(parents=True, exist_ok=True)
             listener_recordings_dir.mkdir(parents=True, exist_ok=True)
             listener_out_path.parent.mkdir(parents=True, exist_ok=True)
-            code, payload = _run_listener_cli(
-                base_dir,
-                [
-                    "start",
-                    "--state-file",
-                    str(listener_state_path),
-                    "--out",
-                    str(listener_out_path),
-                ],
-            )
+            code, payload = run_listener("start", listener_state_path, listener_out_path)
             payload["ui_listener_state_file"] = _display_path(base_dir, listener_state_path)
             payload["ui_listener_out_file"] = _display_path(base_dir, listener_out_path)
             payload["ui_listener_recordings_dir"] = _display_path(base_dir, listener_recordings_dir)
@@ -392,14 +452,7 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             )
             listener_out_path = default_listener_out_path
             listener_recordings_dir = default_recordings_dir
-            code, payload = _run_listener_cli(
-                base_dir,
-                [
-                    "stop",
-                    "--state-file",
-                    str(listener_state_path),
-                ],
-            )
+            code, payload = run_listener("stop", listener_state_path)
             payload["ui_listener_state_file"] = _display_path(base_dir, listener_state_path)
             payload["ui_listener_out_file"] = _display_path(base_dir, listener_out_path)
             payload["ui_listener_recordings_dir"] = _display_path(base_dir, listener_recordings_dir)
@@ -446,25 +499,30 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             if not payload:
                 return {}
             try:
-                data = json.loads(payload.decode("utf-8"))
+                data = json.loads(payload)
             except (UnicodeDecodeError, json.JSONDecodeError):
                 return {}
             if not isinstance(data, dict):
                 return {}
             return data
 
-        def _write_html(self, html: str) -> None:
-            body = html.encode("utf-8")
+        def _write_index_html(self) -> None:
+            accept_encoding = self.headers.get("Accept-Encoding", "")
             self.send_response(200)
             self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Cache-Control", "public, max-age=60")
+            self.send_header("Vary", "Accept-Encoding")
+            if _accepts_gzip(accept_encoding):
+                body = _INDEX_HTML_GZIP
+                self.send_header("Content-Encoding", "gzip")
+            else:
+                body = _INDEX_HTML_BYTES
             self.send_header("Content-Length", str(len(body)))
             self.end_headers()
             self.wfile.write(body)
 
         def _write_json(self, status_code: int, payload: dict) -> None:
-            body = (
-                json.dumps(payload, ensure_ascii=True, sort_keys=True).encode("utf-8")
-            )
+            body = _JSON_RESPONSE_ENCODER.encode(payload).encode("ascii")
             self.send_response(status_code)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Cache-Control", "no-store")
@@ -472,6 +530,32 @@ def create_ui_server(config: UIServerConfig) -> ThreadingHTTPServer:
             self.end_headers()
             self.wfile.write(body)
 
+        def _write_json_stream(self, status_code: int, payload: dict) -> None:
+            """Write `payload` as it is encoded, ending the body by closing.
+
+            The server speaks HTTP/1.0, so the body is delimited by connection
+            close rather than chunked framing, and no Content-Length is needed.
+            """
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            write = self.wfile.write
+            pending: list[str] = []
+            pending_size = 0
+            for piece in _JSON_RESPONSE_ENCODER.iterencode(payload):
+                pending.append(piece)
+                pending_size += len(piece)
+                if pending_size >= _STREAM_WRITE_BYTES:
+                    write("".join(pending).encode("ascii"))
+                    pending.clear()
+                    pending_size = 0
+            if pending:
+                write("".join(pending).encode("ascii"))
+
         def log_message(self, _format: str, *_args: object) -> None:
             return
 
@@ -507,6 +591,70 @@ def _resolve_artifact_path(base_dir: Path, raw_path: str) -> Path:
     return candidate
 
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honoring `q=0`."""
+    wildcard_q: float | None = None
+    for token in accept_encoding.split(","):
+        coding, *params = token.split(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        if coding in {"gzip", "x-gzip"}:
+            return q > 0
+        if coding == "*":
+            wildcard_q = q
+    return wildcard_q is not None and wildcard_q > 0
+
+
+def _cached_read_artifact(path: Path) -> tuple[_ArtifactKey, Run]:
+    stat = path.stat()
+    _, steps_path = artifact_journal_paths(path)
+    try:
+        journal_stat = steps_path.stat()
+    except FileNotFoundError:
+        journal_key = (-1, -1)
+    else:
+        journal_key = (journal_stat.st_mtime_ns, journal_stat.st_size)
+    key = (str(path), stat.st_mtime_ns, stat.st_size, *journal_key)
+    with _CACHE_LOCK:
+        run = _RUN_CACHE.get(key)
+        if run is not None:
+            _RUN_CACHE.move_to_end(key)
+            return key, run
+    run = read_artifact(path)
+    with _CACHE_LOCK:
+        _RUN_CACHE[key] = run
+        if len(_RUN_CACHE) > _RUN_CACHE_MAX:
+            _RUN_CACHE.popitem(last=False)
+    return key, run
+
+
+def _cached_diff_runs(
+    left_key: _ArtifactKey,
+    left_run: Run,
+    right_key: _ArtifactKey,
+    right_run: Run,
+) -> RunDiffResult:
+    key = (left_key, right_key)
+    with _CACHE_LOCK:
+        diff = _DIFF_CACHE.get(key)
+        if diff is not None:
+            _DIFF_CACHE.move_to_end(key)
+            return diff
+    diff = diff_runs(left_run, right_run)
+    with _CACHE_LOCK:
+        _DIFF_CACHE[key] = diff
+        if len(_DIFF_CACHE) > _DIFF_CACHE_MAX:
+            _DIFF_CACHE.popitem(last=False)
+    return diff
+
+
 def _display_path(base_dir: Path, path: Path) -> str:
     try:
         return str(path.relative_to(base_dir))
@@ -2001,3 +2149,8 @@ def _render_index_html() -> str:
 </body>
 </html>
 """
+
+
+# The index page is constant, so it is encoded and compressed once at import.
+_INDEX_HTML_BYTES = _render_index_html().encode("utf-8")
+_INDEX_HTML_GZIP = gzip.compress(_INDEX_HTML_BYTES, compresslevel=6, mtime=0)
@@ -6,12 +6,16 @@ import pytest
 from replaypack.artifact import (
     ArtifactChecksumError,
     ArtifactValidationError,
+    append_artifact_steps,
+    artifact_journal_paths,
     build_artifact_envelope,
     compute_artifact_checksum,
     read_artifact,
     read_artifact_envelope,
+    read_artifact_journal,
     validate_artifact,
     write_artifact,
+    write_artifact_journal_header,
 )
 from replaypack.core.canonical import canonicalize
 from replaypack.core.models import Run, Step
@@ -188,6 +192,78 @@ def test_replay_fixture_is_valid() -> None:
     assert len(run.steps) == 6
 
 
+def test_journal_appends_only_new_steps_and_round_trips(
+    sample_run: Run, tmp_path: Path
+) -> None:
+    artifact_path = tmp_path / "journal.rpk"
+    header_run = Run(
+        id=sample_run.id,
+        timestamp=sample_run.timestamp,
+        environment_fingerprint=dict(sample_run.environment_fingerprint),
+        runtime_versions=dict(sample_run.runtime_versions),
+        steps=[],
+    )
+
+    write_artifact_journal_header(header_run, artifact_path)
+    assert append_artifact_steps(artifact_path, sample_run.steps[:1]) == 1
+    assert append_artifact_steps(artifact_path, sample_run.steps[1:]) == 1
+    assert append_artifact_steps(artifact_path, []) == 0
+
+    _, steps_path = artifact_journal_paths(artifact_path)
+    assert len(steps_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    loaded = read_artifact_journal(artifact_path)
+    expected_run = sample_run.with_hashed_steps()
+    assert "cwd" not in loaded.environment_fingerprint
+    assert [step.to_dict() for step in loaded.steps] == [
+        step.to_dict() for step in expected_run.steps
+    ]
+
+
+def test_journal_read_ignores_torn_trailing_line(sample_run: Run, tmp_path: Path) -> None:
+    artifact_path = tmp_path / "journal-torn.rpk"
+    write_artifact_journal_header(sample_run, artifact_path)
+    append_artifact_steps(artifact_path, sample_run.steps[:1])
+    _, steps_path = artifact_journal_paths(artifact_path)
+    with steps_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": "step-002", "ty')
+
+    loaded = read_artifact_journal(artifact_path)
+    assert [step.id for step in loaded.steps] == ["step-001"]
+
+
+def test_read_artifact_recovers_steps_left_in_journal(
+    sample_run: Run, tmp_path: Path
+) -> None:
+    artifact_path = tmp_path / "uncompacted.rpk"
+    segment_start = Run(
+        id=sample_run.id,
+        timestamp=sample_run.timestamp,
+        environment_fingerprint=dict(sample_run.environment_fingerprint),
+        runtime_versions=dict(sample_run.runtime_versions),
+        steps=[],
+    )
+    metadata = {"mode": "listener.passive"}
+    write_artifact(segment_start, artifact_path, metadata=metadata)
+    write_artifact_journal_header(segment_start, artifact_path, metadata=metadata)
+    append_artifact_steps(artifact_path, sample_run.steps)
+
+    loaded = read_artifact(artifact_path)
+    assert [step.id for step in loaded.steps] == ["step-001", "step-002"]
+
+
+def test_read_artifact_ignores_journal_for_non_listener_artifacts(
+    sample_run: Run, tmp_path: Path
+) -> None:
+    artifact_path = tmp_path / "plain.rpk"
+    write_artifact(sample_run, artifact_path)
+    write_artifact_journal_header(sample_run, artifact_path)
+    append_artifact_steps(artifact_path, sample_run.steps + sample_run.steps)
+
+    loaded = read_artifact(artifact_path)
+    assert [step.id for step in loaded.steps] == ["step-001", "step-002"]
+
+
 def test_diff_fixture_is_valid() -> None:
     fixture_path = Path("examples/runs/m4_diverged_from_m2.rpk")
     run = read_artifact(fixture_path)
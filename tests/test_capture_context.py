@@ -205,3 +205,59 @@ def test_shared_context_records_monotonic_ids_under_threads() -> None:
     ]
     assert sum(step.type == "tool.request" for step in run.steps) == workers * iterations
     assert sum(step.type == "tool.response" for step in run.steps) == workers * iterations
+
+
+def test_record_steps_matches_record_step_and_dispatches_one_batch() -> None:
+    from replaypack.plugins import LifecyclePlugin, PluginManager
+
+    class _StepRecorder(LifecyclePlugin):
+        name = "step-recorder"
+
+        def __init__(self) -> None:
+            self.step_ids: list[str] = []
+
+        def on_capture_step(self, event) -> None:
+            self.step_ids.append(event.step_id)
+
+    recorder = _StepRecorder()
+    specs = [
+        {
+            "step_type": "model.request",
+            "input_payload": {"api_key": "key-123", "prompt": "hi"},
+            "output_payload": {"status": "sent"},
+            "metadata": {"boundary": "model"},
+        },
+        {
+            "step_type": "model.response",
+            "input_payload": {"prompt": "hi"},
+            "output_payload": {"output": "hello"},
+        },
+    ]
+
+    with capture_run(
+        run_id="run-batch-001",
+        timestamp="2026-02-21T16:00:00Z",
+        plugin_manager=PluginManager(plugins=(recorder,)),
+    ) as batch_context:
+        batch_steps = batch_context.record_steps(specs)
+
+    with capture_run(
+        run_id="run-single-001",
+        timestamp="2026-02-21T16:00:00Z",
+        plugin_manager=PluginManager(),
+    ) as single_context:
+        single_steps = [
+            single_context.record_step(
+                spec["step_type"],
+                input_payload=spec["input_payload"],
+                output_payload=spec["output_payload"],
+                metadata=spec.get("metadata"),
+            )
+            for spec in specs
+        ]
+
+    assert [step.to_dict() for step in batch_steps] == [
+        step.to_dict() for step in single_steps
+    ]
+    assert batch_steps[0].input["api_key"] == "[REDACTED]"
+    assert recorder.step_ids == ["step-000001", "step-000002"]
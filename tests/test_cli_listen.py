@@ -17,6 +17,8 @@ def test_cli_listen_start_status_stop_cycle_json(tmp_path: Path) -> None:
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -140,6 +142,8 @@ def test_cli_listen_start_cleans_stale_pid_state(tmp_path: Path) -> None:
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -179,6 +183,8 @@ def test_cli_listen_start_rejects_port_conflict(tmp_path: Path) -> None:
             [
                 "listen",
                 "start",
+                "--out",
+                str(tmp_path / "listener-capture.rpk"),
                 "--host",
                 "127.0.0.1",
                 "--port",
@@ -225,6 +231,8 @@ def test_cli_listen_start_with_fail_on_synthetic_exposes_policy(tmp_path: Path)
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--fail-on-synthetic",
@@ -277,6 +285,8 @@ def test_cli_listen_start_with_best_effort_policy_exposes_runtime_controls(tmp_p
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--fallback-policy",
@@ -338,6 +348,8 @@ def test_cli_listen_start_with_full_payload_capture_exposes_policy(tmp_path: Pat
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--full-payload-capture",
@@ -386,6 +398,8 @@ def test_cli_listen_start_exposes_rotation_and_retention_controls(tmp_path: Path
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--rotation-max-steps",
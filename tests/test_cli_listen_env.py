@@ -15,6 +15,8 @@ def test_cli_listen_env_outputs_bash_exports(tmp_path: Path) -> None:
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -59,6 +61,8 @@ def test_cli_listen_env_bash_output_is_deterministic_and_copy_safe(tmp_path: Pat
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -131,6 +135,8 @@ def test_cli_listen_env_json_and_powershell_modes(tmp_path: Path) -> None:
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -194,6 +200,8 @@ def test_cli_listen_env_powershell_output_is_deterministic(tmp_path: Path) -> No
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
@@ -487,12 +487,18 @@ def test_cli_llm_capture_streaming_records_chunks_and_assembled_text(
     tmp_path: Path,
     monkeypatch,
 ) -> None:
+    issued: list[_MockStreamResponse] = []
+
     class _MockStreamResponse:
         status_code = 200
+        closed = False
 
         def raise_for_status(self) -> None:
             return None
 
+        def close(self) -> None:
+            self.closed = True
+
         def iter_lines(self):
             lines = [f"data: {json.dumps(chunk)}".encode("utf-8") for chunk in chunks]
             lines.append(b"data: [DONE]")
@@ -519,7 +525,9 @@ def test_cli_llm_capture_streaming_records_chunks_and_assembled_text(
             assert headers["x-api-key"] == "test-stream-key"
         else:
             assert headers["x-goog-api-key"] == "test-stream-key"
-        return _MockStreamResponse()
+        response = _MockStreamResponse()
+        issued.append(response)
+        return response
 
     monkeypatch.setattr(requests, "post", _mock_post)
     out_path = tmp_path / f"llm-{provider}-stream.rpk"
@@ -552,3 +560,65 @@ def test_cli_llm_capture_streaming_records_chunks_and_assembled_text(
     assert stream_payload["stream"] is True
     assert stream_payload["assembled_text"] == expected_text
     assert len(stream_payload["chunks"]) == 2
+    assert [response.closed for response in issued] == [True]
+
+
+@pytest.mark.parametrize("line_end", ["\n", "\r\n", "\r"])
+def test_cli_llm_capture_streaming_scans_raw_bytes_split_mid_line(
+    line_end: str,
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    chunks = [
+        {"choices": [{"delta": {"content": "Hel"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+    ]
+
+    class _MockByteStreamResponse:
+        status_code = 200
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def close(self) -> None:
+            return None
+
+        def iter_content(self, chunk_size: int = 1, decode_unicode: bool = False):
+            assert decode_unicode is False
+            body = "".join(
+                f"data: {json.dumps(chunk)}{line_end}{line_end}" for chunk in chunks
+            )
+            body += f"data: [DONE]{line_end}{line_end}data: {json.dumps(chunks[0])}"
+            encoded = body.encode("utf-8")
+            # Split mid-line so buffered scanning across reads is exercised.
+            return [encoded[index : index + 7] for index in range(0, len(encoded), 7)]
+
+    def _mock_post(url: str, **_kwargs: object) -> _MockByteStreamResponse:
+        return _MockByteStreamResponse()
+
+    monkeypatch.setattr(requests, "post", _mock_post)
+    out_path = tmp_path / "llm-openai-byte-stream.rpk"
+    result = CliRunner().invoke(
+        app,
+        [
+            "llm",
+            "capture",
+            "--provider",
+            "openai",
+            "--model",
+            "gpt-4o-mini",
+            "--prompt",
+            "say hello",
+            "--stream",
+            "--api-key",
+            "test-stream-key",
+            "--out",
+            str(out_path),
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    stream_payload = read_artifact(out_path).steps[1].output["output"]
+    assert stream_payload["assembled_text"] == "Hello"
+    assert len(stream_payload["chunks"]) == 2
@@ -27,6 +27,8 @@ def test_listener_start_stop_stress_cycles_leave_no_stale_state(tmp_path: Path)
             [
                 "listen",
                 "start",
+                "--out",
+                str(tmp_path / "listener-capture.rpk"),
                 "--state-file",
                 str(state_file),
                 "--json",
@@ -72,6 +74,8 @@ def test_listener_releases_explicit_port_after_stop(tmp_path: Path) -> None:
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--host",
@@ -113,6 +117,8 @@ def test_listen_env_command_does_not_mutate_process_environment(tmp_path: Path)
         [
             "listen",
             "start",
+            "--out",
+            str(tmp_path / "listener-capture.rpk"),
             "--state-file",
             str(state_file),
             "--json",
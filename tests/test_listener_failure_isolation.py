@@ -1,11 +1,17 @@
 import json
+import os
 from pathlib import Path
+import signal
+import time
 
+import pytest
 import requests
 from typer.testing import CliRunner
 
 from replaypack.artifact import read_artifact
 from replaypack.cli.app import app
+from replaypack.listener_control import start_listener, stop_listener
+from replaypack.listener_state import is_pid_running
 
 
 def test_listener_provider_capture_failure_serves_degraded_fallback(tmp_path: Path) -> None:
@@ -168,3 +174,31 @@ def test_listener_agent_malformed_frames_increment_dropped_metrics(tmp_path: Pat
             ],
         )
         assert stop_result.exit_code == 0, stop_result.output
+
+
+@pytest.mark.skipif(os.name == "nt", reason="SIGKILL is POSIX-only")
+def test_listener_artifact_keeps_steps_after_daemon_is_killed(tmp_path: Path) -> None:
+    state_file = tmp_path / "listener-state.json"
+    out_path = tmp_path / "listener-killed.rpk"
+    code, started = start_listener(state_file, out=out_path)
+    assert code == 0, started
+    base_url = f"http://{started['host']}:{started['port']}"
+
+    try:
+        response = requests.post(
+            f"{base_url}/v1/chat/completions",
+            json={"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "hi"}]},
+            timeout=2.0,
+        )
+        assert response.status_code == 200
+    finally:
+        os.kill(started["pid"], signal.SIGKILL)
+        deadline = time.time() + 5.0
+        while is_pid_running(started["pid"]) and time.time() < deadline:
+            time.sleep(0.05)
+        stop_listener(state_file)
+
+    run = read_artifact(out_path)
+    step_types = [step.type for step in run.steps]
+    assert "model.request" in step_types
+    assert "model.response" in step_types
@@ -12,7 +12,13 @@ import zstandard as zstd
 
 from replaypack.artifact import read_artifact
 from replaypack.cli.app import app
-from replaypack.listener_gateway import detect_provider
+from replaypack.listener_gateway import (
+    build_provider_response,
+    detect_provider,
+    normalize_provider_request,
+    normalize_provider_response,
+    sorted_json_object,
+)
 
 
 def _read_sse_events(response: requests.Response) -> list[dict[str, Any]]:
@@ -98,6 +104,109 @@ def test_listener_gateway_detect_provider_paths() -> None:
     assert detect_provider("/v1/unknown") is None
 
 
+def test_listener_gateway_extracts_text_and_tolerates_malformed_shapes() -> None:
+    def _text(provider: str, payload: dict[str, Any]) -> str:
+        return normalize_provider_response(
+            provider=provider,
+            status_code=200,
+            payload=payload,
+        ).assembled_text
+
+    assert _text("openai", {"choices": [{"message": {"content": "hi"}}]}) == "hi"
+    assert _text("openai", {"choices": []}) == ""
+    assert _text("openai", {"choices": [{"message": None}]}) == ""
+    assert _text("openai", {"choices": [{"message": {"content": 42}}]}) == ""
+    assert _text("anthropic", {"content": [{"text": "a"}, "junk", {"text": "b"}]}) == "ab"
+    assert _text("anthropic", {"content": None}) == ""
+    assert _text("google", {"candidates": [{"content": {"parts": [{"text": "g"}]}}]}) == "g"
+    assert _text("google", {"candidates": [{"content": "bad"}]}) == ""
+    assert _text("google", {}) == ""
+
+
+def test_listener_gateway_request_payload_is_sorted_copy_of_caller_payload() -> None:
+    sorted_branch = {"content": "hi", "role": "user"}
+    payload = {
+        "model": "gpt-4o-mini",
+        "messages": [sorted_branch],
+        "metadata": {"z": (1, 2), "a": {2: "two"}},
+    }
+
+    request = normalize_provider_request(
+        provider="openai",
+        path="/v1/chat/completions",
+        payload=payload,
+        headers={},
+        request_id="req-1",
+    )
+
+    assert list(request.payload) == ["messages", "metadata", "model"]
+    assert request.payload["metadata"] == {"a": {"2": "two"}, "z": [1, 2]}
+    assert list(request.payload["metadata"]) == ["a", "z"]
+    assert request.payload["messages"] == [sorted_branch]
+    assert request.payload["messages"] is not payload["messages"]
+    assert request.payload["messages"][0] is not sorted_branch
+
+
+def test_listener_gateway_synthetic_responses_do_not_share_nested_values() -> None:
+    request = normalize_provider_request(
+        provider="google",
+        path="/v1beta/models/gemini-1.5-flash:generateContent",
+        payload={"contents": []},
+        headers={},
+        request_id="req-1",
+    )
+
+    _, first, _ = build_provider_response(request=request, sequence=1)
+    first["candidates"][0]["content"]["parts"].append({"text": "mutated"})
+    _, second, _ = build_provider_response(request=request, sequence=2)
+
+    assert second["candidates"][0]["content"]["parts"] == [
+        {"text": "ReplayKit listener response"}
+    ]
+
+
+def test_listener_gateway_error_payload_is_copied_from_live_response() -> None:
+    live = {"error": {"message": "rate limited"}, "type": "error"}
+
+    normalized = normalize_provider_response(
+        provider="anthropic",
+        status_code=429,
+        payload=live,
+        already_canonical=True,
+    )
+    live["injected"] = True
+
+    assert normalized.error == {
+        "status_code": 429,
+        "payload": {"error": {"message": "rate limited"}, "type": "error"},
+    }
+
+
+def test_listener_gateway_sorted_json_hook_matches_canonical_normalization() -> None:
+    raw = '{"stream": false, "model": "gpt-4o-mini", "messages": [{"role": "user", "content": "x"}]}'
+    parsed = json.loads(raw, object_pairs_hook=sorted_json_object)
+
+    fast = normalize_provider_request(
+        provider="openai",
+        path="/v1/chat/completions",
+        payload=parsed,
+        headers={},
+        request_id="req-1",
+        already_canonical=True,
+    )
+    slow = normalize_provider_request(
+        provider="openai",
+        path="/v1/chat/completions",
+        payload=json.loads(raw),
+        headers={},
+        request_id="req-1",
+    )
+
+    assert fast.payload is parsed
+    assert fast == slow
+    assert list(fast.payload) == list(slow.payload)
+
+
 def test_listener_gateway_unsupported_route_diagnostics_include_remediation_hint(
     tmp_path: Path,
 ) -> None:
@@ -22,6 +22,17 @@ def test_summarize_run_timing_from_artifact_with_metadata() -> None:
     assert summary.missing_steps == 0
 
 
+def test_summarize_run_timing_skips_durations_too_large_for_nanoseconds() -> None:
+    run = read_artifact(Path("examples/runs/minimal_v1.rpk"))
+    run.steps[0].metadata["duration_ms"] = 1e305
+    run.steps[1].metadata["latency_ms"] = 2
+    summary = summarize_run_timing(run)
+
+    assert summary.total_duration_ms == 2
+    assert summary.measured_steps == 1
+    assert summary.missing_steps == 1
+
+
 def test_evaluate_slowdown_gate_within_and_exceeded() -> None:
     baseline = read_artifact(Path("examples/runs/minimal_v1.rpk"))
     candidate = read_artifact(Path("examples/runs/minimal_v1.rpk"))
@@ -72,6 +83,17 @@ def test_run_benchmark_suite_returns_representative_workloads() -> None:
     assert all(stats.mean_ms >= 0.0 for stats in suite.workloads.values())
 
 
+def test_run_benchmark_suite_parallel_mode_reports_same_workloads() -> None:
+    suite = run_benchmark_suite(
+        source_artifact=Path("examples/runs/m2_capture_boundaries.rpk"),
+        iterations=1,
+        sequential=False,
+    )
+
+    assert set(suite.workloads.keys()) == {"record", "replay", "diff"}
+    assert all(stats.iterations == 1 for stats in suite.workloads.values())
+
+
 def test_evaluate_benchmark_slowdown_gate() -> None:
     suite = run_benchmark_suite(
         source_artifact=Path("examples/runs/m2_capture_boundaries.rpk"),
@@ -110,6 +132,17 @@ def test_evaluate_benchmark_slowdown_gate() -> None:
     assert passed.gate_failed is False
     assert passed.status == "within_threshold"
 
+    short = evaluate_benchmark_slowdown_gate(
+        suite,
+        tiny_baseline,
+        threshold_percent=0.0,
+        short_circuit=True,
+    )
+    assert short.gate_failed is True
+    assert short.status == "threshold_exceeded"
+    assert len(short.failing_workloads) == 1
+    assert set(short.workload_slowdown_percent) == set(short.failing_workloads)
+
 
 def test_benchmark_gate_supports_nested_payload_shape() -> None:
     suite = run_benchmark_suite(
@@ -99,6 +99,54 @@ def test_plugin_failure_is_isolated_with_diagnostics() -> None:
     assert "boom-from-plugin" in diagnostic.message
 
 
+def test_repeated_plugin_failures_are_collapsed_into_counts() -> None:
+    class FlakyStepPlugin(LifecyclePlugin):
+        name = "flaky"
+
+        def on_capture_step(self, _event) -> None:
+            raise ValueError("bad step")
+
+    manager = PluginManager(plugins=(FlakyStepPlugin(),))
+
+    with pytest.warns(RuntimeWarning) as caught:
+        for _ in range(3):
+            manager.on_capture_step(object())
+
+    assert len(caught) == 1
+    assert len(manager.diagnostics) == 1
+    assert manager.diagnostic_summary() == {("flaky", "on_capture_step", "ValueError"): 3}
+
+    manager.clear_diagnostics()
+    assert manager.diagnostic_summary() == {}
+
+
+def test_plugin_failures_with_new_messages_or_after_eviction_are_reported() -> None:
+    class CountingPlugin(LifecyclePlugin):
+        name = "counting"
+
+        def on_capture_step(self, event) -> None:
+            raise ValueError(f"bad step {event}")
+
+    manager = PluginManager(plugins=(CountingPlugin(),), max_diagnostics=2)
+
+    with pytest.warns(RuntimeWarning) as caught:
+        for event in (1, 2, 1, 3, 1):
+            manager.on_capture_step(event)
+
+    # 1 and 2 warn; 1 repeats; 3 evicts 1, so the final 1 is reported again.
+    assert [str(warning.message).rsplit(": ", 1)[-1] for warning in caught] == [
+        "bad step 1",
+        "bad step 2",
+        "bad step 3",
+        "bad step 1",
+    ]
+    assert [diagnostic.message for diagnostic in manager.diagnostics] == [
+        "bad step 3",
+        "bad step 1",
+    ]
+    assert manager.diagnostic_summary() == {("counting", "on_capture_step", "ValueError"): 2}
+
+
 def test_load_plugin_manager_rejects_unsupported_config_version(tmp_path: Path) -> None:
     config_path = _write_plugin_config(
         tmp_path / "plugins-invalid.json",
@@ -131,3 +179,198 @@ def test_plugin_docs_include_compatibility_and_example() -> None:
     assert "compatibility rules" in text
     assert "breaking changes" in text
     assert "lifecycletraceplugin" in text
+
+
+def test_lifecycle_event_to_dict_matches_dataclass_fields() -> None:
+    from dataclasses import asdict
+
+    from replaypack.plugins.base import (
+        CaptureEndEvent,
+        CaptureStartEvent,
+        CaptureStepEvent,
+        DiffEndEvent,
+        DiffStartEvent,
+        ReplayEndEvent,
+        ReplayStartEvent,
+    )
+
+    events = [
+        CaptureStartEvent(run_id="run-1", timestamp="2026-02-22T00:00:00Z"),
+        CaptureStepEvent(
+            run_id="run-1",
+            step_id="step-000001",
+            step_type="model.request",
+            metadata={"boundary": "model"},
+        ),
+        CaptureEndEvent(run_id="run-1", step_count=1, status="ok"),
+        ReplayStartEvent(
+            mode="stub",
+            source_run_id="run-1",
+            rerun_from_run_id=None,
+            seed=7,
+            fixed_clock="2026-02-22T00:00:00Z",
+            source_step_count=1,
+        ),
+        ReplayEndEvent(mode="stub", source_run_id="run-1", rerun_from_run_id=None, status="ok"),
+        DiffStartEvent(
+            left_run_id="run-1",
+            right_run_id="run-2",
+            stop_at_first_divergence=True,
+            max_changes_per_step=8,
+            total_left_steps=1,
+            total_right_steps=1,
+        ),
+        DiffEndEvent(left_run_id="run-1", right_run_id="run-2", status="ok", summary={"changed": 1}),
+    ]
+
+    for event in events:
+        payload = event.to_dict()
+        assert payload == asdict(event)
+        assert list(payload) == list(asdict(event))
+
+    step_event = events[1]
+    step_event.to_dict()["metadata"]["boundary"] = "mutated"
+    assert step_event.metadata == {"boundary": "model"}
+
+
+def test_lifecycle_trace_plugin_buffers_until_end_hook(tmp_path: Path) -> None:
+    from replaypack.plugins import (
+        CaptureEndEvent,
+        CaptureStartEvent,
+        CaptureStepEvent,
+        LifecycleTracePlugin,
+    )
+
+    trace_path = tmp_path / "batched.ndjson"
+    plugin = LifecycleTracePlugin(output_path=str(trace_path), batch_size=100)
+
+    plugin.on_capture_start(CaptureStartEvent(run_id="run-1", timestamp="2026-02-22T00:00:00Z"))
+    plugin.on_capture_step(
+        CaptureStepEvent(
+            run_id="run-1",
+            step_id="step-000001",
+            step_type="model.request",
+            metadata={},
+        )
+    )
+    assert not trace_path.exists()
+
+    plugin.on_capture_end(CaptureEndEvent(run_id="run-1", step_count=1, status="ok"))
+    hooks = [json.loads(line)["hook"] for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert hooks == ["on_capture_start", "on_capture_step", "on_capture_end"]
+    plugin.close()
+
+
+def test_lifecycle_trace_plugin_writes_each_event_by_default(tmp_path: Path) -> None:
+    from replaypack.plugins import CaptureStartEvent, LifecycleTracePlugin
+
+    trace_path = tmp_path / "per-event.ndjson"
+    plugin = LifecycleTracePlugin(output_path=str(trace_path))
+
+    plugin.on_capture_start(CaptureStartEvent(run_id="run-1", timestamp="2026-02-22T00:00:00Z"))
+    hooks = [json.loads(line)["hook"] for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert hooks == ["on_capture_start"]
+    plugin.close()
+
+
+def test_load_plugin_manager_returns_fresh_manager_per_load(tmp_path: Path) -> None:
+    from replaypack.plugins import clear_plugin_config_cache
+
+    config_path = _write_plugin_config(
+        tmp_path / "plugins-cached.json",
+        output_path=tmp_path / "cached.ndjson",
+    )
+    first = load_plugin_manager_from_file(config_path)
+    second = load_plugin_manager_from_file(config_path)
+    assert second is not first
+    assert second.plugins[0] is not first.plugins[0]
+
+    _write_plugin_config(config_path, output_path=tmp_path / "changed.ndjson")
+    changed = load_plugin_manager_from_file(config_path)
+    assert str(changed.plugins[0].output_path).endswith("changed.ndjson")
+
+    clear_plugin_config_cache()
+    reloaded = load_plugin_manager_from_file(config_path)
+    assert reloaded.plugins[0].output_path == changed.plugins[0].output_path
+    for manager in (first, second, changed, reloaded):
+        for plugin in manager.plugins:
+            plugin.close()
+
+
+def test_on_capture_steps_dispatches_in_per_step_order() -> None:
+    calls: list[tuple[str, int]] = []
+
+    class _Recorder(LifecyclePlugin):
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def on_capture_step(self, event) -> None:
+            calls.append((self.name, event))
+
+    manager = PluginManager(plugins=(_Recorder("a"), _Recorder("b")))
+    manager.on_capture_steps([1, 2])
+
+    assert calls == [("a", 1), ("b", 1), ("a", 2), ("b", 2)]
+
+
+def test_load_plugin_manager_picks_up_patched_entrypoint_and_reports_given_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from replaypack.plugins import reference
+
+    config_path = _write_plugin_config(
+        tmp_path / "plugins-patched.json",
+        output_path=tmp_path / "patched.ndjson",
+    )
+    first = load_plugin_manager_from_file(config_path)
+    first.plugins[0].close()
+
+    class _PatchedTracePlugin(reference.LifecycleTracePlugin):
+        pass
+
+    monkeypatch.setattr(reference, "LifecycleTracePlugin", _PatchedTracePlugin)
+    patched = load_plugin_manager_from_file(config_path)
+    assert isinstance(patched.plugins[0], _PatchedTracePlugin)
+    patched.plugins[0].close()
+
+    bad_config = tmp_path / "plugins-bad.json"
+    bad_config.write_text("{not json", encoding="utf-8")
+    relative = Path(bad_config.name)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(PluginConfigError, match=r"\(plugins-bad\.json\)"):
+        load_plugin_manager_from_file(relative)
+
+
+def test_plugin_manager_rebuilds_hooks_when_plugins_are_reassigned() -> None:
+    class RecordingPlugin(LifecyclePlugin):
+        name = "recording"
+
+        def __init__(self) -> None:
+            self.events: list[object] = []
+
+        def on_diff_start(self, event) -> None:
+            self.events.append(event)
+
+    manager = PluginManager()
+    first = RecordingPlugin()
+    manager.plugins = [first]
+    assert manager.plugins == (first,)
+    manager.on_diff_start("event-1")
+
+    second = RecordingPlugin()
+    manager.plugins = (second,)
+    manager.on_diff_start("event-2")
+    assert first.events == ["event-1"]
+    assert second.events == ["event-2"]
+
+
+def test_non_callable_plugin_hook_is_reported_as_a_diagnostic() -> None:
+    class BrokenHookPlugin:
+        name = "broken"
+        on_diff_start = "not-callable"
+
+    manager = PluginManager(plugins=(BrokenHookPlugin(),))
+    with pytest.warns(RuntimeWarning, match="plugin=broken hook=on_diff_start"):
+        manager.on_diff_start("event")
+    assert [diagnostic.error_type for diagnostic in manager.diagnostics] == ["TypeError"]
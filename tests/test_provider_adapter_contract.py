@@ -36,3 +36,16 @@ def test_provider_adapter_contract_request_and_response_shape() -> None:
     assert response_payload["provider"] == "fake"
     assert response_payload["stream"] is False
     assert response_payload["response"]["id"] == "resp-1"
+
+
+def test_assemble_stream_capture_can_skip_collecting_chunks() -> None:
+    adapter = FakeProviderAdapter()
+    chunks = [
+        {"choices": [{"delta": {"content": "Hel"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+    ]
+
+    captured = assemble_stream_capture(adapter, chunks=iter(chunks), collect_chunks=False)
+
+    assert captured["chunks"] == []
+    assert captured["assembled_text"] == "Hello"
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+import subprocess
+import sys
 
 from replaypack.providers import (
     get_provider_adapter,
@@ -63,3 +65,21 @@ def test_provider_registry_plugin_hook_registers_entrypoint(
         reset_provider_adapter_registry()
         initialize_default_provider_adapters()
 
+
+
+def test_provider_package_imports_default_adapters_lazily() -> None:
+    script = (
+        "import sys\n"
+        "import replaypack.providers as providers\n"
+        "assert 'replaypack.providers.google' not in sys.modules\n"
+        "assert providers.get_provider_adapter('google').name == 'google'\n"
+        "assert 'replaypack.providers.openai' not in sys.modules\n"
+        "assert providers.OpenAIProviderAdapter.__name__ == 'OpenAIProviderAdapter'\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert completed.returncode == 0, completed.stderr
@@ -158,3 +158,65 @@ def test_diff_detects_hybrid_divergence_from_stub(tmp_path: Path) -> None:
     assert diff.identical is False
     assert diff.first_divergence is not None
     assert diff.first_divergence.left_type == "model.response"
+
+
+def test_replay_parallel_step_hashing_matches_serial(monkeypatch) -> None:
+    from replaypack.replay import engine
+
+    source = read_artifact(Path("examples/runs/m2_capture_boundaries.rpk"))
+    source.steps = source.steps * 50
+    serial = replay_stub_run(source)
+
+    monkeypatch.setattr(engine, "_gil_enabled", lambda: False)
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 4)
+    parallel = replay_stub_run(source)
+
+    assert len(parallel.steps) == 300
+    assert [step.hash for step in parallel.steps] == [step.hash for step in serial.steps]
+    assert parallel.id == serial.id
+
+
+def test_offline_network_guard_is_nestable_and_thread_scoped() -> None:
+    import socket
+    import threading
+
+    from replaypack.replay.engine import offline_network_guard
+
+    other_thread_errors: list[Exception] = []
+
+    def _connect_from_other_thread() -> None:
+        try:
+            socket.create_connection(("127.0.0.1", 9), timeout=0.01)
+        except RuntimeError as error:
+            other_thread_errors.append(error)
+        except OSError:
+            pass
+
+    with offline_network_guard():
+        with offline_network_guard():
+            pass
+        with pytest.raises(RuntimeError, match="offline replay forbids"):
+            socket.create_connection(("127.0.0.1", 9))
+        worker = threading.Thread(target=_connect_from_other_thread)
+        worker.start()
+        worker.join()
+
+    assert other_thread_errors == []
+
+
+def test_replay_config_can_skip_offline_guard(monkeypatch) -> None:
+    from replaypack.replay import engine
+
+    def _unexpected_guard():
+        raise AssertionError("offline guard should be skipped")
+
+    monkeypatch.setattr(engine, "offline_network_guard", _unexpected_guard)
+    source = read_artifact(Path("examples/runs/m2_capture_boundaries.rpk"))
+
+    guarded = ReplayConfig(seed=3)
+    unguarded = ReplayConfig(seed=3, enforce_offline=False)
+
+    assert guarded.enforce_offline is True
+    assert len(replay_stub_run(source, config=unguarded).steps) == len(source.steps)
+    with pytest.raises(AssertionError, match="offline guard should be skipped"):
+        replay_stub_run(source, config=guarded)
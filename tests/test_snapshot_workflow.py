@@ -6,6 +6,7 @@ from replaypack.artifact import read_artifact, write_artifact
 from replaypack.capture import build_demo_run
 from replaypack.snapshot import (
     assert_snapshot_artifact,
+    assert_snapshot_artifacts_batch,
     resolve_snapshot_baseline_path,
     update_snapshot_artifact,
 )
@@ -107,3 +108,32 @@ def test_snapshot_update_writes_readable_baseline(tmp_path: Path) -> None:
     )
     baseline_run = read_artifact(result.baseline_path)
     assert baseline_run.id == "run-demo-001"
+
+
+def test_snapshot_batch_assert_matches_single_assertions(tmp_path: Path) -> None:
+    snapshots_dir = tmp_path / "snapshots"
+    baseline_candidate = tmp_path / "baseline.rpk"
+    write_artifact(build_demo_run(), baseline_candidate)
+    update_snapshot_artifact(
+        snapshot_name="batch-flow",
+        candidate_path=baseline_candidate,
+        snapshots_dir=snapshots_dir,
+    )
+
+    changed = build_demo_run()
+    changed.steps[1].output = {"answer": "changed output"}
+    changed_path = tmp_path / "changed.rpk"
+    write_artifact(changed, changed_path)
+
+    jobs = [
+        {"snapshot_name": "batch-flow", "candidate_path": baseline_candidate, "snapshots_dir": snapshots_dir},
+        {"snapshot_name": "batch-flow", "candidate_path": changed_path, "snapshots_dir": snapshots_dir},
+        {"snapshot_name": "missing", "candidate_path": changed_path, "snapshots_dir": snapshots_dir},
+    ]
+
+    results = assert_snapshot_artifacts_batch(jobs)
+
+    assert [result.status for result in results] == ["pass", "fail", "error"]
+    assert [result.to_dict() for result in results] == [
+        assert_snapshot_artifact(**job).to_dict() for job in jobs
+    ]
@@ -1,9 +1,20 @@
+import gzip
 import json
 from pathlib import Path
+import subprocess
 from urllib.parse import quote
 from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
+import pytest
+
+import replaypack
+from replaypack.artifact import (
+    append_artifact_steps,
+    write_artifact,
+    write_artifact_journal_header,
+)
+from replaypack.core.models import Run, Step
 from replaypack.ui import UIServerConfig, start_ui_server
 
 
@@ -147,3 +158,168 @@ def test_ui_server_rename_artifact_success_and_validation_errors(tmp_path: Path)
         assert status_code == 400
         assert payload["status"] == "error"
         assert "Only .rpk and .bundle files" in payload["message"]
+
+
+def _write_long_run(path: Path, run_id: str, content: str, step_count: int) -> None:
+    steps = [
+        Step(
+            id=f"step-{index:03d}",
+            type="model.response",
+            input={"index": index},
+            output={"content": content if index == step_count else "same"},
+            metadata={},
+        )
+        for index in range(1, step_count + 1)
+    ]
+    run = Run(
+        id=run_id,
+        timestamp="2026-02-21T14:00:00Z",
+        environment_fingerprint={},
+        runtime_versions={},
+        steps=steps,
+    )
+    write_artifact(run, path)
+
+
+def test_ui_server_streams_large_diff_responses(tmp_path: Path) -> None:
+    _write_long_run(tmp_path / "left.rpk", "run-left", "before", 150)
+    _write_long_run(tmp_path / "right.rpk", "run-right", "after", 150)
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=tmp_path)
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        url = f"http://{host}:{port}/api/diff?left=left.rpk&right=right.rpk"
+        with urlopen(url, timeout=5) as response:  # noqa: S310
+            assert response.headers.get("Content-Length") is None
+            payload = json.loads(response.read().decode("utf-8"))
+
+    assert payload["total_left_steps"] == 150
+    assert payload["first_divergence"]["index"] == 150
+    assert payload["left_path"] == "left.rpk"
+
+
+def test_ui_server_rereads_artifacts_changed_between_requests(tmp_path: Path) -> None:
+    _write_long_run(tmp_path / "left.rpk", "run-left", "before", 3)
+    _write_long_run(tmp_path / "right.rpk", "run-right", "before", 3)
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=tmp_path)
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        url = f"http://{host}:{port}/api/diff?left=left.rpk&right=right.rpk"
+        assert _get_json(url)["first_divergence"] is None
+
+        _write_long_run(tmp_path / "right.rpk", "run-right", "rewritten", 3)
+        assert _get_json(url)["first_divergence"]["index"] == 3
+
+
+def test_ui_server_rereads_artifacts_when_journal_is_appended(tmp_path: Path) -> None:
+    run = Run(
+        id="run-journal",
+        timestamp="2026-02-21T14:00:00Z",
+        environment_fingerprint={},
+        runtime_versions={},
+        steps=[],
+    )
+    metadata = {"mode": "listener.passive"}
+    write_artifact(run, tmp_path / "live.rpk", metadata=metadata)
+    write_artifact_journal_header(run, tmp_path / "live.rpk", metadata=metadata)
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=tmp_path)
+
+    def _step(index: int) -> Step:
+        return Step(
+            id=f"step-{index:03d}",
+            type="model.response",
+            input={"index": index},
+            output={"content": "same"},
+            metadata={},
+        )
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        url = f"http://{host}:{port}/api/diff?left=live.rpk&right=live.rpk"
+        append_artifact_steps(tmp_path / "live.rpk", [_step(1)])
+        assert _get_json(url)["total_left_steps"] == 1
+
+        append_artifact_steps(tmp_path / "live.rpk", [_step(2)])
+        assert _get_json(url)["total_left_steps"] == 2
+
+
+def test_ui_server_serves_gzipped_index_when_accepted() -> None:
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=Path.cwd())
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        request = Request(  # noqa: S310 (local test server)
+            f"http://{host}:{port}/",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        with urlopen(request, timeout=5) as response:
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert response.headers["Cache-Control"] == "public, max-age=60"
+            html = gzip.decompress(response.read()).decode("utf-8")
+
+    assert "<h1>ReplayKit Local Diff UI</h1>" in html
+
+
+def test_ui_server_serves_plain_index_when_gzip_is_refused() -> None:
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=Path.cwd())
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        request = Request(  # noqa: S310 (local test server)
+            f"http://{host}:{port}/",
+            headers={"Accept-Encoding": "br, gzip;q=0"},
+        )
+        with urlopen(request, timeout=5) as response:
+            assert response.headers.get("Content-Encoding") is None
+            html = response.read().decode("utf-8")
+
+    assert "<h1>ReplayKit Local Diff UI</h1>" in html
+
+
+def test_ui_server_listener_endpoints_run_in_process(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fail_subprocess(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("listener endpoints should not spawn the CLI")
+
+    monkeypatch.setattr(subprocess, "run", _fail_subprocess)
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=tmp_path)
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        base_url = f"http://{host}:{port}"
+
+        status = _get_json(base_url + "/api/listener/status")
+        assert status["status"] == "ok"
+        assert status["running"] is False
+        assert status["ui_listener_state_file"] == "runs/passive/ui-listener-state.json"
+
+        code, stopped = _post_json(base_url + "/api/listener/stop", {})
+        assert code == 200
+        assert stopped["message"] == "listener already stopped"
+
+
+def test_ui_server_in_process_listener_runs_in_base_dir(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The daemon starts outside the checkout, so it must still find the package.
+    monkeypatch.setenv("PYTHONPATH", str(Path(replaypack.__file__).resolve().parents[1]))
+    config = UIServerConfig(host="127.0.0.1", port=0, base_dir=tmp_path)
+
+    with start_ui_server(config) as (server, _thread):
+        host, port = server.server_address
+        base_url = f"http://{host}:{port}"
+
+        code, started = _post_json(base_url + "/api/listener/start", {})
+        try:
+            assert code == 200, started
+            state = json.loads(
+                (tmp_path / "runs/passive/ui-listener-state.json").read_text(encoding="utf-8")
+            )
+            assert Path(state["process"]["cwd"]).resolve() == tmp_path.resolve()
+        finally:
+            stop_code, stopped = _post_json(base_url + "/api/listener/stop", {})
+            assert stop_code == 200, stopped